@@ -0,0 +1,310 @@
+"""Render and simulation benchmarks with regression checks against stored baselines.
+
+Usage (from the fighting_game directory):
+    python benchmarks/run_benchmarks.py                      # run and compare to baseline.json
+    python benchmarks/run_benchmarks.py --tolerance 0.25     # fail past a 25% slowdown
+    python benchmarks/run_benchmarks.py --update-baseline    # record new baselines
+    python benchmarks/run_benchmarks.py --filter fight       # only benchmarks containing "fight"
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+# Benchmarks always run headless
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), 'src'))
+
+import pygame
+from characters.ai_controller import AIController
+from characters.character import Character
+from characters.fight_simulator import FightSimulator
+from characters.sprite_manager import SpriteManager
+from map.map_manager import MapManager
+from render.quality_controller import QualityController
+from render.renderer import SoftwareRenderer
+from resources.showcase_loader import ShowcaseLoader
+from sound.audio_engine import AudioEngine
+
+SCREEN_SIZE = (1600, 1200)
+CHARACTER_IDS = (0, 'player', 'bren', 'billy', 'niall', 'ciaran', 'lee')
+STAGE_IDS = (0, 'niall')
+FIGHTS = ('1v1', '1v3')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the loaders' debug prints while timing"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+def measure(func, repeat, number=1, setup=None):
+    """Median milliseconds per call over `repeat` batches of `number` calls"""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()  # Untimed, e.g. a fresh fight for every batch
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) * 1000 / number)
+    return {
+        'median_ms': statistics.median(samples),
+        'min_ms': min(samples),
+        'repeat': repeat,
+        'number': number,
+    }
+
+def build_sprite_manager(char_id):
+    """A SpriteManager built from scratch rather than from the shared frame sets"""
+    SpriteManager.frame_sets.pop(char_id, None)
+    return SpriteManager(char_id)
+
+def bench_sprite_managers(results, repeat):
+    for char_id in CHARACTER_IDS:
+        with quiet():
+            # Finish the win/lose picture decodes first so none runs in the background while timing
+            build_sprite_manager(char_id)
+            ShowcaseLoader.get().wait()
+            results[f"sprite_manager_init[{char_id}]"] = measure(lambda: build_sprite_manager(char_id), repeat)
+
+def bench_animation_frames(results, repeat):
+    with quiet():
+        sprites = SpriteManager('bren')
+    counter = iter(range(10 ** 9))
+
+    def get_frames():
+        frame = next(counter)
+        sprites.get_animation_frame('walk', True, frame)
+        sprites.get_animation_frame('punch', False, frame)
+
+    results['get_animation_frame'] = measure(get_frames, repeat, number=200)
+
+def bench_map(results, repeat, renderer):
+    for stage_id in STAGE_IDS:
+        with quiet():
+            results[f"map_manager_init[{stage_id}]"] = measure(
+                lambda: MapManager(SCREEN_SIZE[0], SCREEN_SIZE[1], stage_id), repeat
+            )
+            map_manager = MapManager(SCREEN_SIZE[0], SCREEN_SIZE[1], stage_id)
+        results[f"map_manager_draw[{stage_id}]"] = measure(lambda: map_manager.render(renderer), repeat, number=10)
+
+def bench_fight_state(results, repeat, renderer):
+    from states.fight_state import FightState
+
+    setups = dict(zip(FIGHTS, (
+        lambda: FightState('player', 'bren', is_campaign=True),
+        lambda: FightState('player', ['niall', 'billy', 'ciaran'], is_campaign=True, is_final_battle=True),
+    )))
+    for name, create in setups.items():
+        fight = {}
+
+        def new_fight():
+            random.seed(0)
+            fight['state'] = create()
+
+        with quiet():
+            results[f"fight_state_update[{name}]"] = measure(
+                lambda: fight['state'].update(), repeat, number=300, setup=new_fight
+            )
+        results[f"fight_state_draw[{name}]"] = measure(lambda: fight['state'].render(renderer), repeat, number=10)
+        with quiet():
+            AudioEngine.get().stop_music()
+
+def quality_renderer(display, settings):
+    """A software renderer for one quality level, set up the way Game.apply_quality does"""
+    if settings['resolution'] == 1:
+        renderer = SoftwareRenderer(display)
+    else:
+        size = (int(SCREEN_SIZE[0] * settings['resolution']), int(SCREEN_SIZE[1] * settings['resolution']))
+        renderer = SoftwareRenderer(pygame.Surface(size).convert(), SCREEN_SIZE, display, display.get_rect())
+    renderer.effects = settings['effects']
+    renderer.background = settings['background']
+    return renderer
+
+def bench_quality_levels(results, repeat):
+    """A busy 1v3 fight drawn and presented at every quality level"""
+    from states.fight_state import FightState
+
+    display = pygame.display.get_surface()
+    with quiet():
+        random.seed(0)
+        fight = FightState('player', ['niall', 'billy', 'ciaran'], is_campaign=True, is_final_battle=True)
+        for _ in range(30):
+            fight.update()
+    # The busiest moment: everyone mid-attack and the air full of sparks
+    fighters = [fight.p1] + [opp['character'] for opp in fight.opponents]
+    for i, fighter in enumerate(fighters):
+        fighter.state = ('punch', 'kick')[i % 2]
+        fighter.frame_counter = int(1 / fighter.sprite_manager.animation_speed)  # Attack fully out
+        fight.particles.emit('ko', fighter.rect.centerx, fighter.rect.centery)
+        fight.particles.emit('spark', fighter.rect.centerx, fighter.rect.centery, 1)
+
+    def frame_at(renderer):
+        def frame():
+            renderer.clear((0, 0, 0))
+            fight.render(renderer)
+            renderer.present()
+        return frame
+
+    frames = {}
+    for settings in QualityController.LEVELS:
+        frames[settings['name']] = frame_at(quality_renderer(display, settings))
+        frames[settings['name']]()  # Scaled copies are made on the first frame
+
+    # Levels take turns batch by batch, so drift in machine speed hits them all alike
+    samples = {name: [] for name in frames}
+    for _ in range(repeat):
+        for name, frame in frames.items():
+            samples[name].append(measure(frame, 1, number=10)['median_ms'])
+    for name, values in samples.items():
+        results[f"quality_frame[{name}]"] = {
+            'median_ms': statistics.median(values),
+            'min_ms': min(values),
+            'repeat': repeat,
+            'number': 10,
+        }
+    with quiet():
+        AudioEngine.get().stop_music()
+
+def check_quality_order(results):
+    """Quality levels that draw no faster than the level above them"""
+    slower = []
+    names = [f"quality_frame[{settings['name']}]" for settings in QualityController.LEVELS]
+    for higher, lower in zip(names, names[1:]):
+        if higher in results and lower in results and results[lower]['min_ms'] >= results[higher]['min_ms']:
+            slower.append((lower, results[lower]['min_ms'], higher, results[higher]['min_ms']))
+    return slower
+
+def simulate_match(seed=0, max_frames=99 * 60):
+    """Play one headless AI-vs-AI round"""
+    random.seed(seed)
+    player = Character(400, 1000, char_id=0, facing_right=True)
+    opponent = Character(1200, 1000, char_id=1, facing_right=False)
+    sim = FightSimulator(player, [opponent])
+    player_ai = AIController('hard')
+    opponent_ai = AIController('extreme')
+    for _ in range(max_frames):
+        sim.step(player_ai.decide_action(player, opponent), [opponent_ai.decide_action(opponent, player)])
+        if player.health <= 0 or opponent.health <= 0:
+            break
+
+def bench_simulated_match(results, repeat):
+    with quiet():
+        results['simulated_match'] = measure(simulate_match, max(1, repeat // 2))
+
+# (group, benchmark, names of the results it produces)
+BENCHMARKS = (
+    ('sprite_manager', lambda results, repeat, renderer: bench_sprite_managers(results, repeat),
+     [f"sprite_manager_init[{char_id}]" for char_id in CHARACTER_IDS]),
+    ('animation', lambda results, repeat, renderer: bench_animation_frames(results, repeat),
+     ['get_animation_frame']),
+    ('map', bench_map,
+     [f"map_manager_{kind}[{stage_id}]" for stage_id in STAGE_IDS for kind in ('init', 'draw')]),
+    ('fight', bench_fight_state,
+     [f"fight_state_{kind}[{name}]" for name in FIGHTS for kind in ('update', 'draw')]),
+    ('match', lambda results, repeat, renderer: bench_simulated_match(results, repeat),
+     ['simulated_match']),
+    ('quality', lambda results, repeat, renderer: bench_quality_levels(results, repeat),
+     [f"quality_frame[{settings['name']}]" for settings in QualityController.LEVELS]),
+)
+
+def selected(name, group, name_filter):
+    return name_filter is None or name_filter in name or name_filter == group
+
+def run(repeat=5, name_filter=None):
+    """Run the benchmark groups with a result matching name_filter and return {name: stats}"""
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+    renderer = SoftwareRenderer(pygame.Surface(SCREEN_SIZE))
+
+    results = {}
+    for group, bench, names in BENCHMARKS:
+        if not any(selected(name, group, name_filter) for name in names):
+            continue  # Nothing in this group would be reported
+        group_results = {}
+        bench(group_results, repeat, renderer)
+        for name, stats in group_results.items():
+            if selected(name, group, name_filter):
+                results[name] = stats
+    return results
+
+def compare(results, baseline, tolerance):
+    """List regressions where the best batch is slower than baseline * (1 + tolerance)"""
+    # The fastest batch is far less sensitive to machine noise than the median
+    regressions = []
+    for name, stats in sorted(results.items()):
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        limit = expected['min_ms'] * (1 + tolerance)
+        if stats['min_ms'] > limit:
+            regressions.append((name, expected['min_ms'], stats['min_ms']))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Timed batches per benchmark')
+    parser.add_argument('--filter', default=None, help='Only run benchmarks whose name contains this')
+    parser.add_argument('--output', default=None, help='Write results JSON to this path')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float,
+                        default=float(os.environ.get('BENCH_TOLERANCE', 0.5)),
+                        help='Allowed slowdown as a fraction of the baseline (default 0.5)')
+    parser.add_argument('--update-baseline', action='store_true', help='Save results as the new baseline')
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.filter)
+    for name, stats in sorted(results.items()):
+        print(f"{name:<40}{stats['median_ms']:10.3f} ms median {stats['min_ms']:10.3f} ms best")
+    # Stepping down a quality level must make frames cheaper, or the controller makes things worse
+    slower = check_quality_order(results)
+    for lower, lower_ms, higher, higher_ms in slower:
+        print(f"QUALITY ORDER {lower}: {lower_ms:.3f} ms, not faster than {higher} at {higher_ms:.3f} ms")
+
+    report = {
+        'python': sys.version.split()[0],
+        'pygame': pygame.version.ver,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"Wrote results to: {args.output}")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)['results']
+        baseline.update(results)
+        report['results'] = baseline
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(report, baseline_file, indent=2, sort_keys=True)
+        print(f"Updated baseline: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline found at {args.baseline}; run with --update-baseline to create one")
+        return 1 if slower else 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)['results']
+    regressions = compare(results, baseline, args.tolerance)
+    for name, expected, actual in regressions:
+        print(f"REGRESSION {name}: {actual:.3f} ms vs baseline {expected:.3f} ms (+{args.tolerance:.0%} allowed)")
+    if regressions or slower:
+        return 1
+    print(f"No regressions beyond {args.tolerance:.0%} of baseline")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
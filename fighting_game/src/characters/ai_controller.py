@@ -1,7 +1,11 @@
 import random
 import math
+from .fight_simulator import FightSimulator
 
 class AIController:
+    # High-level actions shared by the search and policy based controllers
+    MACRO_ACTIONS = ('hold', 'advance', 'retreat', 'jump', 'punch', 'kick', 'throw')
+
     def __init__(self, difficulty='medium'):
         self.difficulty = difficulty
         self.reaction_time = {
@@ -57,8 +61,10 @@ class AIController:
             # Stop moving when in attack range
             self.current_action['move'] = 0
             
-            # Choose attack type
-            if self.difficulty == 'extreme':
+            # Choose attack type, favouring boss special moves when available
+            if ai_char.special_moves and random.random() < self.aggression * 0.3:
+                self.current_action['attack'] = random.choice(ai_char.special_moves)
+            elif self.difficulty == 'extreme':
                 if random.random() < 0.6:
                     self.current_action['attack'] = random.choice(['punch', 'kick', 'throw'])
             else:
@@ -73,11 +79,21 @@ class AIController:
         
         return self.current_action
         
+    @staticmethod
+    def macro_action(macro, ai_char, target_char):
+        """Expand a high-level action name into an action dict"""
+        toward = -1 if ai_char.x > target_char.x else 1
+        action = {'move': 0, 'jump': False, 'attack': None}
+        if macro == 'advance':
+            action['move'] = toward
+        elif macro == 'retreat':
+            action['move'] = -toward
+        elif macro == 'jump':
+            action['jump'] = True
+        elif macro in ('punch', 'kick', 'throw'):
+            action['attack'] = macro
+        return action
+
     def apply_actions(self, character, actions):
         """Apply the decided actions to the character"""
-        if actions['move']:
-            character.move(actions['move'])
-        if actions['jump']:
-            character.jump()
-        if actions['attack']:
-            character.attack(actions['attack']) 
\ No newline at end of file
+        FightSimulator.apply_actions(character, actions) 
\ No newline at end of file
@@ -58,6 +58,7 @@ class BossData:
             'name': 'Craig',
             'level': 5,
             'difficulty': 'hard',
+            'ai': 'search',
             'color': (200, 150, 255),  # Purple
             'quote': "Let's see if you're ready!",
             'win_quote': "Outstanding! The final test awaits!",
@@ -71,6 +72,7 @@ class BossData:
             'name': 'Niall',
             'level': 3,
             'difficulty': 'hard',
+            'ai': 'search',  # Plans ahead with the fight simulator; 'difficulty' still picks the face
             'color': (150, 150, 255),  # Blue
             'quote': "Prepare for a real challenge!",
             'win_quote': "Incredible! One more to go!",
@@ -84,6 +86,7 @@ class BossData:
             'name': 'Ciaran',
             'level': 4,
             'difficulty': 'extreme',
+            'ai': 'policy',  # The trained policy, the strongest opponent
             'color': (255, 255, 150),  # Gold
             'quote': "Face the final challenge!",
             'win_quote': "Congratulations! You are the champion!",
@@ -94,6 +97,7 @@ class BossData:
             'damage_multiplier': 1.5
         }
     }
+    NEXT_BOSS = dict(zip(BOSSES, list(BOSSES)[1:]))  # Each boss's successor in BOSSES order
     
     @staticmethod
     def get_boss_face(boss_id):
@@ -143,11 +147,4 @@ class BossData:
     @staticmethod
     def get_next_boss(current_boss_id):
         """Get the next boss in sequence"""
-        bosses = list(BossData.BOSSES.keys())
-        try:
-            current_index = bosses.index(current_boss_id)
-            if current_index < len(bosses) - 1:
-                return bosses[current_index + 1]
-        except ValueError:
-            pass
-        return None 
\ No newline at end of file
+        return BossData.NEXT_BOSS.get(current_boss_id)
@@ -1,5 +1,7 @@
 import pygame
 from .sprite_manager import SpriteManager
+from .move_engine import MoveData, MoveExecutor
+from render.viewport import Viewport
 
 class Character:
     def __init__(self, x, y, char_id=0, facing_right=True):
@@ -8,6 +10,7 @@ class Character:
         
         self.x = x
         self.y = y
+        self.spawn = (x, y, facing_right)  # Where reset_for_round() puts us back
         # Adjust width for Bren's character
         if isinstance(char_id, str) and char_id == 'bren':
             self.width = int(self.sprite_manager.WIDTH * 1.5)  # 50% wider for Bren
@@ -17,6 +20,7 @@ class Character:
         self.vel_x = 0
         self.vel_y = 0
         self.health = 200
+        self.max_health = 200  # Bosses scale this with their health multiplier
         self.facing_right = facing_right
         self.state = 'idle'
         self.is_jumping = False
@@ -24,21 +28,23 @@ class Character:
         self.is_throwing = False
         self.attack_cooldown = 0
         self.throw_cooldown = 0
+        self.hitstun = 0  # Frames left reeling from a hit
+        self.blockstun = 0  # Frames left recovering from a block
         self.frame_counter = 0
         self.char_id = char_id
         self.damage_multiplier = 1.0
         self.speed = 1.0  # Base speed multiplier
         self.thrown_items = []  # List to track thrown items
+        self.special_moves = []  # Boss special moves this character can perform
         
         # Movement constants (adjusted for better control)
         self.BASE_MOVE_SPEED = 3  # Reduced base speed for better control
         self.JUMP_SPEED = -12  # Reduced jump velocity
         self.GRAVITY = 0.4  # Reduced gravity
         
-        # Get screen info for fullscreen
-        screen_info = pygame.display.Info()
-        self.SCREEN_WIDTH = screen_info.current_w
-        self.SCREEN_HEIGHT = screen_info.current_h
+        # Arena bounds in logical coordinates, the same on every display
+        self.SCREEN_WIDTH = Viewport.LOGICAL_WIDTH
+        self.SCREEN_HEIGHT = Viewport.LOGICAL_HEIGHT
         self.GROUND_Y = self.SCREEN_HEIGHT - 150  # Ground position adjusted for screen height
         
         # Collision buffer
@@ -50,10 +56,57 @@ class Character:
         
         # Collision rectangles
         self.rect = pygame.Rect(x, y, self.width, self.height)
-        self.attack_rect = None
+        self.hurtbox_rect = pygame.Rect(x, y, self.width, self.height)  # Reused by hurtbox()
+        self.hurtbox_table = MoveData.hurtboxes(self.width, self.height)
+        
+        # Attacks and special moves are played from frame-data tables
+        self.move_executor = MoveExecutor(self)
+        if isinstance(char_id, str) and char_id == 'bren':
+            self.moveset = {'punch': 'heavy_punch', 'kick': 'heavy_kick'}  # Wider reach for Bren
+        else:
+            self.moveset = {'punch': 'punch', 'kick': 'kick'}
+
+    def reset_for_round(self):
+        """Back to the spawn point with full health for the next round"""
+        self.x, self.y, self.facing_right = self.spawn
+        self.rect.topleft = (self.x, self.y)
+        self.vel_x = 0
+        self.vel_y = 0
+        self.health = self.max_health
+        self.state = 'idle'
+        self.is_jumping = False
+        self.is_attacking = False
+        self.is_throwing = False
+        self.attack_cooldown = 0
+        self.throw_cooldown = 0
+        self.hitstun = 0
+        self.blockstun = 0
+        self.thrown_items = []
+        self.move_executor.cancel()
+
+    def clone(self):
+        """Create a cheap copy for simulation, sharing the read-only sprites"""
+        clone = Character.__new__(Character)
+        clone.__dict__.update(self.__dict__)
+
+        # Only the mutable per-frame state needs its own copy
+        clone.rect = self.rect.copy()
+        clone.hurtbox_rect = self.hurtbox_rect.copy()
+        clone.thrown_items = [
+            {'rect': item['rect'].copy(), 'vel_x': item['vel_x'], 'active': item['active']}
+            for item in self.thrown_items
+        ]
+        clone.move_executor = self.move_executor.clone(clone)
+        return clone
+
+    @property
+    def is_stunned(self):
+        return self.hitstun > 0 or self.blockstun > 0
         
     def move(self, dx):
         """Move the character horizontally"""
+        if self.is_stunned:
+            return
         # Direct movement without momentum
         if dx != 0:
             self.vel_x = dx * self.BASE_MOVE_SPEED * self.speed
@@ -67,42 +120,94 @@ class Character:
             
     def jump(self):
         # Only allow jumping when on the ground
-        if not self.is_jumping and self.y >= self.GROUND_Y:
+        if not self.is_jumping and not self.is_stunned and self.y >= self.GROUND_Y:
             self.vel_y = self.JUMP_SPEED
             self.is_jumping = True
             self.state = 'jump'
+            return True
+        return False
             
     def attack(self, attack_type='punch'):
-        if not self.is_attacking and self.attack_cooldown <= 0:
+        move_name = self.moveset.get(attack_type)
+        if move_name is None or self.is_stunned:
+            return False
+        if not self.is_attacking and self.attack_cooldown <= 0 and self.move_executor.start(move_name):
             self.is_attacking = True
-            self.state = attack_type
             self.attack_cooldown = 20  # 20 frames cooldown
-            
-            # Create attack hitbox with adjusted width for Bren
-            attack_width = 60 if isinstance(self.char_id, str) and self.char_id == 'bren' else 40
-            if self.facing_right:
-                self.attack_rect = pygame.Rect(self.rect.right, self.rect.centery - 10, attack_width, 20)
-            else:
-                self.attack_rect = pygame.Rect(self.rect.left - attack_width, self.rect.centery - 10, attack_width, 20)
+            return True
+        return False
                 
     def take_damage(self, amount):
         self.health = max(0, self.health - amount)
         
+    def is_blocking(self, attacker):
+        """A grounded fighter walking away from the attacker blocks"""
+        if self.is_jumping or self.is_attacking or self.move_executor.active or self.hitstun > 0:
+            return False
+        if self.vel_x == 0:
+            return False
+        return (self.vel_x > 0) == (attacker.rect.centerx < self.rect.centerx)
+        
+    def receive_hit(self, damage, hitstun, blockstun, attacker):
+        """Resolve an incoming hit, applying damage and hit/block stun"""
+        if self.is_blocking(attacker):
+            self.blockstun = max(self.blockstun, blockstun)
+            self.vel_x = 0
+            self.state = 'crouch'
+            return False
+            
+        self.take_damage(damage)
+        self.hitstun = max(self.hitstun, hitstun)
+        self.blockstun = 0
+        
+        # Getting hit interrupts whatever we were doing
+        self.move_executor.cancel()
+        self.is_attacking = False
+        self.vel_x = 2 if attacker.rect.centerx < self.rect.centerx else -2  # Small knockback
+        self.state = 'hit'
+        return True
+        
+    def hurtbox(self):
+        """Current hurtbox looked up from the per-animation-frame table"""
+        frames = self.hurtbox_table.get(self.state) or self.hurtbox_table['idle']
+        box = frames[int(self.frame_counter * self.sprite_manager.animation_speed) % len(frames)]
+        if self.facing_right:
+            self.hurtbox_rect.x = self.rect.x + box[0]
+        else:
+            self.hurtbox_rect.x = self.rect.right - box[0] - box[2]
+        self.hurtbox_rect.y = self.rect.y + box[1]
+        self.hurtbox_rect.width = box[2]
+        self.hurtbox_rect.height = box[3]
+        return self.hurtbox_rect
+        
     def throw_item(self):
-        if not self.is_throwing and self.throw_cooldown <= 0:
+        if not self.is_throwing and not self.is_stunned and self.throw_cooldown <= 0:
             self.is_throwing = True
             self.state = 'throw'
             self.throw_cooldown = self.THROW_COOLDOWN
+            self.spawn_projectile()
+            return True
+        return False
             
-            # Create thrown item
-            item_x = self.rect.right if self.facing_right else self.rect.left
-            item_speed = self.THROW_SPEED if self.facing_right else -self.THROW_SPEED
-            thrown_item = {
-                'rect': pygame.Rect(item_x, self.rect.centery, 15, 15),
-                'vel_x': item_speed,
-                'active': True
-            }
-            self.thrown_items.append(thrown_item)
+    def spawn_projectile(self):
+        """Create a thrown item in front of the character"""
+        item_x = self.rect.right if self.facing_right else self.rect.left
+        item_speed = self.THROW_SPEED if self.facing_right else -self.THROW_SPEED
+        thrown_item = {
+            'rect': pygame.Rect(item_x, self.rect.centery, 15, 15),
+            'vel_x': item_speed,
+            'active': True
+        }
+        self.thrown_items.append(thrown_item)
+        
+    def special_move(self, move_name):
+        """Start one of this character's special moves"""
+        if move_name not in self.special_moves or self.is_stunned or self.is_attacking or self.attack_cooldown > 0:
+            return False
+        move = MoveData.get(move_name)
+        if move is not None and move['launches'] and self.is_jumping:
+            return False  # No second jump from a launching move
+        return self.move_executor.start(move_name)
             
     def update(self, map_manager=None):
         # Update frame counter for animations
@@ -179,39 +284,78 @@ class Character:
             self.throw_cooldown -= 1
             
         # Reset attack/throw states after animation
-        if self.is_attacking:
-            if self.attack_cooldown <= 15:  # Attack animation finished
-                self.is_attacking = False
-                self.attack_rect = None
-                if not self.is_jumping:
-                    self.state = 'idle'
+        if self.is_attacking and not self.move_executor.active:
+            self.is_attacking = False  # Attack frame data finished
         if self.is_throwing:
             if self.throw_cooldown <= 40:  # Throw animation finished
                 self.is_throwing = False
                 if not self.is_jumping:
                     self.state = 'idle'
+                    
+        # Advance the current move; its frame table drives the state
+        self.move_executor.tick()
+        
+        # Count down hit/block stun
+        if self.is_stunned:
+            if self.hitstun > 0:
+                self.hitstun -= 1
+            if self.blockstun > 0:
+                self.blockstun -= 1
+            if self.is_stunned:
+                self.state = 'hit' if self.hitstun > 0 else 'crouch'
+            else:
+                self.vel_x = 0
+                self.state = 'jump' if self.is_jumping else 'idle'
             
-    def draw(self, screen):
-        # Get current animation frame
-        current_frame = self.sprite_manager.get_animation_frame(
-            self.state, 
-            self.facing_right,
-            self.frame_counter
+    def snapshot(self):
+        """Copy of what render() draws, safe to draw while the next tick runs"""
+        attack_hitbox = self.move_executor.hitbox()
+        return CharacterSnapshot(
+            self.sprite_manager, self.char_id, self.state, self.frame_counter, (self.x, self.y),
+            not self.facing_right,
+            pygame.Rect(attack_hitbox) if attack_hitbox else None,  # hitbox() reuses one rect
+            tuple(pygame.Rect(item['rect']) for item in self.thrown_items if item['active']),
+            self.health,
+            pygame.Rect(self.rect.x, self.rect.y - 20, 50 * (self.health / 200), 5),
         )
         
-        # Draw the character
-        screen.blit(current_frame, (self.x, self.y))
+    def render(self, renderer):
+        self.snapshot().render(renderer)
+
+class CharacterSnapshot:
+    """One fighter as it was at the end of a tick
+    Holds copies of the rects and no references to the Character, so the
+    simulation thread can run the next tick while this one is drawn. The
+    sprite manager's frames are shared and never change during a fight.
+    """
+
+    __slots__ = ('sprite_manager', 'char_id', 'state', 'frame_counter', 'pos', 'flip_x',
+                 'attack_hitbox', 'thrown_items', 'health', 'health_rect')
+
+    def __init__(self, sprite_manager, char_id, state, frame_counter, pos, flip_x, attack_hitbox,
+                 thrown_items, health, health_rect):
+        self.sprite_manager = sprite_manager
+        self.char_id = char_id
+        self.state = state
+        self.frame_counter = frame_counter
+        self.pos = pos
+        self.flip_x = flip_x
+        self.attack_hitbox = attack_hitbox
+        self.thrown_items = thrown_items
+        self.health = health
+        self.health_rect = health_rect
+
+    def render(self, renderer):
+        # Draw the current animation frame; the renderer mirrors it when facing left
+        self.sprite_manager.render(renderer, self.state, self.frame_counter, self.pos, flip_x=self.flip_x)
         
         # Draw attack hitbox for debugging
-        if self.attack_rect:
-            pygame.draw.rect(screen, (255, 255, 0), self.attack_rect, 1)
+        if self.attack_hitbox and renderer.effects:
+            renderer.fill_rect((255, 255, 0), self.attack_hitbox, 1)
             
         # Draw thrown items
-        for item in self.thrown_items:
-            if item['active']:
-                pygame.draw.rect(screen, (255, 100, 0), item['rect'])  # Orange projectile
+        for rect in self.thrown_items:
+            renderer.fill_rect((255, 100, 0), rect)  # Orange projectile
             
         # Draw health bar
-        health_width = 50 * (self.health / 200)
-        health_rect = pygame.Rect(self.rect.x, self.rect.y - 20, health_width, 5)
-        pygame.draw.rect(screen, (0, 255, 0), health_rect) 
\ No newline at end of file
+        renderer.fill_rect((0, 255, 0), self.health_rect)
@@ -0,0 +1,82 @@
+from .move_engine import MoveData
+
+class FightSimulator:
+    """Headless fight simulation that shares its rules with FightState"""
+
+    def __init__(self, p1, opponents, map_manager=None):
+        self.p1 = p1
+        self.opponents = opponents  # List of Character objects
+        self.map_manager = map_manager
+
+    def clone(self):
+        """Copy the simulation so it can be rolled forward without side effects"""
+        return FightSimulator(
+            self.p1.clone(),
+            [opponent.clone() for opponent in self.opponents],
+            self.map_manager  # Stage geometry is read-only
+        )
+
+    def step(self, p1_actions=None, opponent_actions=None):
+        """Advance the simulation by one frame
+        Args:
+            p1_actions: action dict for the player, or None to keep the current input
+            opponent_actions: list of action dicts (or None) matching self.opponents
+        """
+        if p1_actions:
+            FightSimulator.apply_actions(self.p1, p1_actions)
+        if opponent_actions:
+            for opponent, actions in zip(self.opponents, opponent_actions):
+                if actions:
+                    FightSimulator.apply_actions(opponent, actions)
+
+        self.p1.update(self.map_manager)
+        for opponent in self.opponents:
+            opponent.update(self.map_manager)
+
+        FightSimulator.resolve_collisions(self.p1, self.opponents)
+
+    @staticmethod
+    def apply_actions(character, actions):
+        """Apply an AI-style action dict to a character"""
+        if actions['move']:
+            character.move(actions['move'])
+        if actions['jump']:
+            character.jump()
+        if actions['attack'] == 'throw':
+            character.throw_item()
+        elif actions['attack'] in character.special_moves:
+            character.special_move(actions['attack'])
+        elif actions['attack']:
+            character.attack(actions['attack'])
+
+    @staticmethod
+    def resolve_collisions(p1, opponents):
+        """Push-apart, attack and projectile collisions between the player and opponents"""
+        for opponent in opponents:
+            if p1.rect.colliderect(opponent.rect):
+                # Push characters apart
+                if p1.x < opponent.x:
+                    p1.x = opponent.x - p1.width
+                else:
+                    p1.x = opponent.x + opponent.width
+                p1.rect.x = p1.x
+                opponent.rect.x = opponent.x
+
+            # Attacks look their hitboxes up from frame tables and land once per hit
+            p1.move_executor.try_hit(opponent)
+            opponent.move_executor.try_hit(p1)
+
+            # Check thrown item collisions
+            for item in p1.thrown_items[:]:
+                if item['active'] and item['rect'].colliderect(opponent.hurtbox()):
+                    opponent.receive_hit(15 * p1.damage_multiplier, MoveData.PROJECTILE_HITSTUN,
+                                         MoveData.PROJECTILE_BLOCKSTUN, p1)
+                    item['active'] = False
+                    p1.thrown_items.remove(item)
+
+            for item in opponent.thrown_items[:]:
+                if item['active'] and item['rect'].colliderect(p1.hurtbox()):
+                    p1.receive_hit(15 * opponent.damage_multiplier, MoveData.PROJECTILE_HITSTUN,
+                                   MoveData.PROJECTILE_BLOCKSTUN, opponent)
+                    item['active'] = False
+                    opponent.thrown_items.remove(item)
@@ -0,0 +1,252 @@
+from array import array
+import pygame
+
+class MoveData:
+    """Frame data for special moves, compiled once into flat per-frame tables"""
+
+    # Each move is a list of phases played back to back. A phase with a hitbox
+    # is one hit: it can connect at most once per target however long it stays active.
+    # Hitboxes are (forward offset from the front edge, offset from body centre, width, height).
+    MOVES = {
+        # Basic attacks, lined up with the punch/kick lines drawn on the sprites
+        'punch': [
+            {'frames': 1, 'state': 'punch'},
+            {'frames': 4, 'state': 'punch', 'hitbox': (0, 0, 40, 20), 'damage': 10},
+            {'frames': 5, 'state': 'punch'},
+        ],
+        'kick': [
+            {'frames': 1, 'state': 'kick'},
+            {'frames': 4, 'state': 'kick', 'hitbox': (0, 45, 40, 20), 'damage': 10, 'hitstun': 16},
+            {'frames': 5, 'state': 'kick'},
+        ],
+        # Bren's wider reach
+        'heavy_punch': [
+            {'frames': 1, 'state': 'punch'},
+            {'frames': 4, 'state': 'punch', 'hitbox': (0, 0, 60, 20), 'damage': 10},
+            {'frames': 5, 'state': 'punch'},
+        ],
+        'heavy_kick': [
+            {'frames': 1, 'state': 'kick'},
+            {'frames': 4, 'state': 'kick', 'hitbox': (0, 45, 60, 20), 'damage': 10, 'hitstun': 16},
+            {'frames': 5, 'state': 'kick'},
+        ],
+        # Boss special moves
+        'quick_punch': [
+            {'frames': 2, 'state': 'punch'},
+            {'frames': 3, 'state': 'punch', 'hitbox': (0, -15, 50, 24), 'damage': 8},
+            {'frames': 8, 'state': 'idle'},
+        ],
+        'double_kick': [
+            {'frames': 5, 'state': 'kick'},
+            {'frames': 3, 'state': 'kick', 'hitbox': (0, 20, 60, 26), 'damage': 9},
+            {'frames': 4, 'state': 'idle'},
+            {'frames': 3, 'state': 'kick', 'hitbox': (0, 20, 60, 26), 'damage': 9},
+            {'frames': 12, 'state': 'idle'},
+        ],
+        'combo_punch': [
+            {'frames': 3, 'state': 'punch'},
+            {'frames': 2, 'state': 'punch', 'hitbox': (0, -15, 45, 24), 'damage': 7},
+            {'frames': 3, 'state': 'idle'},
+            {'frames': 2, 'state': 'punch', 'hitbox': (0, -15, 45, 24), 'damage': 7},
+            {'frames': 3, 'state': 'idle'},
+            {'frames': 3, 'state': 'punch', 'hitbox': (0, -15, 55, 24), 'damage': 9},
+            {'frames': 14, 'state': 'idle'},
+        ],
+        'jump_kick': [
+            {'frames': 4, 'state': 'jump', 'event': 'launch'},
+            {'frames': 10, 'state': 'kick', 'hitbox': (0, 40, 55, 40), 'damage': 14},
+            {'frames': 12, 'state': 'jump'},
+        ],
+        'ultimate_combo': [
+            {'frames': 3, 'state': 'punch'},
+            {'frames': 2, 'state': 'punch', 'hitbox': (0, -15, 50, 24), 'damage': 8},
+            {'frames': 3, 'state': 'idle'},
+            {'frames': 3, 'state': 'kick', 'hitbox': (0, 20, 60, 26), 'damage': 10},
+            {'frames': 4, 'state': 'idle'},
+            {'frames': 2, 'state': 'throw', 'event': 'projectile'},
+            {'frames': 4, 'state': 'throw'},
+            {'frames': 3, 'state': 'punch', 'hitbox': (0, -15, 70, 30), 'damage': 12},
+            {'frames': 18, 'state': 'idle'},
+        ],
+    }
+
+    STATES = ('idle', 'punch', 'kick', 'jump', 'throw')
+    EVENTS = (None, 'launch', 'projectile')
+
+    DEFAULT_HITSTUN = 12    # Frames a hit fighter cannot act
+    DEFAULT_BLOCKSTUN = 6   # Frames a blocking fighter cannot act
+    PROJECTILE_HITSTUN = 10
+    PROJECTILE_BLOCKSTUN = 4
+
+    # Hurtboxes per animation frame of each state, as fractions of the
+    # character size: (offset from the back edge, offset from the top, width, height)
+    BODY = (0.1, 0.0, 0.8, 1.0)
+    HURTBOXES = {
+        'idle': [BODY, BODY],
+        'walk': [BODY, BODY, BODY, BODY],
+        'punch': [BODY, (0.1, 0.0, 0.9, 1.0), BODY],
+        'kick': [BODY, (0.1, 0.0, 0.9, 1.0), BODY],
+        'jump': [(0.1, 0.0, 0.8, 0.9)],
+        'crouch': [(0.1, 0.2, 0.8, 0.8)],
+        'hit': [(0.05, 0.05, 0.8, 0.95)],
+        'throw': [BODY, BODY, BODY],
+        'win': [BODY],
+        'loss': [(0.1, 0.1, 0.8, 0.9)],
+    }
+
+    _compiled = None
+    _hurtbox_tables = {}
+
+    @staticmethod
+    def compile(phases):
+        """Flatten a list of phases into per-frame lookup arrays"""
+        state = array('B')
+        hit_id = array('B')      # 0 when no hitbox is active
+        damage = array('H')
+        hitstun = array('B')
+        blockstun = array('B')
+        hitbox = array('h')      # 4 values per frame
+        event = array('B')       # Fired on the first frame of a phase
+
+        hits = 0
+        for phase in phases:
+            box = phase.get('hitbox')
+            if box:
+                hits += 1
+            for frame in range(phase['frames']):
+                state.append(MoveData.STATES.index(phase['state']))
+                hit_id.append(hits if box else 0)
+                damage.append(phase.get('damage', 0) if box else 0)
+                hitstun.append(phase.get('hitstun', MoveData.DEFAULT_HITSTUN) if box else 0)
+                blockstun.append(phase.get('blockstun', MoveData.DEFAULT_BLOCKSTUN) if box else 0)
+                hitbox.extend(box if box else (0, 0, 0, 0))
+                event.append(MoveData.EVENTS.index(phase.get('event')) if frame == 0 else 0)
+
+        return {
+            'length': len(state),
+            'state': state,
+            'hit_id': hit_id,
+            'damage': damage,
+            'hitstun': hitstun,
+            'blockstun': blockstun,
+            'hitbox': hitbox,
+            'event': event,
+            'launches': MoveData.EVENTS.index('launch') in event,  # Leaves the ground, so only starts on it
+        }
+
+    @staticmethod
+    def get(name):
+        """Get the compiled tables for a move, compiling every move on first use"""
+        if MoveData._compiled is None:
+            MoveData._compiled = {
+                move_name: MoveData.compile(phases)
+                for move_name, phases in MoveData.MOVES.items()
+            }
+        return MoveData._compiled.get(name)
+
+    @staticmethod
+    def hurtboxes(width, height):
+        """Hurtbox lookup table in pixels for a character size, built once per size"""
+        key = (width, height)
+        table = MoveData._hurtbox_tables.get(key)
+        if table is None:
+            table = {
+                state: tuple(
+                    (int(x * width), int(y * height), int(w * width), int(h * height))
+                    for x, y, w, h in frames
+                )
+                for state, frames in MoveData.HURTBOXES.items()
+            }
+            MoveData._hurtbox_tables[key] = table
+        return table
+
+class MoveExecutor:
+    """Plays a compiled move for one fighter, one frame per update"""
+
+    def __init__(self, character):
+        self.character = character
+        self.move_name = None
+        self.move = None
+        self.frame = 0
+        self.landed = set()  # (hit id, target id) pairs that already connected
+        self.rect = pygame.Rect(0, 0, 0, 0)  # Reused hitbox rectangle
+
+    @property
+    def active(self):
+        return self.move is not None
+
+    def clone(self, character):
+        """Copy the executor for a cloned character"""
+        clone = MoveExecutor(character)
+        clone.move_name = self.move_name
+        clone.move = self.move
+        clone.frame = self.frame
+        clone.landed = set(self.landed)
+        return clone
+
+    def start(self, move_name):
+        """Start a move if the fighter is free to act"""
+        move = MoveData.get(move_name)
+        if move is None or self.active:
+            return False
+        self.move_name = move_name
+        self.move = move
+        self.frame = -1  # The first tick plays frame 0
+        self.landed.clear()
+        return True
+
+    def cancel(self):
+        self.move_name = None
+        self.move = None
+
+    def tick(self):
+        """Advance the move by one frame and fire its events"""
+        if not self.active:
+            return
+        self.frame += 1
+        if self.frame >= self.move['length']:
+            self.cancel()
+            if not self.character.is_jumping:
+                self.character.state = 'idle'
+            return
+
+        self.character.state = MoveData.STATES[self.move['state'][self.frame]]
+        event = MoveData.EVENTS[self.move['event'][self.frame]]
+        if event == 'launch':
+            self.character.vel_y = self.character.JUMP_SPEED
+            self.character.is_jumping = True
+        elif event == 'projectile':
+            self.character.spawn_projectile()
+
+    def hitbox(self):
+        """Current hitbox looked up from the frame table, or None"""
+        if not self.active or self.frame < 0 or not self.move['hit_id'][self.frame]:
+            return None
+        offset = self.frame * 4
+        box = self.move['hitbox']
+        rect = self.character.rect
+        self.rect.width = box[offset + 2]
+        self.rect.height = box[offset + 3]
+        if self.character.facing_right:
+            self.rect.x = rect.right + box[offset]
+        else:
+            self.rect.x = rect.left - box[offset] - self.rect.width
+        self.rect.y = rect.centery + box[offset + 1] - self.rect.height // 2
+        return self.rect
+
+    def try_hit(self, target):
+        """Apply this frame's hit to target, landing each hit only once per target"""
+        hitbox = self.hitbox()
+        if hitbox is None:
+            return False
+        key = (self.move['hit_id'][self.frame], id(target))
+        if key in self.landed or not hitbox.colliderect(target.hurtbox()):
+            return False
+        self.landed.add(key)
+        target.receive_hit(
+            self.move['damage'][self.frame] * self.character.damage_multiplier,
+            self.move['hitstun'][self.frame],
+            self.move['blockstun'][self.frame],
+            self.character
+        )
+        return True
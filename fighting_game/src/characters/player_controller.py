@@ -0,0 +1,49 @@
+from input.actions import Action
+from input.input_buffer import InputBuffer
+
+class PlayerController:
+    """Drives a character from one player's per-tick action masks"""
+
+    def __init__(self, character, buffer_windows=None):
+        self.character = character
+        self.held = Action.NONE
+        self.pressed = Action.NONE
+        self.last_dx = 0
+
+        # Presses queue in the buffer and fire on the first tick the move is allowed
+        self.input_buffer = InputBuffer(windows=buffer_windows)
+        self.buffered_moves = (
+            (Action.JUMP, character.jump),
+            (Action.UP, character.jump),
+            (Action.PUNCH, lambda: character.attack('punch')),
+            (Action.KICK, lambda: character.attack('kick')),
+            (Action.THROW, character.throw_item),
+        )
+
+    def handle_input(self, held, pressed):
+        """Sample this tick's actions; apply() acts on them"""
+        self.held = held
+        self.pressed = pressed
+        self.input_buffer.record(held, pressed)
+
+    def apply(self):
+        # A tap shorter than a tick still shows up in the pressed mask
+        held = self.held | self.pressed
+        self.pressed = Action.NONE
+        if not held and not self.last_dx and self.input_buffer.idle():
+            return  # Nothing to do on idle ticks
+
+        dx = 0
+        if held & Action.LEFT: dx -= 1
+        if held & Action.RIGHT: dx += 1
+        if dx != 0:
+            self.character.move(dx)
+        elif self.last_dx != 0:
+            # Direction released: stop, but leave knockback alone otherwise
+            self.character.move(0)
+        self.last_dx = dx
+
+        for bit, perform in self.buffered_moves:
+            slot = self.input_buffer.find(bit)
+            if slot >= 0 and perform():
+                self.input_buffer.consume(slot, bit)
@@ -0,0 +1,120 @@
+import numpy as np
+from .ai_controller import AIController
+from resources.asset_registry import AssetRegistry
+
+class Policy:
+    """Small MLP mapping fight features to a score per macro action"""
+
+    FEATURES = (
+        'distance',          # Horizontal gap to the target
+        'height',            # Target height relative to us
+        'own_health',
+        'target_health',
+        'attack_cooldown',
+        'throw_cooldown',
+        'target_attack_cooldown',
+        'projectile',        # Closeness of the nearest incoming projectile
+    )
+
+    def __init__(self, w1, b1, w2, b2, actions=AIController.MACRO_ACTIONS):
+        self.w1 = np.asarray(w1, dtype=np.float32)
+        self.b1 = np.asarray(b1, dtype=np.float32)
+        self.w2 = np.asarray(w2, dtype=np.float32)
+        self.b2 = np.asarray(b2, dtype=np.float32)
+        self.actions = tuple(actions)
+
+    @staticmethod
+    def load(path):
+        """Load a policy saved with Policy.save"""
+        data = np.load(path)
+        return Policy(data['w1'], data['b1'], data['w2'], data['b2'], [str(a) for a in data['actions']])
+
+    def save(self, path):
+        """Save the policy weights as a compressed .npz file"""
+        np.savez_compressed(path, w1=self.w1, b1=self.b1, w2=self.w2, b2=self.b2,
+                            actions=np.array(self.actions))
+
+    def scores(self, features):
+        """Score every action for a (batch, features) array"""
+        hidden = np.maximum(features @ self.w1 + self.b1, 0.0)
+        return hidden @ self.w2 + self.b2
+
+    @staticmethod
+    def features(ai_char, target_char):
+        """Build the normalised feature vector for one fighter"""
+        distance = abs(ai_char.rect.centerx - target_char.rect.centerx)
+
+        # Nearest projectile flying towards us
+        projectile = 0.0
+        for item in target_char.thrown_items:
+            if item['active'] and (item['vel_x'] > 0) == (item['rect'].centerx < ai_char.rect.centerx):
+                gap = abs(item['rect'].centerx - ai_char.rect.centerx)
+                projectile = max(projectile, 1.0 - min(gap, 800) / 800)
+
+        return (
+            min(distance, 1600) / 1600,
+            (ai_char.rect.bottom - target_char.rect.bottom) / 300,
+            min(ai_char.health, 400) / 200,
+            min(target_char.health, 400) / 200,
+            ai_char.attack_cooldown / 20,
+            ai_char.throw_cooldown / ai_char.THROW_COOLDOWN,
+            target_char.attack_cooldown / 20,
+            projectile,
+        )
+
+class PolicyAIController(AIController):
+    """AI controller driven by an offline-trained policy"""
+
+    _default_policy = None
+
+    def __init__(self, policy=None, fallback_difficulty='hard'):
+        # Reaction/aggression values are only used when no policy is available
+        super().__init__(fallback_difficulty)
+        self.difficulty = 'policy'
+        self.policy = policy if policy is not None else PolicyAIController.load_default_policy()
+
+    @staticmethod
+    def load_default_policy():
+        """Load the shipped policy once and share it between controllers"""
+        if PolicyAIController._default_policy is None:
+            policy_path = AssetRegistry.get().path('policy', 'boss')
+            try:
+                if policy_path:
+                    print(f"Loading AI policy from: {policy_path}")
+                    PolicyAIController._default_policy = Policy.load(policy_path)
+                else:
+                    print("AI policy not found")
+            except Exception as e:
+                print(f"Error loading AI policy: {e}")
+        return PolicyAIController._default_policy
+
+    def decide_action(self, ai_char, player_char):
+        """Decide AI character's next action from the policy"""
+        return PolicyAIController.decide_batch([self], [ai_char], player_char)[0]
+
+    @staticmethod
+    def decide_batch(controllers, ai_chars, player_char):
+        """Run one forward pass for every policy-driven fighter this tick"""
+        actions = [None] * len(controllers)
+
+        # Group fighters by policy so each network runs once per tick
+        groups = {}
+        for i, controller in enumerate(controllers):
+            if controller.policy is None:
+                actions[i] = AIController.decide_action(controller, ai_chars[i], player_char)
+            else:
+                groups.setdefault(id(controller.policy), []).append(i)
+
+        for indices in groups.values():
+            policy = controllers[indices[0]].policy
+            features = np.array(
+                [Policy.features(ai_chars[i], player_char) for i in indices],
+                dtype=np.float32
+            )
+            choices = np.argmax(policy.scores(features), axis=1)
+            for i, choice in zip(indices, choices):
+                macro = policy.actions[choice]
+                controllers[i].current_action = controllers[i].macro_action(macro, ai_chars[i], player_char)
+                actions[i] = controllers[i].current_action
+
+        return actions
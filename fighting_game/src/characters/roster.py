@@ -0,0 +1,56 @@
+import pygame
+from .boss_data import BossData
+
+class Roster:
+    """The campaign's bosses in fight order, with everything the UI looks up per frame
+    Built once at startup: each boss's place in the order, the bosses either
+    side of it and its portrait at every size the UI draws it.
+    """
+
+    CAMPAIGN_ORDER = ('bren', 'billy', 'niall', 'ciaran')
+    FINAL_BATTLE = ('niall', 'billy', 'ciaran')  # Opponents in order of appearance
+    PORTRAIT_SIZES = (200,)  # Campaign boss preview
+
+    _instance = None
+
+    def __init__(self, order=CAMPAIGN_ORDER, portrait_sizes=PORTRAIT_SIZES):
+        self.order = tuple(order)
+        self.entries = {}
+        for index, boss_id in enumerate(self.order):
+            face = BossData.get_boss_face(boss_id)
+            self.entries[boss_id] = {
+                'data': BossData.get_boss_data(boss_id),
+                'index': index,
+                'previous': self.order[index - 1] if index > 0 else None,
+                'next': self.order[index + 1] if index < len(self.order) - 1 else None,
+                'portraits': {size: pygame.transform.scale(face, (size, size)) for size in portrait_sizes},
+            }
+
+    @staticmethod
+    def get():
+        """Get the shared roster, building it the first time"""
+        if Roster._instance is None:
+            Roster._instance = Roster()
+        return Roster._instance
+
+    def __len__(self):
+        return len(self.order)
+
+    def data(self, boss_id):
+        return self.entries[boss_id]['data']
+
+    def index(self, boss_id):
+        """Position in the campaign, from 0"""
+        return self.entries[boss_id]['index']
+
+    def next(self, boss_id):
+        """The boss after this one, or None after the last"""
+        return self.entries[boss_id]['next']
+
+    def previous(self, boss_id):
+        """The boss before this one, or None before the first"""
+        return self.entries[boss_id]['previous']
+
+    def portrait(self, boss_id, size):
+        """Pre-scaled portrait; size must be one of the roster's portrait sizes"""
+        return self.entries[boss_id]['portraits'][size]
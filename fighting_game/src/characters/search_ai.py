@@ -0,0 +1,118 @@
+import time
+from .ai_controller import AIController
+from .fight_simulator import FightSimulator
+
+class SearchAIController(AIController):
+    """AI tier that picks moves by rolling the fight forward in a headless simulation"""
+
+    HORIZON = 12           # Frames simulated for each candidate sequence
+    TIME_BUDGET = 0.002    # Seconds allowed per decision
+    CACHE_SIZE = 4096      # Maximum transposition cache entries
+    POSITION_STEP = 16     # Pixel size of a quantised position cell
+
+    def __init__(self, map_manager=None, horizon=HORIZON, time_budget=TIME_BUDGET):
+        # Borrow the extreme reaction time and aggression values
+        super().__init__('extreme')
+        self.difficulty = 'search'
+        self.map_manager = map_manager
+        self.horizon = horizon
+        self.time_budget = time_budget
+        self.deadline = None  # perf_counter() time the fight needs this tick's search done by
+
+        # Quantised state -> best macro action
+        self.cache = {}
+        self.cache_hits = 0
+        self.searches = 0
+        self.rollouts = 0
+
+        # Single-action plans first so a tight budget still covers every option,
+        # then two-step plans that switch action halfway through the horizon
+        self.candidates = [(macro, macro) for macro in self.MACRO_ACTIONS]
+        self.candidates += [
+            (first, second)
+            for first in self.MACRO_ACTIONS
+            for second in self.MACRO_ACTIONS
+            if first != second
+        ]
+
+    def decide_action(self, ai_char, player_char):
+        """Decide AI character's next action based on a lookahead search"""
+        self.frame_counter += 1
+
+        # Keep walking the current plan between decisions
+        if self.current_action is not None and self.decision_cooldown > 0:
+            self.decision_cooldown -= 1
+            return {'move': self.current_action['move'], 'jump': False, 'attack': None}
+
+        key = self.quantise(ai_char, player_char)
+        macro = self.cache.get(key)
+        if macro is None:
+            macro = self.search(ai_char, player_char)
+            if len(self.cache) >= self.CACHE_SIZE:
+                self.cache.clear()
+            self.cache[key] = macro
+        else:
+            self.cache_hits += 1
+
+        self.current_action = self.macro_action(macro, ai_char, player_char)
+        self.decision_cooldown = self.reaction_time
+        return self.current_action
+
+    def quantise(self, ai_char, player_char):
+        """Build a transposition cache key from the parts of the state that matter"""
+        step = self.POSITION_STEP
+        return (
+            int(ai_char.x) // step, int(ai_char.y) // step,
+            int(player_char.x) // step, int(player_char.y) // step,
+            (ai_char.vel_x > 0) - (ai_char.vel_x < 0),
+            (player_char.vel_x > 0) - (player_char.vel_x < 0),
+            int(ai_char.health) // 10, int(player_char.health) // 10,
+            ai_char.attack_cooldown // 5, ai_char.throw_cooldown // 15,
+            player_char.attack_cooldown // 5,
+            ai_char.is_jumping, player_char.is_jumping
+        )
+
+    def search(self, ai_char, player_char):
+        """Return the macro action whose rollout gives the best health differential"""
+        self.searches += 1
+        deadline = time.perf_counter() + self.time_budget
+        if self.deadline is not None:
+            deadline = min(deadline, self.deadline)
+        root = FightSimulator(player_char.clone(), [ai_char.clone()], self.map_manager)
+
+        best_macro = 'hold'
+        best_score = None
+        for plan in self.candidates:
+            # Always finish at least one rollout, then respect the budget
+            if best_score is not None and time.perf_counter() > deadline:
+                break
+            score = self.rollout(root, plan)
+            if best_score is None or score > best_score:
+                best_score = score
+                best_macro = plan[0]
+        return best_macro
+
+    def rollout(self, root, plan):
+        """Simulate one candidate plan and score the resulting state"""
+        self.rollouts += 1
+        sim = root.clone()
+        ai_char = sim.opponents[0]
+        player_char = sim.p1
+        ai_start = ai_char.health
+        player_start = player_char.health
+
+        switch_frame = self.horizon // 2
+        for frame in range(self.horizon):
+            macro = plan[0] if frame < switch_frame else plan[1]
+            actions = self.macro_action(macro, ai_char, player_char)
+            # The player is assumed to keep doing what they are doing
+            sim.step(None, [actions])
+
+        return self.evaluate(ai_char, player_char, ai_start, player_start)
+
+    def evaluate(self, ai_char, player_char, ai_start, player_start):
+        """Health differential with a small preference for staying in attack range"""
+        damage_dealt = player_start - player_char.health
+        damage_taken = ai_start - ai_char.health
+        distance = abs(ai_char.rect.centerx - player_char.rect.centerx)
+        return damage_dealt - damage_taken - abs(distance - 60) * 0.01
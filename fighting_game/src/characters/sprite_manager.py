@@ -1,13 +1,35 @@
 import pygame
 import math
-import os
+from resources.asset_registry import AssetRegistry
+from resources.showcase_loader import ShowcaseLoader
 
 class SpriteManager:
+    """Animation frames for one character, built once and shared by every fighter using it
+    Frames that come out pixel-identical are one surface. Effects drawn on
+    top of a frame (punch and kick lines, the thrown ball, the victory mark)
+    are kept as small stamps and composited when the frame is drawn.
+    """
+
+    frame_sets = {}  # char_id -> frames, overlays and dimensions; see build_frame_set()
+    NO_OVERLAYS = ()
+    BREN_WIDTH = 252  # Bren's sheet is drawn 2.25x the standard 112 px width
+
     def __init__(self, char_id=0):
         self.animation_speed = 0.2
         self.frame_counter = 0
         self.char_id = char_id
         
+        frame_set = SpriteManager.frame_sets.get(char_id)
+        if frame_set is None:
+            frame_set = SpriteManager.frame_sets[char_id] = self.build_frame_set()
+        self.WIDTH = frame_set['width']
+        self.HEIGHT = frame_set['height']
+        self.full_character = frame_set['full_character']
+        self.sprites = frame_set['sprites']
+        self.overlays = frame_set['overlays']  # state -> per-frame tuples of (stamp, offset)
+        
+    def build_frame_set(self):
+        """Load or draw every animation frame for this character"""
         # Character dimensions (1.5x scale)
         self.WIDTH = 112   # 1.5x of 75
         self.HEIGHT = 225  # 1.5x of 150
@@ -15,127 +37,130 @@ class SpriteManager:
         self.TORSO_WIDTH = 45  # 1.5x of 30
         self.TORSO_HEIGHT = 90  # 1.5x of 60
         self.LINE_THICKNESS = 9  # 1.5x of 6
+        self.overlays = {}
         
         # Try to load full character sprite first
-        self.full_character = self.load_full_character()
+        full_sprites = self.load_full_character()
+        full_character = full_sprites is not None
         
         # Only load these if we don't have a full character sprite
-        if not self.full_character:
+        if not full_character:
             self.face_image = self.load_face_image()
             self.win_image = self.load_special_asset('win')
             self.loss_image = self.load_special_asset('lose')
             self.prize_image = self.load_special_asset('prize')
         
-        # Create and store sprites once during initialization
-        self.sprites = self.create_character_sprites()
+        # Create and store sprites once for every fighter with this character
+        sprites = self.share_identical_frames(full_sprites or self.create_character_sprites())
+        return {
+            'width': self.WIDTH,
+            'height': self.HEIGHT,
+            'full_character': full_character,
+            'sprites': sprites,
+            'overlays': self.overlays,
+        }
+        
+    @staticmethod
+    def share_identical_frames(sprites):
+        """Replace frames that are pixel-for-pixel equal with one shared surface"""
+        seen = {}  # (size, RGBA bytes) -> first surface with those pixels
+        for frames in sprites.values():
+            for i, frame in enumerate(frames):
+                key = (frame.get_size(), pygame.image.tobytes(frame, 'RGBA'))
+                frames[i] = seen.setdefault(key, frame)
+        return sprites
+        
+    def make_overlay(self, draw):
+        """Run a draw call on a blank frame and keep only the pixels it touched
+        Returns:
+            tuple: (stamp, offset), the stamp clipped to the frame as the drawing would be
+        """
+        scratch = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+        draw(scratch)
+        bounds = scratch.get_bounding_rect()
+        return scratch.subsurface(bounds).copy(), bounds.topleft
         
     def load_full_character(self):
         """Try to load a full character sprite sheet"""
-        # Handle stage-specific characters
-        char_path = None
-        
-        if isinstance(self.char_id, str):
-            if self.char_id == 'bren':
-                char_path = os.path.join("fighting_game", "assets", "images", "faces", "bren_char.png")
-                # Adjust width for Bren
-                self.WIDTH = int(self.WIDTH * 1.5)  # 50% wider
-            elif self.char_id == 'lee':
-                char_path = os.path.join("fighting_game", "assets", "images", "faces", "lee_char.png")
-            elif self.char_id == 'billy':
-                char_path = os.path.join("fighting_game", "assets", "images", "faces", "billy_char.png")
-            elif self.char_id == 'niall':
-                char_path = os.path.join("fighting_game", "assets", "images", "faces", "niall_char.png")
-            elif self.char_id == 'ciaran':
-                char_path = os.path.join("fighting_game", "assets", "images", "faces", "final_boss.png")
+        char_path = AssetRegistry.get().path('character', self.char_id)
+        if self.char_id == 'bren':
+            self.WIDTH = self.BREN_WIDTH
                 
         if char_path:
-            # Try without fighting_game prefix if not found
-            if not os.path.exists(char_path):
-                char_path = char_path.replace("fighting_game/", "")
-                
             try:
-                if os.path.exists(char_path):
-                    print(f"Loading character sprite from: {char_path}")
-                    char_surface = pygame.image.load(char_path)
-                    # Scale to match our character size
-                    base_sprite = pygame.transform.scale(char_surface, (self.WIDTH, self.HEIGHT))
-                    
-                    # Create animation frames by modifying the base sprite
-                    sprites = {}
-                    
-                    # Idle animation - just use base sprite
-                    sprites['idle'] = [base_sprite]
-                    
-                    # Walk animation - create slight bobbing effect
-                    walk_frames = []
-                    for i in range(4):
-                        frame = base_sprite.copy()
-                        offset = int(math.sin(i * math.pi / 2) * 4)  # Small vertical offset
-                        frame_surface = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
-                        frame_surface.blit(frame, (0, offset))
-                        walk_frames.append(frame_surface)
-                    sprites['walk'] = walk_frames
-                    
-                    # Punch animation - create arm extension effect
-                    punch_frames = []
-                    for i in range(3):
-                        frame = base_sprite.copy()
-                        if i == 1:  # Extended punch frame
-                            # Draw punch effect
-                            punch_width = int(60 if self.char_id == 'bren' else 40)  # Wider punch for Bren
-                            pygame.draw.line(frame, (255, 255, 0), 
-                                          (self.WIDTH - 20, self.HEIGHT // 2),
-                                          (self.WIDTH + punch_width - 30, self.HEIGHT // 2), 8)
-                        punch_frames.append(frame)
-                    sprites['punch'] = punch_frames
-                    
-                    # Kick animation - create leg extension effect
-                    kick_frames = []
-                    for i in range(3):
-                        frame = base_sprite.copy()
-                        if i == 1:  # Extended kick frame
-                            # Draw kick effect
-                            kick_width = int(60 if self.char_id == 'bren' else 40)  # Wider kick for Bren
-                            pygame.draw.line(frame, (255, 255, 0),
-                                          (self.WIDTH - 20, self.HEIGHT * 0.7),
-                                          (self.WIDTH + kick_width - 30, self.HEIGHT * 0.7), 8)
-                        kick_frames.append(frame)
-                    sprites['kick'] = kick_frames
-                    
-                    # Jump animation - just use base sprite with slight squash
-                    jump_frame = base_sprite.copy()
-                    jump_frame = pygame.transform.scale(jump_frame, 
-                                                     (self.WIDTH, int(self.HEIGHT * 0.9)))
-                    sprites['jump'] = [jump_frame]
-                    
-                    # Crouch animation - squash the sprite
-                    crouch_frame = pygame.transform.scale(base_sprite,
-                                                        (self.WIDTH, int(self.HEIGHT * 0.8)))
-                    sprites['crouch'] = [crouch_frame]
-                    
-                    # Throw animation - similar to punch but with projectile effect
-                    throw_frames = []
-                    for i in range(3):
-                        frame = base_sprite.copy()
-                        if i == 1:  # Throwing frame
-                            # Draw throw effect
-                            pygame.draw.circle(frame, (255, 100, 0),
-                                            (self.WIDTH - 10, self.HEIGHT // 2), 8)
-                        throw_frames.append(frame)
-                    sprites['throw'] = throw_frames
-                    
-                    # Win/Loss animations - modify base sprite
-                    win_frame = base_sprite.copy()
-                    pygame.draw.line(win_frame, (255, 255, 0),
-                                   (self.WIDTH // 2, 10),
-                                   (self.WIDTH // 2, 30), 4)  # Victory effect
-                    sprites['win'] = [win_frame]
-                    
-                    loss_frame = pygame.transform.scale(base_sprite,
-                                                      (self.WIDTH, int(self.HEIGHT * 0.9)))
-                    sprites['loss'] = [loss_frame]
-                    
-                    return sprites
+                print(f"Loading character sprite from: {char_path}")
+                char_surface = pygame.image.load(char_path)
+                # Scale to match our character size
+                base_sprite = pygame.transform.scale(char_surface, (self.WIDTH, self.HEIGHT))
+                
+                # Create animation frames by modifying the base sprite
+                sprites = {}
+                
+                # Idle animation - just use base sprite
+                sprites['idle'] = [base_sprite]
+                
+                # Walk animation - create slight bobbing effect
+                walk_frames = []
+                for i in range(4):
+                    offset = int(math.sin(i * math.pi / 2) * 4)  # Small vertical offset
+                    frame_surface = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+                    frame_surface.blit(base_sprite, (0, offset))
+                    walk_frames.append(frame_surface)
+                sprites['walk'] = walk_frames
+                
+                # Punch animation - the idle pose with an arm extension effect on the middle frame
+                punch_width = int(60 if self.char_id == 'bren' else 40)  # Wider punch for Bren
+                punch_line = self.make_overlay(lambda frame: pygame.draw.line(
+                    frame, (255, 255, 0),
+                    (self.WIDTH - 20, self.HEIGHT // 2),
+                    (self.WIDTH + punch_width - 30, self.HEIGHT // 2), 8))
+                sprites['punch'] = [base_sprite] * 3
+                self.overlays['punch'] = [(), (punch_line,), ()]
+                
+                # Kick animation - leg extension effect
+                kick_width = int(60 if self.char_id == 'bren' else 40)  # Wider kick for Bren
+                kick_line = self.make_overlay(lambda frame: pygame.draw.line(
+                    frame, (255, 255, 0),
+                    (self.WIDTH - 20, self.HEIGHT * 0.7),
+                    (self.WIDTH + kick_width - 30, self.HEIGHT * 0.7), 8))
+                sprites['kick'] = [base_sprite] * 3
+                self.overlays['kick'] = [(), (kick_line,), ()]
+                
+                # Jump animation - just use base sprite with slight squash
+                jump_frame = base_sprite.copy()
+                jump_frame = pygame.transform.scale(jump_frame, 
+                                                 (self.WIDTH, int(self.HEIGHT * 0.9)))
+                sprites['jump'] = [jump_frame]
+                
+                # Crouch animation - squash the sprite
+                crouch_frame = pygame.transform.scale(base_sprite,
+                                                    (self.WIDTH, int(self.HEIGHT * 0.8)))
+                sprites['crouch'] = [crouch_frame]
+                
+                # Hit reaction - knocked back and down a little
+                hit_frame = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+                hit_frame.blit(base_sprite, (-8, 4))
+                sprites['hit'] = [hit_frame]
+                
+                # Throw animation - similar to punch but with projectile effect
+                throw_ball = self.make_overlay(lambda frame: pygame.draw.circle(
+                    frame, (255, 100, 0), (self.WIDTH - 10, self.HEIGHT // 2), 8))
+                sprites['throw'] = [base_sprite] * 3
+                self.overlays['throw'] = [(), (throw_ball,), ()]
+                
+                # Win/Loss animations - modify base sprite
+                victory_mark = self.make_overlay(lambda frame: pygame.draw.line(
+                    frame, (255, 255, 0),
+                    (self.WIDTH // 2, 10),
+                    (self.WIDTH // 2, 30), 4))  # Victory effect
+                sprites['win'] = [base_sprite]
+                self.overlays['win'] = [(victory_mark,)]
+                
+                loss_frame = pygame.transform.scale(base_sprite,
+                                                  (self.WIDTH, int(self.HEIGHT * 0.9)))
+                sprites['loss'] = [loss_frame]
+                
+                return sprites
             except Exception as e:
                 print(f"Error loading character sprite: {e}")
         return None
@@ -143,9 +168,9 @@ class SpriteManager:
     def load_face_image(self):
         """Load custom face image or create a default one"""
         # Try to load custom face image
-        face_path = os.path.join('assets', 'images', 'faces', f'fight_{self.char_id}.png')
+        face_path = AssetRegistry.get().find(f'images/faces/fight_{self.char_id}.png')
         try:
-            if os.path.exists(face_path):
+            if face_path:
                 face_surface = pygame.image.load(face_path)
                 # Scale to expected size if needed
                 if face_surface.get_size() != (self.FACE_SIZE, self.FACE_SIZE):
@@ -182,31 +207,15 @@ class SpriteManager:
         
     def load_special_asset(self, asset_type):
         """Load special assets (win, lose, prize) from their respective folders"""
-        # Special case for main character loss image
-        if asset_type == 'lose' and (self.char_id == 0 or self.char_id == 'player'):
-            loss_path = os.path.join("fighting_game", "assets", "images", "lose", "mc_lose.png")
-            if not os.path.exists(loss_path):
-                # Try without fighting_game prefix
-                loss_path = os.path.join("assets", "images", "lose", "mc_lose.png")
-            if os.path.exists(loss_path):
-                print(f"Loading main character loss image from: {loss_path}")
-                try:
-                    loss_surface = pygame.image.load(loss_path)
-                    # Scale to match character size
-                    if loss_surface.get_size() != (self.WIDTH, self.HEIGHT):
-                        loss_surface = pygame.transform.scale(loss_surface, (self.WIDTH, self.HEIGHT))
-                    return loss_surface
-                except Exception as e:
-                    print(f"Error loading main character loss image: {e}")
+        # The main character's win and loss pictures are large; they decode in the background
+        if asset_type in ('win', 'lose') and (self.char_id == 0 or self.char_id == 'player'):
+            return self.request_showcase(asset_type)
         
         # Regular asset loading for other cases
-        asset_path = os.path.join("fighting_game", "assets", "images", asset_type, f"fight_{self.char_id}.png")
-        if not os.path.exists(asset_path):
-            # Try without fighting_game prefix
-            asset_path = os.path.join("assets", "images", asset_type, f"fight_{self.char_id}.png")
+        asset_path = AssetRegistry.get().find(f"images/{asset_type}/fight_{self.char_id}.png")
             
         try:
-            if os.path.exists(asset_path):
+            if asset_path:
                 print(f"Loading {asset_type} image from: {asset_path}")
                 asset_surface = pygame.image.load(asset_path)
                 # Scale based on asset type
@@ -231,6 +240,21 @@ class SpriteManager:
             return self.create_defeat_pose()
         return self.create_default_sprite()
         
+    def request_showcase(self, asset_type):
+        """Placeholder for a win/lose picture, swapped for the real one once it is decoded"""
+        state = 'win' if asset_type == 'win' else 'loss'
+        char_id = self.char_id
+        
+        def swap_in(surface):
+            frame_set = SpriteManager.frame_sets.get(char_id)
+            if frame_set is not None:
+                frames = frame_set['sprites'][state]
+                frames[:] = [surface if frame is placeholder else frame for frame in frames]
+        
+        fallback = self.create_victory_pose() if asset_type == 'win' else self.create_defeat_pose()
+        placeholder = ShowcaseLoader.get().request(asset_type, char_id, (self.WIDTH, self.HEIGHT), swap_in, fallback)
+        return placeholder
+        
     def create_default_prize(self):
         """Create a default prize projectile"""
         surface = pygame.Surface((20, 20), pygame.SRCALPHA)
@@ -246,17 +270,14 @@ class SpriteManager:
             'kick': [],
             'jump': [],
             'crouch': [],
+            'hit': [],
             'throw': [],  # Add throw animation
             'win': [],    # Add win animation
             'loss': []    # Add loss animation
         }
         
-        # If we have a full character sprite, use it for all states
-        full_sprites = self.load_full_character()
-        if full_sprites:
-            return full_sprites  # Return the pre-made animation frames
-            
-        # Otherwise, create default animated sprites
+        # Characters without a full sprite sheet get default animated sprites
+        self.overlays = {}  # Drop any a failed sheet load left behind
         # Create throw animation frames
         for i in range(3):  # 3-frame throw animation
             surface = pygame.Surface((50, 100), pygame.SRCALPHA)
@@ -412,6 +433,22 @@ class SpriteManager:
         
         sprites['crouch'].append(surface)
         
+        # Create hit reaction frame
+        surface = pygame.Surface((50, 100), pygame.SRCALPHA)
+        # Body knocked back
+        pygame.draw.rect(surface, (255, 255, 255), (12, 22, 20, 38))  # Torso
+        surface.blit(self.face_image, (10, 8))  # Head thrown back
+        
+        # Arms flung forward
+        pygame.draw.line(surface, (255, 255, 255), (12, 27), (4, 37), 4)
+        pygame.draw.line(surface, (255, 255, 255), (32, 27), (44, 33), 4)
+        
+        # Legs braced
+        pygame.draw.line(surface, (255, 255, 255), (18, 60), (10, 90), 4)
+        pygame.draw.line(surface, (255, 255, 255), (28, 60), (35, 90), 4)
+        
+        sprites['hit'].append(surface)
+        
         return sprites
         
     def create_victory_pose(self):
@@ -442,20 +479,65 @@ class SpriteManager:
         pygame.draw.line(surface, (255, 255, 255), (30, 60), (35, 85), 4)
         return surface
         
-    def get_animation_frame(self, state, facing_right, frame_counter):
-        """Get the current animation frame for the given state"""
+    def frame_index(self, state, frame_counter):
+        """(state, index) of the animation frame to show; unknown states show idle"""
         if state not in self.sprites:
             state = 'idle'
-            
-        animation = self.sprites[state]
-        frame_index = int(frame_counter * self.animation_speed) % len(animation)
-        frame = animation[frame_index]
+        return state, int(frame_counter * self.animation_speed) % len(self.sprites[state])
+        
+    def get_frame(self, state, frame_counter):
+        """Shared, unflipped animation frame without its overlays"""
+        state, index = self.frame_index(state, frame_counter)
+        return self.sprites[state][index]
+        
+    def get_overlays(self, state, frame_counter):
+        """(stamp, offset) pairs drawn over the frame, offsets relative to its top left"""
+        state, index = self.frame_index(state, frame_counter)
+        overlays = self.overlays.get(state)
+        return overlays[index] if overlays else self.NO_OVERLAYS
+        
+    def render(self, renderer, state, frame_counter, pos, flip_x=False):
+        """Draw a frame and its overlays; the renderer mirrors them when flip_x is set
+        Overlays are attack effects, so they are left out when the renderer has effects turned off.
+        """
+        frame = self.get_frame(state, frame_counter)
+        renderer.blit(frame, pos, flip_x=flip_x)
+        if not renderer.effects:
+            return
+        for stamp, (offset_x, offset_y) in self.get_overlays(state, frame_counter):
+            if flip_x:
+                offset_x = frame.get_width() - offset_x - stamp.get_width()
+            renderer.blit(stamp, (pos[0] + offset_x, pos[1] + offset_y), flip_x=flip_x)
         
+    def get_animation_frame(self, state, facing_right, frame_counter):
+        """Get the current animation frame for the given state"""
         # Create a copy of the frame before flipping
-        frame = frame.copy()
+        frame = self.get_frame(state, frame_counter).copy()
+        for stamp, offset in self.get_overlays(state, frame_counter):
+            frame.blit(stamp, offset)
         
         # Flip the sprite if facing left
         if not facing_right:
             frame = pygame.transform.flip(frame, True, False)
             
-        return frame 
\ No newline at end of file
+        return frame
+
+    def memory_usage(self):
+        """Pixel bytes for this character's frames, shared and as separate copies
+        Returns:
+            dict: 'frames' and 'surfaces' counts, 'unshared_bytes' if every frame
+            were its own surface with its effects baked in, and 'bytes' actually held
+        """
+        frames = [frame for animation in self.sprites.values() for frame in animation]
+        unique = {id(frame): frame for frame in frames}
+        stamps = {
+            id(stamp): stamp
+            for animation in self.overlays.values() for overlays in animation for stamp, _ in overlays
+        }
+        size = lambda surface: surface.get_pitch() * surface.get_height()
+        return {
+            'frames': len(frames),
+            'surfaces': len(unique) + len(stamps),
+            'unshared_bytes': sum(size(frame) for frame in frames),
+            'bytes': sum(size(surface) for surface in list(unique.values()) + list(stamps.values())),
+        }
@@ -0,0 +1,173 @@
+import gc
+import json
+import threading
+import time
+from collections import deque
+
+class _Section:
+    """Reusable timing context for one profiler section"""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, self.start, time.perf_counter())
+        return False
+
+class _NullSection:
+    """Shared no-op context used while profiling is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+class FrameProfiler:
+    """Rolling per-subsystem frame timings, GC pauses and a Chrome trace buffer"""
+
+    SECTIONS = (
+        'events',
+        'input',  # Keyboard, touch and gamepad routing
+        'ai',
+        'character_update',
+        'collisions',
+        'stage_draw',
+        'character_draw',
+        'particles',
+        'hud',
+        'flip',
+    )
+
+    _instance = None
+    _null_section = _NullSection()
+
+    def __init__(self, history=300, trace_seconds=10):
+        self.enabled = False
+        self.history = history
+        self.trace_seconds = trace_seconds
+
+        # Rolling per-frame totals in milliseconds
+        self.timings = {name: deque(maxlen=history) for name in self.SECTIONS}
+        self.frame_times = deque(maxlen=history)
+        self.gc_pauses = deque(maxlen=history)
+
+        # (name, start, end) in perf_counter seconds for the trace dump
+        self.trace = deque()
+
+        self._sections = {}
+        self._lock = threading.Lock()  # The simulation thread records alongside the main thread
+        self._frame_totals = dict.fromkeys(self.SECTIONS, 0.0)
+        self._frame_start = None
+        self._gc_start = None
+
+    @staticmethod
+    def get():
+        """Get the shared profiler instance"""
+        if FrameProfiler._instance is None:
+            FrameProfiler._instance = FrameProfiler()
+        return FrameProfiler._instance
+
+    def set_enabled(self, enabled):
+        """Start or stop collecting timings"""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            gc.callbacks.append(self._gc_callback)
+        else:
+            gc.callbacks.remove(self._gc_callback)
+            self._frame_start = None
+
+    def toggle(self):
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def section(self, name):
+        """Context manager timing one subsystem; free when profiling is off"""
+        if not self.enabled:
+            return FrameProfiler._null_section
+        # One timing context per thread, so both pipeline threads can time the same section
+        key = (name, threading.get_ident())
+        section = self._sections.get(key)
+        if section is None:
+            section = self._sections[key] = _Section(self, name)
+        return section
+
+    def record(self, name, start, end):
+        """Add a timed span to the current frame"""
+        with self._lock:
+            self._frame_totals[name] = self._frame_totals.get(name, 0.0) + (end - start) * 1000
+        self.trace.append((name, start, end))
+
+    def begin_frame(self):
+        """Close the previous frame and start timing a new one"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.frame_times.append((now - self._frame_start) * 1000)
+            for name, total in self._frame_totals.items():
+                self.timings.setdefault(name, deque(maxlen=self.history)).append(total)
+                self._frame_totals[name] = 0.0
+            self.trace.append(('frame', self._frame_start, now))
+
+            # Keep only the last few seconds of trace events
+            cutoff = now - self.trace_seconds
+            while self.trace and self.trace[0][1] < cutoff:
+                self.trace.popleft()
+        self._frame_start = now
+
+    def _gc_callback(self, phase, info):
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            end = time.perf_counter()
+            self.gc_pauses.append((end - self._gc_start) * 1000)
+            self.trace.append((f"gc gen{info.get('generation', 0)}", self._gc_start, end))
+            self._gc_start = None
+
+    @staticmethod
+    def percentiles(values, points=(50, 95, 99)):
+        """Nearest-rank percentiles of a sequence"""
+        if not values:
+            return {point: 0.0 for point in points}
+        ordered = sorted(values)
+        last = len(ordered) - 1
+        return {point: ordered[min(last, int(round(point / 100 * last)))] for point in points}
+
+    def averages(self):
+        """Average milliseconds per frame for each section"""
+        return {
+            name: (sum(values) / len(values) if values else 0.0)
+            for name, values in self.timings.items()
+        }
+
+    def chrome_trace(self):
+        """Recorded spans in Chrome trace event format"""
+        events = []
+        # Snapshot first: a GC pause can append to the trace while we build events
+        for name, start, end in list(self.trace):
+            events.append({
+                'name': name,
+                'cat': 'gc' if name.startswith('gc') else 'frame',
+                'ph': 'X',
+                'ts': start * 1e6,
+                'dur': (end - start) * 1e6,
+                'pid': 0,
+                'tid': 1 if name.startswith('gc') else 0,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump_chrome_trace(self, path):
+        """Write the last few seconds of spans to a JSON file for chrome://tracing"""
+        with open(path, 'w') as trace_file:
+            json.dump(self.chrome_trace(), trace_file)
+        print(f"Wrote profiler trace with {len(self.trace)} events to: {path}")
+        return path
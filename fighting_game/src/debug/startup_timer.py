@@ -0,0 +1,27 @@
+import time
+
+class StartupTimer:
+    """Wall-clock marks from process start to the first frame and beyond"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []  # (phase name, seconds since start)
+
+    def mark(self, name):
+        self.marks.append((name, time.perf_counter() - self.start))
+
+    def elapsed_ms(self, name):
+        """Milliseconds from start to a phase, or None if it was not reached"""
+        for mark_name, seconds in self.marks:
+            if mark_name == name:
+                return seconds * 1000
+        return None
+
+    def report(self):
+        """Text lines with each phase's duration and running total"""
+        lines = ["Startup timing:"]
+        previous = 0.0
+        for name, seconds in self.marks:
+            lines.append(f"  {name:<24}{(seconds - previous) * 1000:8.1f} ms  (total {seconds * 1000:7.1f} ms)")
+            previous = seconds
+        return lines
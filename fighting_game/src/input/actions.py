@@ -0,0 +1,31 @@
+import pygame
+
+class Action:
+    """Bit flags for everything a player can do in one tick"""
+
+    LEFT = 1 << 0
+    RIGHT = 1 << 1
+    UP = 1 << 2
+    DOWN = 1 << 3
+    JUMP = 1 << 4
+    PUNCH = 1 << 5
+    KICK = 1 << 6
+    THROW = 1 << 7
+    CONFIRM = 1 << 8
+
+    NONE = 0
+    NAMES = ('left', 'right', 'up', 'down', 'jump', 'punch', 'kick', 'throw', 'confirm')
+
+    # Keys that touch and gamepad presses stand in for on menu screens
+    MENU_KEYS = (
+        (UP, pygame.K_UP),
+        (DOWN, pygame.K_DOWN),
+        (LEFT, pygame.K_LEFT),
+        (RIGHT, pygame.K_RIGHT),
+        (CONFIRM, pygame.K_RETURN),
+    )
+
+    @staticmethod
+    def describe(mask):
+        """Readable list of the actions in a mask, for debugging"""
+        return [name for i, name in enumerate(Action.NAMES) if mask & (1 << i)]
@@ -0,0 +1,71 @@
+import time
+from array import array
+from .actions import Action
+
+class InputBuffer:
+    """Fixed-size ring of timestamped per-tick input samples
+    Presses stay queued for a few ticks, so a move pressed during a
+    cooldown still comes out on the first frame it is allowed.
+    """
+
+    # Ticks a press stays queued while the character is busy
+    WINDOWS = {
+        Action.JUMP: 4,
+        Action.UP: 4,
+        Action.PUNCH: 8,
+        Action.KICK: 8,
+        Action.THROW: 8,
+    }
+
+    def __init__(self, size=32, windows=None):
+        self.size = size
+        self.windows = dict(self.WINDOWS)
+        if windows:
+            self.windows.update(windows)
+        self.longest_window = max(self.windows.values())
+
+        self.times = array('d', bytes(8 * size))
+        self.held = array('H', bytes(2 * size))
+        self.pressed = array('H', bytes(2 * size))  # Bits are cleared once consumed
+        self.tick = -1  # Samples recorded so far, minus one; the newest slot is tick % size
+        self.last_press_tick = -size  # Lets find() skip the scan on idle ticks
+
+    def record(self, held, pressed, timestamp=None):
+        """Store this tick's sample and return its slot"""
+        self.tick += 1
+        slot = self.tick % self.size
+        self.times[slot] = time.perf_counter() if timestamp is None else timestamp
+        self.held[slot] = held
+        self.pressed[slot] = pressed
+        if pressed:
+            self.last_press_tick = self.tick
+        return slot
+
+    def find(self, bit, window=None):
+        """Slot of the oldest unconsumed press of `bit` in the window, or -1"""
+        if window is None:
+            window = self.windows.get(bit, 0)
+        if self.tick - self.last_press_tick > window:
+            return -1
+        oldest = -1
+        for age in range(min(window + 1, self.tick + 1, self.size)):
+            slot = (self.tick - age) % self.size
+            if self.pressed[slot] & bit:
+                oldest = slot
+        return oldest
+
+    def idle(self):
+        """True when no press is recent enough to still be buffered"""
+        return self.tick - self.last_press_tick > self.longest_window
+
+    def consume(self, slot, bit):
+        """Mark a buffered press as used so it fires only once"""
+        self.pressed[slot] &= ~bit
+
+    def age(self, slot):
+        """Ticks since the sample in `slot` was recorded"""
+        return (self.tick - slot) % self.size
+
+    def clear(self):
+        for slot in range(self.size):
+            self.pressed[slot] = Action.NONE
@@ -0,0 +1,185 @@
+import pygame
+from .actions import Action
+
+class InputRouter:
+    """Routes keyboard layouts, gamepads and touch to player slots
+    Every device folds into its player's action bitmask, sampled once per tick.
+    """
+
+    MAX_PLAYERS = 2
+
+    # One physical keyboard, split into layouts that can belong to different players
+    KEYBOARD_LAYOUTS = {
+        'wasd': {
+            pygame.K_a: Action.LEFT,
+            pygame.K_d: Action.RIGHT,
+            pygame.K_w: Action.UP,
+            pygame.K_s: Action.DOWN,
+            pygame.K_j: Action.PUNCH,
+            pygame.K_k: Action.KICK,
+            pygame.K_l: Action.THROW,
+        },
+        'arrows': {
+            pygame.K_LEFT: Action.LEFT,
+            pygame.K_RIGHT: Action.RIGHT,
+            pygame.K_UP: Action.UP,
+            pygame.K_DOWN: Action.DOWN,
+            pygame.K_SPACE: Action.JUMP,
+            pygame.K_z: Action.PUNCH,
+            pygame.K_x: Action.KICK,
+            pygame.K_c: Action.THROW,
+            pygame.K_KP1: Action.PUNCH,
+            pygame.K_KP2: Action.KICK,
+            pygame.K_KP3: Action.THROW,
+            pygame.K_RETURN: Action.CONFIRM,
+        },
+    }
+
+    # Keyboard layout owners by player count: alone, player 1 has every key
+    LAYOUT_SLOTS = {
+        1: {'wasd': 0, 'arrows': 0},
+        2: {'wasd': 0, 'arrows': 1},
+    }
+
+    # Standard controller layout: A, B, X, Y, then Start
+    BUTTON_BINDINGS = {
+        0: Action.JUMP,
+        1: Action.KICK,
+        2: Action.PUNCH,
+        3: Action.THROW,
+        7: Action.CONFIRM,
+    }
+
+    AXIS_DEADZONE = 0.5
+    DIRECTIONS = Action.LEFT | Action.RIGHT | Action.UP | Action.DOWN
+
+    def __init__(self, touch_controls=None):
+        self.touch_controls = touch_controls  # Touch always drives player 1
+        self.player_count = 1
+        self.layout_slots = self.LAYOUT_SLOTS[1]
+
+        # Flat key -> (layout, bit) lookup over every layout
+        self.key_bindings = {
+            key: (layout, bit)
+            for layout, bindings in self.KEYBOARD_LAYOUTS.items()
+            for key, bit in bindings.items()
+        }
+        self.keyboard_masks = dict.fromkeys(self.KEYBOARD_LAYOUTS, Action.NONE)
+
+        # instance id -> {'joystick', 'slot', 'mask', 'stick'}
+        self.gamepads = {}
+
+        # Bits pressed since the last poll, so taps shorter than a tick still count
+        self.pressed_latch = [Action.NONE] * self.MAX_PLAYERS
+        # The subset of those presses that did not come from the keyboard
+        self.virtual_latch = [Action.NONE] * self.MAX_PLAYERS
+
+    def set_player_count(self, count):
+        """Re-split the keyboard when the number of human players changes"""
+        count = max(1, min(self.MAX_PLAYERS, count))
+        if count != self.player_count:
+            self.player_count = count
+            self.layout_slots = self.LAYOUT_SLOTS[count]
+
+    def held(self, slot):
+        """Actions currently held on any device belonging to a player"""
+        mask = Action.NONE
+        for layout, owner in self.layout_slots.items():
+            if owner == slot:
+                mask |= self.keyboard_masks[layout]
+        for pad in self.gamepads.values():
+            if pad['slot'] == slot:
+                mask |= pad['mask']
+        if slot == 0 and self.touch_controls:
+            mask |= self.touch_controls.mask
+        return mask
+
+    def add_gamepad(self, instance_id, joystick=None):
+        """Give a newly connected gamepad to the first player without one"""
+        taken = {pad['slot'] for pad in self.gamepads.values()}
+        slot = next((s for s in range(self.MAX_PLAYERS) if s not in taken), self.MAX_PLAYERS - 1)
+        self.gamepads[instance_id] = {'joystick': joystick, 'slot': slot, 'mask': Action.NONE, 'stick': [0, 0]}
+        print(f"Gamepad {instance_id} connected as player {slot + 1}")
+        return slot
+
+    def remove_gamepad(self, instance_id):
+        if self.gamepads.pop(instance_id, None) is not None:
+            print(f"Gamepad {instance_id} disconnected")
+
+    def handle_event(self, event):
+        """Update the masks from an event; returns True for touch/gamepad events"""
+        if event.type == pygame.KEYDOWN:
+            binding = self.key_bindings.get(event.key)
+            if binding:
+                layout, bit = binding
+                self.keyboard_masks[layout] |= bit
+                self.pressed_latch[self.layout_slots[layout]] |= bit
+        elif event.type == pygame.KEYUP:
+            binding = self.key_bindings.get(event.key)
+            if binding:
+                layout, bit = binding
+                self.keyboard_masks[layout] &= ~bit
+        elif event.type in (pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION):
+            if self.touch_controls:
+                self.press_virtual(0, self.touch_controls.handle_touch(event))
+            return True
+        elif event.type == pygame.JOYDEVICEADDED:
+            joystick = pygame.joystick.Joystick(event.device_index)
+            self.add_gamepad(joystick.get_instance_id(), joystick)
+            return True
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            self.remove_gamepad(event.instance_id)
+            return True
+        elif event.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+            pad = self.gamepads.get(event.instance_id)
+            bit = self.BUTTON_BINDINGS.get(event.button)
+            if pad and bit:
+                if event.type == pygame.JOYBUTTONDOWN:
+                    pad['mask'] |= bit
+                    self.press_virtual(pad['slot'], bit)
+                else:
+                    pad['mask'] &= ~bit
+            return True
+        elif event.type == pygame.JOYHATMOTION:
+            pad = self.gamepads.get(event.instance_id)
+            if pad:
+                self.set_gamepad_direction(pad, event.value[0], -event.value[1])
+            return True
+        elif event.type == pygame.JOYAXISMOTION:
+            pad = self.gamepads.get(event.instance_id)
+            if pad and event.axis in (0, 1):
+                pad['stick'][event.axis] = (event.value > self.AXIS_DEADZONE) - (event.value < -self.AXIS_DEADZONE)
+                self.set_gamepad_direction(pad, pad['stick'][0], pad['stick'][1])
+            return True
+        return False
+
+    def press_virtual(self, slot, bits):
+        self.pressed_latch[slot] |= bits
+        self.virtual_latch[slot] |= bits
+
+    def set_gamepad_direction(self, pad, x, y):
+        """Replace a gamepad's direction bits from a -1/0/1 pair (y down is positive)"""
+        direction = Action.NONE
+        if x < 0:
+            direction |= Action.LEFT
+        elif x > 0:
+            direction |= Action.RIGHT
+        if y < 0:
+            direction |= Action.UP
+        elif y > 0:
+            direction |= Action.DOWN
+        previous = pad['mask'] & self.DIRECTIONS
+        pad['mask'] = (pad['mask'] & ~previous) | direction
+        self.press_virtual(pad['slot'], direction & ~previous)
+
+    def poll(self):
+        """Sample this tick's input
+        Returns:
+            list of (held, pressed, virtual_pressed) action masks, one per player slot
+        """
+        frames = []
+        for slot in range(self.MAX_PLAYERS):
+            frames.append((self.held(slot), self.pressed_latch[slot], self.virtual_latch[slot]))
+            self.pressed_latch[slot] = Action.NONE
+            self.virtual_latch[slot] = Action.NONE
+        return frames
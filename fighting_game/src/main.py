@@ -1,111 +1,309 @@
-import pygame
 import sys
-from states.game_state import GameState
+import time
+from debug.startup_timer import StartupTimer
+
+# Started before anything heavy is imported
+STARTUP = StartupTimer()
+
+import pygame
 from states.menu_state import MenuState
+from states.state_manager import StateManager
+from states.simulation_pipeline import SimulationPipeline
 from ui.touch_controls import TouchControls
+from debug.frame_profiler import FrameProfiler
+from sound.audio_engine import AudioEngine
+from render.renderer import SoftwareRenderer
+from render.viewport import Viewport
+from render.quality_controller import QualityController
+STARTUP.mark("imports")
 
 class Game:
-    def __init__(self):
-        pygame.init()
+    RENDERERS = ('software', 'texture')
+    IDLE_TIMEOUT_MS = 500  # Static screens still wake this often for audio and saves
+
+    def __init__(self, startup_report=False, renderer='software', resolution=None, integer_scaling=False,
+                 adaptive_quality=True, pipelined=False):
+        # Only what the menu needs comes up before the first frame;
+        # audio starts with the first fight and gamepads right after the menu shows
+        pygame.display.init()
+        pygame.font.init()
         
-        # Get the current display info
+        # Every state draws on the same logical canvas; the display only decides the final scale
         info = pygame.display.Info()
-        self.SCREEN_WIDTH = info.current_w
-        self.SCREEN_HEIGHT = info.current_h
+        self.viewport = Viewport((info.current_w, info.current_h), resolution, integer_scaling)
+        self.base_internal_size = self.viewport.internal_size  # The quality controller scales down from here
+        self.SCREEN_WIDTH, self.SCREEN_HEIGHT = Viewport.LOGICAL_SIZE
         
-        # Set up fullscreen display with scaling
-        self.screen = pygame.display.set_mode(
-            (self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
-            pygame.FULLSCREEN | pygame.SCALED
-        )
+        self.renderer = None
+        if renderer == 'texture':
+            self.renderer = self.create_texture_renderer()
+        if self.renderer is None:
+            self.renderer = self.create_software_renderer()
+        self.full_renderer = self.renderer  # The software path switches back to it at full quality
+        print(f"Using the {self.renderer.name} renderer")
+        STARTUP.mark("display")
         
-        # Calculate scaling factors
-        self.scale_x = self.SCREEN_WIDTH / 1500  # Original width
-        self.scale_y = self.SCREEN_HEIGHT / 750  # Original height
+        # Lowers resolution and detail when frames run long, rather than slowing the fight down
+        self.quality = QualityController() if adaptive_quality else None
         
         # Initialize touch controls
-        self.touch_controls = TouchControls(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        self.touch_controls = TouchControls(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.viewport)
+        
+        # Frame profiler; its HUD is created the first time F3 is pressed, F4 dumps a Chrome trace
+        self.profiler = FrameProfiler.get()
+        self.profiler_overlay = None
         
-        pygame.display.set_caption("2D Fighter")
         self.clock = pygame.time.Clock()
         self.running = True
-        self.current_state = MenuState()
-        print(f"Game initialized in fullscreen mode: {self.SCREEN_WIDTH}x{self.SCREEN_HEIGHT}")
+        self.states = StateManager()
+        self.states.reset(MenuState)
+        self.dirty = True  # Something changed since the last frame was drawn
+        
+        # Pipelined states update on a simulation thread while the last tick is drawn
+        self.pipeline = SimulationPipeline() if pipelined else None
+        
+        # Show the menu before anything else starts up
+        self.draw()
+        STARTUP.mark("first frame")
+        
+        self.init_subsystems()
+        STARTUP.mark("subsystems")
+        print(f"Game initialized in fullscreen mode: {self.SCREEN_WIDTH}x{self.SCREEN_HEIGHT} logical, "
+              f"{self.viewport.internal_size[0]}x{self.viewport.internal_size[1]} internal, "
+              f"{self.viewport.display_size[0]}x{self.viewport.display_size[1]} display")
+        if startup_report:
+            print("\n".join(STARTUP.report()))
+
+    def create_software_renderer(self):
+        """Blit at the internal resolution and let SDL's SCALED mode do the final scale"""
+        if self.viewport.integer_scaling:
+            # SCALED letterboxes at any ratio, so whole-multiple scaling is done by the renderer
+            self.screen = pygame.display.set_mode(self.viewport.display_size, pygame.FULLSCREEN)
+            pygame.display.set_caption("2D Fighter")
+            canvas = pygame.Surface(self.viewport.internal_size).convert()
+            return SoftwareRenderer(canvas, Viewport.LOGICAL_SIZE, self.screen, self.viewport.rect)
+        
+        # Set up fullscreen display with scaling
+        self.screen = pygame.display.set_mode(self.viewport.internal_size, pygame.FULLSCREEN | pygame.SCALED)
+        pygame.display.set_caption("2D Fighter")
+        return SoftwareRenderer(self.screen, Viewport.LOGICAL_SIZE)
+
+    def create_texture_renderer(self):
+        """SDL2 texture renderer, or None to fall back to software blitting"""
+        try:
+            from render.texture_renderer import TextureRenderer
+            return TextureRenderer.create("2D Fighter", self.viewport)
+        except (ImportError, pygame.error) as e:
+            print(f"Texture renderer unavailable ({e}), falling back to software")
+            return None
+
+    def apply_quality(self, level):
+        """Switch the renderer to one of the quality controller's levels"""
+        settings = QualityController.LEVELS[level]
+        base_w, base_h = self.base_internal_size
+        size = (int(base_w * settings['resolution']), int(base_h * settings['resolution']))
+        if size != self.renderer.internal_size:
+            if self.renderer.name == 'texture':
+                self.renderer.set_internal_size(size)
+            elif size == self.base_internal_size:
+                self.renderer = self.full_renderer
+            else:
+                # Draw on a smaller canvas and scale it up to the display at present
+                present_rect = self.viewport.rect if self.viewport.integer_scaling else self.screen.get_rect()
+                canvas = pygame.Surface(size).convert()
+                self.renderer = SoftwareRenderer(canvas, Viewport.LOGICAL_SIZE, self.screen, present_rect)
+        self.renderer.effects = settings['effects']
+        self.renderer.background = settings['background']
+        self.dirty = True
+        print(f"Render quality: {settings['name']} at {size[0]}x{size[1]}")
 
-    def handle_events(self):
-        for event in pygame.event.get():
+    @property
+    def current_state(self):
+        return self.states.current
+
+    def apply_transition(self, transition, source):
+        """Apply a state's transition and log where it came from
+        Returns:
+            bool: whether the current state changed
+        """
+        if transition is None:
+            return False
+        previous = self.current_state.__class__.__name__
+        self.states.apply(transition)
+        self.dirty = True
+        if self.pipeline:
+            self.pipeline.invalidate()
+        print(f"State transition from {source} ({transition.op}): {previous} -> {self.current_state.__class__.__name__}")
+        return True
+
+    def init_subsystems(self):
+        """Start what the first menu frame does not need"""
+        from input.input_router import InputRouter
+        from save.campaign_save import CampaignSave
+        from characters.roster import Roster
+        from ui.clips import ClipLibrary
+        from resources.showcase_loader import ShowcaseLoader
+        pygame.joystick.init()
+        
+        # One small read of the campaign journal; saves are written in the background
+        self.save = CampaignSave.get()
+        
+        # Boss order and portraits, so the campaign screens do no lookups or scaling per frame
+        Roster.get()
+        
+        # Win/lose pictures decoded in the background are handed over once per update
+        self.showcase = ShowcaseLoader.get()
+        
+        # Generated prize animations and intros, so those screens open without drawing
+        ClipLibrary.get().preload()
+        
+        # Keyboards, touch and gamepads fold into per-player action masks each tick
+        self.input_router = InputRouter(self.touch_controls)
+
+    def wait_for_events(self):
+        """Sleep until an event arrives or the idle timeout passes
+        Returns:
+            list: the events that woke the loop, empty on timeout
+        """
+        event = pygame.event.wait(self.IDLE_TIMEOUT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def handle_events(self, events=None):
+        self.input_router.set_player_count(self.current_state.player_count)
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:  # Allow escape to exit fullscreen
                     self.running = False
+                elif event.key == pygame.K_F3:
+                    if self.profiler_overlay is None:
+                        from ui.profiler_overlay import ProfilerOverlay
+                        self.profiler_overlay = ProfilerOverlay(self.profiler)
+                    self.profiler.toggle()
+                    continue
+                elif event.key == pygame.K_F4:
+                    self.profiler.dump_chrome_trace("profile_trace.json")
+                    continue
             
-            # Handle touch events
-            elif event.type in (pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION):
-                touch_state = self.touch_controls.handle_touch(event)
-                # Convert touch states to keyboard events
-                events = []
-                
-                # For FINGERDOWN events, also send a generic KEYDOWN event for round transitions
-                if event.type == pygame.FINGERDOWN:
-                    events.append(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_RETURN}))
-                
-                # Movement
-                if touch_state['move'] != 0:
-                    key = pygame.K_RIGHT if touch_state['move'] > 0 else pygame.K_LEFT
-                    events.append(pygame.event.Event(pygame.KEYDOWN, {'key': key}))
-                
-                # Jump (either up button or jump button)
-                if touch_state['up'] or touch_state['jump']:
-                    events.append(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_SPACE}))
-                
-                # Attack buttons
-                if touch_state['punch']:
-                    events.append(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_z}))
-                if touch_state['kick']:
-                    events.append(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_x}))
-                
-                # Send all generated events to the current state
-                for touch_event in events:
-                    next_state = self.current_state.handle_event(touch_event)
-                    if next_state is not None:
-                        print(f"State transition: {self.current_state.__class__.__name__} -> {next_state.__class__.__name__}")
-                        self.current_state = next_state
-                        break
-                continue
+            # Touch and gamepad input only feed the action masks
+            with self.profiler.section('input'):
+                if self.input_router.handle_event(event):
+                    continue
             
             # Let the current state handle other events
-            next_state = self.current_state.handle_event(event)
-            if next_state is not None:
-                print(f"State transition: {self.current_state.__class__.__name__} -> {next_state.__class__.__name__}")
-                self.current_state = next_state
+            self.apply_transition(self.current_state.handle_event(event), 'event')
+
+    def sample_input(self):
+        """Hand each player's actions to the state, once, right before it updates"""
+        frames = self.input_router.poll()
+        for player in range(self.current_state.player_count):
+            if self.apply_transition(self.current_state.handle_input(*frames[player], player=player), 'input'):
+                break
 
     def update(self):
+        self.before_update()
+        
         # Update current state and check for state transition
-        next_state = self.current_state.update()
-        if next_state is not None:
-            print(f"State transition from update: {self.current_state.__class__.__name__} -> {next_state.__class__.__name__}")
-            self.current_state = next_state
+        self.apply_transition(self.current_state.update(), 'update')
+
+    def before_update(self):
+        """Main thread work ahead of each state update: input, audio and finished loads"""
+        self.sample_input()
+        audio = AudioEngine.started()
+        if audio:
+            audio.update()
+        if self.showcase.run_callbacks():
+            self.dirty = True  # A placeholder was swapped for its full picture
+
+    def update_and_draw_pipelined(self):
+        """Draw the last finished tick while the simulation thread runs the next one"""
+        self.before_update()
+        state = self.current_state
+        if not state.pipelined:  # Input just switched to a screen that is not pipelined
+            self.apply_transition(state.update(), 'update')
+            self.draw()
+            return
+        snapshot = self.pipeline.front(state)
+        self.pipeline.start(state)
+        try:
+            self.draw(snapshot)
+        finally:
+            transition = self.pipeline.finish()
+        self.apply_transition(transition, 'update')
 
-    def draw(self):
-        self.screen.fill((0, 0, 0))  # Clear screen with black
-        self.current_state.draw(self.screen)
+    def draw(self, snapshot=None):
+        self.renderer.clear((0, 0, 0))  # Clear screen with black
+        if snapshot is None:
+            self.current_state.render(self.renderer)
+        else:
+            self.current_state.render_snapshot(self.renderer, snapshot)
         
         # Draw touch controls on top
-        self.touch_controls.draw(self.screen)
+        with self.profiler.section('hud'):
+            self.touch_controls.render(self.renderer)
+            if self.profiler_overlay:
+                self.profiler_overlay.render(self.renderer)
         
-        pygame.display.flip()
+        # One presented frame, whichever backend drew it
+        with self.profiler.section('flip'):
+            self.renderer.present()
 
     def run(self):
         while self.running:
-            self.clock.tick(60)  # Target 60 FPS
-            self.handle_events()
-            self.update()
-            self.draw()
+            animating = self.current_state.is_animating() or self.profiler.enabled
+            if animating or self.dirty:
+                self.clock.tick(60)  # Target 60 FPS
+                events = pygame.event.get()
+            else:
+                # Nothing on screen moves: sleep until input instead of redrawing the same frame
+                events = self.wait_for_events()
+                self.clock.tick()  # Restart frame timing after the wait
+            self.dirty = self.dirty or bool(events)
+            self.profiler.begin_frame()
+            start = time.perf_counter()
+            with self.profiler.section('events'):
+                self.handle_events(events)
+            if self.pipeline and self.current_state.pipelined:
+                self.update_and_draw_pipelined()
+            else:
+                self.update()
+                if not (animating or self.dirty):
+                    continue
+                self.draw()
+            self.dirty = False
+            if self.quality and animating:  # Redraws after input on a static screen say little about load
+                level = self.quality.record((time.perf_counter() - start) * 1000)
+                if level is not None:
+                    self.apply_quality(level)
 
+        # Exit states top first so each releases its music and resources
+        self.states.shutdown()
+        self.save.shutdown()  # Finish any queued save writes
+        if self.pipeline:
+            self.pipeline.shutdown()
+        audio = AudioEngine.started()
+        if audio:
+            audio.shutdown()
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
-    game = Game()
+    renderer = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--renderer=')), 'software')
+    if renderer not in Game.RENDERERS:
+        sys.exit(f"Unknown renderer '{renderer}', expected one of: {', '.join(Game.RENDERERS)}")
+    resolution = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--resolution=')), None)
+    game = Game(
+        startup_report='--startup-report' in sys.argv,
+        renderer=renderer,
+        resolution=Viewport.parse_size(resolution) if resolution else None,
+        integer_scaling='--integer-scaling' in sys.argv,
+        adaptive_quality='--fixed-quality' not in sys.argv,
+        pipelined='--pipelined' in sys.argv,
+    )
+    if '--quit-after-startup' in sys.argv:
+        pygame.quit()
+        sys.exit()
     game.run() 
\ No newline at end of file
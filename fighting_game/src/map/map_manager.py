@@ -1,5 +1,5 @@
 import pygame
-import os
+from resources.asset_registry import AssetRegistry
 
 class MapManager:
     def __init__(self, width, height, stage_id):
@@ -10,10 +10,8 @@ class MapManager:
         # Load background image based on stage
         try:
             if self.stage_id == 'niall':  # Stage 3 has a specific background
-                bg_path = os.path.join("fighting_game", "assets", "images", "stage", "fight_niall.png")
-                if not os.path.exists(bg_path):
-                    bg_path = os.path.join("assets", "images", "stage", "fight_niall.png")
-                if os.path.exists(bg_path):
+                bg_path = AssetRegistry.get().path('stage', 'niall')
+                if bg_path:
                     print(f"Loading Niall's stage background from: {bg_path}")
                     self.background = pygame.image.load(bg_path)
                     self.background = pygame.transform.scale(self.background, (width, height))
@@ -23,15 +21,12 @@ class MapManager:
                 print("Creating default background")
                 self.background = pygame.Surface((width, height))
                 
-                # Fill with a gradient sky
-                for y in range(height):
-                    # Create a gradient from light blue to darker blue
-                    color = (
-                        max(100, 135 - int(y * 0.2)),  # Red
-                        max(100, 206 - int(y * 0.2)),  # Green
-                        max(100, 235 - int(y * 0.2))   # Blue
-                    )
-                    pygame.draw.line(self.background, color, (0, y), (width, y))
+                # Fill with a gradient sky, one fill per run of rows sharing a colour
+                top = 0
+                for y in range(1, height + 1):
+                    if y == height or self.sky_gradient(y) != self.sky_gradient(top):
+                        self.background.fill(self.sky_gradient(top), (0, top, width, y - top))
+                        top = y
                 
                 # Add some simple clouds
                 cloud_color = (255, 255, 255)
@@ -57,10 +52,21 @@ class MapManager:
             self.background = pygame.Surface((width, height))
             self.background.fill((0, 0, 0))
         
+        self.sky_color = None  # Flat background colour for low quality, found on first use
+        
         # Initialize obstacles
         self.obstacles = []
         self.init_obstacles()
         
+    @staticmethod
+    def sky_gradient(y):
+        """Default sky colour of row y, from light blue to darker blue"""
+        return (
+            max(100, 135 - int(y * 0.2)),  # Red
+            max(100, 206 - int(y * 0.2)),  # Green
+            max(100, 235 - int(y * 0.2))   # Blue
+        )
+        
     def init_obstacles(self):
         """Initialize stage obstacles"""
         # Add some platforms/obstacles
@@ -71,16 +77,21 @@ class MapManager:
         
         # No additional platforms - just the ground for better character movement
             
-    def draw(self, screen):
-        # Draw background (scaled to fit screen)
-        scaled_bg = pygame.transform.scale(self.background, (self.width, self.height))
-        screen.blit(scaled_bg, (0, 0))
+    def render(self, renderer):
+        # Draw background (already stage sized when it was loaded)
+        if renderer.background:
+            renderer.blit(self.background, (0, 0))
+        else:
+            # Low quality: a flat sky in the background's average colour
+            if self.sky_color is None:
+                self.sky_color = pygame.transform.average_color(self.background)[:3]
+            renderer.fill_rect(self.sky_color, (0, 0, self.width, self.height))
         
         # Draw ground platform
         ground = self.obstacles[0]
-        pygame.draw.rect(screen, (100, 100, 100), ground)  # Gray platform
+        renderer.fill_rect((100, 100, 100), ground)  # Gray platform
         # Add ground edge highlight
-        pygame.draw.line(screen, (150, 150, 150), ground.topleft, ground.topright, 4)  # Thicker line for better visibility
+        renderer.line((150, 150, 150), ground.topleft, ground.topright, 4)  # Thicker line for better visibility
             
     def check_collision(self, rect):
         """Check if a rectangle collides with any obstacles"""
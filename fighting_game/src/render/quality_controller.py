@@ -0,0 +1,73 @@
+from collections import deque
+
+class QualityController:
+    """Trades render quality for a steady frame rate
+    Fed the time each frame's work took. When the slow frames of the last
+    second run over budget it steps down a level; after a longer stretch
+    comfortably under budget it steps back up. The gap between the two
+    thresholds, a cooldown after every change and a growing delay after a
+    step up that did not hold keep it from flip-flopping between levels.
+    """
+
+    # Resolution is a fraction of the configured internal resolution. Only whole
+    # multiples are used: a software upscale by 4/3 costs more than it saves.
+    LEVELS = (
+        {'name': 'high', 'resolution': 1.0, 'effects': True, 'background': True},
+        {'name': 'medium', 'resolution': 1.0, 'effects': False, 'background': True},
+        {'name': 'low', 'resolution': 0.5, 'effects': False, 'background': False},
+    )
+
+    def __init__(self, budget_ms=1000 / 60, window=60, cooldown=60, raise_after=180):
+        self.budget_ms = budget_ms
+        self.lower_at = budget_ms * 0.9  # Leave headroom for event handling and the OS
+        self.raise_at = budget_ms * 0.55
+        self.window = window
+        self.cooldown = cooldown
+        self.base_raise_after = raise_after
+        self.raise_after = raise_after  # Frames under raise_at needed before stepping up
+
+        self.level = 0
+        self.frame_ms = deque(maxlen=window)
+        self.frames_until_check = cooldown
+        self.fast_frames = 0
+        self.frames_since_raise = None
+
+    @property
+    def settings(self):
+        return self.LEVELS[self.level]
+
+    def record(self, frame_ms):
+        """Add one frame's work time
+        Returns:
+            int or None: the new level if it changed
+        """
+        self.frame_ms.append(frame_ms)
+        self.fast_frames = self.fast_frames + 1 if frame_ms < self.raise_at else 0
+        if self.frames_since_raise is not None:
+            self.frames_since_raise += 1
+            if self.frames_since_raise >= self.raise_after:
+                self.frames_since_raise = None  # The last step up held
+        if self.frames_until_check > 0:
+            self.frames_until_check -= 1
+            return None
+        if len(self.frame_ms) < self.window:
+            return None
+
+        # The 90th percentile ignores the odd hitch from loading or GC
+        slow = sorted(self.frame_ms)[int(len(self.frame_ms) * 0.9)]
+        if slow > self.lower_at and self.level < len(self.LEVELS) - 1:
+            if self.frames_since_raise is not None and self.frames_since_raise < self.raise_after:
+                # The last step up could not hold; wait longer before trying again
+                self.raise_after = min(self.raise_after * 2, self.base_raise_after * 16)
+            return self.change(self.level + 1)
+        if self.fast_frames >= self.raise_after and self.level > 0:
+            self.frames_since_raise = 0
+            return self.change(self.level - 1)
+        return None
+
+    def change(self, level):
+        self.level = level
+        self.frame_ms.clear()
+        self.fast_frames = 0
+        self.frames_until_check = self.cooldown
+        return level
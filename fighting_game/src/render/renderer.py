@@ -0,0 +1,146 @@
+import weakref
+import pygame
+
+class Renderer:
+    """Drawing calls shared by the render backends
+    Images passed to blit() are treated as read-only: a backend may keep a
+    flipped copy or an uploaded texture of them for as long as they live.
+    Screens that still draw with pygame.draw get a plain surface from canvas().
+    """
+
+    name = None
+    TEXT_CACHE_SIZE = 256  # Rendered strings kept before the cache starts over
+
+    def __init__(self, size, internal_size=None):
+        self.size = size  # Logical size every caller draws in
+        self.internal_size = internal_size or size  # Pixels actually drawn
+        self.scale = self.internal_size[0] / size[0]
+        self.text_cache = {}  # (font, string, color) -> rendered surface
+
+        # Detail switches the quality controller turns off on slow hardware
+        self.effects = True  # Attack overlays and button shadows
+        self.background = True  # Full stage backgrounds rather than a flat sky
+
+    @property
+    def width(self):
+        return self.size[0]
+
+    @property
+    def height(self):
+        return self.size[1]
+
+    def text(self, font, string, color, **anchor):
+        """Draw a string, rendering it only the first time it is seen
+        Keyword arguments place it like Surface.get_rect, e.g. center=(x, y).
+        Returns:
+            pygame.Rect: where the text was drawn
+        """
+        key = (font, string, color)
+        image = self.text_cache.get(key)
+        if image is None:
+            if len(self.text_cache) >= self.TEXT_CACHE_SIZE:
+                self.text_cache.clear()
+            image = self.text_cache[key] = font.render(string, True, color)
+        rect = image.get_rect(**anchor)
+        self.blit(image, rect.topleft)
+        return rect
+
+    def blits(self, images):
+        """Draw many (image, pos) pairs, such as particles; backends may batch them"""
+        for image, pos in images:
+            self.blit(image, pos)
+
+class SoftwareRenderer(Renderer):
+    """Blits onto a pygame surface, normally the display; the default backend
+    With a logical size larger than the surface, coordinates are scaled down
+    and images are scaled once and kept, like their mirrored copies. Given a
+    separate display surface, present() scales the frame into present_rect
+    itself; otherwise the surface is the display and SDL's SCALED mode does it.
+    """
+
+    name = 'software'
+
+    def __init__(self, surface, logical_size=None, display=None, present_rect=None):
+        super().__init__(logical_size or surface.get_size(), surface.get_size())
+        self.surface = surface
+        self.display = display
+        self.present_rect = present_rect or (display.get_rect() if display else None)
+        self.flipped = weakref.WeakKeyDictionary()  # Image -> mirrored and/or scaled copy
+        self.logical_canvas = None  # Logical-size surface for canvas() when scaling
+        self.canvas_dirty = False
+
+    def clear(self, color):
+        self.canvas_dirty = False
+        self.surface.fill(color)
+
+    def canvas(self):
+        if self.scale == 1:
+            return self.surface
+        if self.logical_canvas is None:
+            self.logical_canvas = pygame.Surface(self.size, pygame.SRCALPHA)
+        if not self.canvas_dirty:
+            self.logical_canvas.fill((0, 0, 0, 0))
+            self.canvas_dirty = True
+        return self.logical_canvas
+
+    def flush_canvas(self):
+        """Scale what was drawn on the logical canvas down before anything drawn after it"""
+        if self.canvas_dirty:
+            self.surface.blit(pygame.transform.scale(self.logical_canvas, self.internal_size), (0, 0))
+            self.canvas_dirty = False
+
+    def prepare(self, image, flip_x):
+        """Mirrored and/or internal-resolution copy of an image, made once"""
+        variants = self.flipped.get(image)
+        if variants is None:
+            variants = self.flipped[image] = {}
+        prepared = variants.get(flip_x)
+        if prepared is None:
+            prepared = image
+            if self.scale != 1:
+                width, height = image.get_size()
+                prepared = pygame.transform.scale(
+                    prepared, (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+                )
+            if flip_x:
+                prepared = pygame.transform.flip(prepared, True, False)
+            variants[flip_x] = prepared
+        return prepared
+
+    def blit(self, image, pos, flip_x=False):
+        if self.scale == 1:
+            if flip_x:
+                image = self.prepare(image, True)
+            self.surface.blit(image, pos)
+            return
+        self.flush_canvas()
+        self.surface.blit(self.prepare(image, flip_x), (pos[0] * self.scale, pos[1] * self.scale))
+
+    def blits(self, images):
+        if self.scale == 1:
+            self.surface.blits(images, doreturn=False)
+            return
+        super().blits(images)
+
+    def fill_rect(self, color, rect, width=0):
+        if self.scale != 1:
+            self.flush_canvas()
+            rect = pygame.Rect(rect)
+            rect = (rect.x * self.scale, rect.y * self.scale, rect.width * self.scale, rect.height * self.scale)
+            width = max(1, round(width * self.scale)) if width else 0
+        pygame.draw.rect(self.surface, color, rect, width)
+
+    def line(self, color, start, end, width=1):
+        if self.scale != 1:
+            self.flush_canvas()
+            start = (start[0] * self.scale, start[1] * self.scale)
+            end = (end[0] * self.scale, end[1] * self.scale)
+            width = max(1, round(width * self.scale))
+        pygame.draw.line(self.surface, color, start, end, width)
+
+    def present(self):
+        self.flush_canvas()
+        if self.display is not None:
+            # Nearest-neighbour scale into the letterboxed viewport
+            pygame.transform.scale(self.surface, self.present_rect.size, self.display.subsurface(self.present_rect))
+        pygame.display.flip()
@@ -0,0 +1,131 @@
+import weakref
+import pygame
+from pygame._sdl2.video import Window, Renderer as SDLRenderer, Texture, error as SDLError
+from .renderer import Renderer
+from .viewport import Viewport
+
+class TextureRenderer(Renderer):
+    """SDL2 renderer backend: images become textures once, frames are composed on the GPU
+    Sprite flips are done by the renderer rather than transform.flip. Without
+    a GPU SDL's software renderer draws the same calls. The frame is drawn
+    into an internal-resolution target texture, which present() scales into
+    the viewport in one pass.
+    """
+
+    name = 'texture'
+    BLEND = 1  # SDL_BLENDMODE_BLEND
+
+    def __init__(self, window, viewport=None, accelerated=True):
+        self.window = window
+        self.sdl = SDLRenderer(window, accelerated=1 if accelerated else 0)
+        self.accelerated = accelerated
+        self.viewport = viewport or Viewport(window.size)
+        self.viewport.set_display_size(window.size)
+        super().__init__(Viewport.LOGICAL_SIZE, self.viewport.internal_size)
+        self.textures = weakref.WeakKeyDictionary()  # Image -> uploaded texture
+        self.target = Texture(self.sdl, self.internal_size, target=True)
+
+        # Surface drawing for screens that are not texture-aware yet, uploaded in draw order
+        self.canvas_surface = None
+        self.canvas_texture = None
+        self.canvas_dirty = False
+
+    @staticmethod
+    def create(title, viewport):
+        """Open a fullscreen window with a GPU renderer, or SDL's software one without a GPU
+        Raises:
+            pygame.error: if no window or renderer could be created at all
+        """
+        try:
+            window = Window(title, fullscreen_desktop=True)
+        except SDLError as e:
+            raise pygame.error(str(e))
+        try:
+            return TextureRenderer(window, viewport, accelerated=True)
+        except SDLError:
+            print("No accelerated renderer available, using SDL's software renderer")
+        try:
+            return TextureRenderer(window, viewport, accelerated=False)
+        except SDLError as e:
+            window.destroy()
+            raise pygame.error(str(e))
+
+    def set_internal_size(self, size):
+        """Draw at a different internal resolution from the next frame on
+        The frame still fills the same viewport on the display.
+        """
+        self.internal_size = size
+        self.scale = self.internal_size[0] / self.size[0]
+        self.target = Texture(self.sdl, self.internal_size, target=True)
+
+    def texture(self, image):
+        """The texture for an image, uploaded the first time it is drawn"""
+        texture = self.textures.get(image)
+        if texture is None:
+            texture = self.textures[image] = Texture.from_surface(self.sdl, image)
+        return texture
+
+    def clear(self, color):
+        self.canvas_dirty = False
+        # Draw in logical coordinates onto the internal-resolution target
+        self.sdl.target = self.target
+        self.sdl.scale = (self.scale, self.scale)
+        self.sdl.draw_color = pygame.Color(color)
+        self.sdl.clear()
+
+    def canvas(self):
+        if self.canvas_surface is None:
+            self.canvas_surface = pygame.Surface(self.size, pygame.SRCALPHA)
+            self.canvas_texture = Texture(self.sdl, self.size, streaming=True)
+            self.canvas_texture.blend_mode = self.BLEND
+        if not self.canvas_dirty:
+            self.canvas_surface.fill((0, 0, 0, 0))
+            self.canvas_dirty = True
+        return self.canvas_surface
+
+    def flush_canvas(self):
+        """Compose what was drawn on the canvas before anything drawn after it"""
+        if self.canvas_dirty:
+            self.canvas_texture.update(self.canvas_surface)
+            self.canvas_texture.draw()
+            self.canvas_dirty = False
+
+    def blit(self, image, pos, flip_x=False):
+        self.flush_canvas()
+        self.texture(image).draw(dstrect=pos, flip_x=flip_x)
+
+    def set_color(self, color):
+        color = pygame.Color(color)
+        self.sdl.draw_color = color
+        self.sdl.draw_blend_mode = self.BLEND if color.a < 255 else 0
+
+    def fill_rect(self, color, rect, width=0):
+        self.flush_canvas()
+        self.set_color(color)
+        rect = pygame.Rect(rect)
+        if width <= 0:
+            self.sdl.fill_rect(rect)
+            return
+        for _ in range(width):
+            self.sdl.draw_rect(rect)
+            rect.inflate_ip(-2, -2)
+
+    def line(self, color, start, end, width=1):
+        self.flush_canvas()
+        self.set_color(color)
+        # SDL lines are one pixel wide; thicker ones are stacked across the line
+        vertical = abs(end[0] - start[0]) < abs(end[1] - start[1])
+        for offset in range(-(width // 2), width - width // 2):
+            if vertical:
+                self.sdl.draw_line((start[0] + offset, start[1]), (end[0] + offset, end[1]))
+            else:
+                self.sdl.draw_line((start[0], start[1] + offset), (end[0], end[1] + offset))
+
+    def present(self):
+        """Scale the finished frame into the letterboxed viewport and show it"""
+        self.flush_canvas()
+        self.sdl.target = None
+        self.sdl.draw_color = pygame.Color(0, 0, 0)
+        self.sdl.clear()
+        self.target.draw(dstrect=self.viewport.rect)
+        self.sdl.present()
@@ -0,0 +1,53 @@
+import pygame
+
+class Viewport:
+    """Maps the fixed logical canvas onto the physical display
+    Simulation and drawing use LOGICAL_SIZE coordinates on every display.
+    Frames are drawn at the internal resolution (the logical size, or less
+    on weak hardware) and scaled to the display once, when presented.
+    """
+
+    LOGICAL_SIZE = (1600, 1200)
+    LOGICAL_WIDTH, LOGICAL_HEIGHT = LOGICAL_SIZE
+
+    def __init__(self, display_size, internal_size=None, integer_scaling=False):
+        self.internal_size = internal_size or self.LOGICAL_SIZE
+        self.integer_scaling = integer_scaling
+        self.set_display_size(display_size)
+
+    @property
+    def scale(self):
+        """Internal pixels per logical unit"""
+        return self.internal_size[0] / self.LOGICAL_WIDTH
+
+    @staticmethod
+    def parse_size(text):
+        """'800x600' -> (800, 600); the height is optional and keeps the logical aspect"""
+        width, _, height = text.lower().partition('x')
+        width = int(width)
+        if height:
+            return width, int(height)
+        return width, width * Viewport.LOGICAL_HEIGHT // Viewport.LOGICAL_WIDTH
+
+    def set_display_size(self, display_size):
+        self.display_size = display_size
+        self.rect = self.fit()
+
+    def fit(self):
+        """Where the internal canvas lands on the display, letterboxed"""
+        internal_w, internal_h = self.internal_size
+        display_w, display_h = self.display_size
+        scale = min(display_w / internal_w, display_h / internal_h)
+        if self.integer_scaling and scale >= 1:
+            scale = int(scale)  # Whole multiples only, for crisp pixels
+        width, height = int(internal_w * scale), int(internal_h * scale)
+        return pygame.Rect((display_w - width) // 2, (display_h - height) // 2, width, height)
+
+    def to_logical(self, x, y):
+        """Normalised window coordinates (as in touch events) to logical coordinates"""
+        px = x * self.display_size[0] - self.rect.x
+        py = y * self.display_size[1] - self.rect.y
+        return (
+            px * self.LOGICAL_WIDTH / self.rect.width,
+            py * self.LOGICAL_HEIGHT / self.rect.height,
+        )
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+
+class AssetRegistry:
+    """In-memory index of the assets tree
+    Built once at startup from assets/manifest.json, or by walking the tree
+    when there is no manifest, so lookups afterwards are dictionary hits with
+    no filesystem calls.
+    """
+
+    ROOTS = (
+        os.path.join("fighting_game", "assets"),
+        "assets",
+    )
+    MANIFEST = "manifest.json"
+
+    # Logical asset IDs: kind -> key -> path relative to the assets root
+    ASSETS = {
+        'character': {
+            'bren': 'images/faces/bren_char.png',
+            'lee': 'images/faces/lee_char.png',
+            'billy': 'images/faces/billy_char.png',
+            'niall': 'images/faces/niall_char.png',
+            'ciaran': 'images/faces/final_boss.png',
+        },
+        'win': {
+            0: 'images/win/mc_win.png',
+            'player': 'images/win/mc_win.png',
+        },
+        'lose': {
+            0: 'images/lose/mc_lose.png',
+            'player': 'images/lose/mc_lose.png',
+        },
+        'stage': {
+            'niall': 'images/stage/fight_niall.png',
+        },
+        'prize': {
+            2: 'images/prize/prize_2.png',
+            3: 'images/prize/prize_3.png',
+            'chest': 'images/prize/chest.png',
+        },
+        'music': {
+            'bren': 'sounds/stage_1.mid',
+            'billy': 'sounds/stage_2.mid',
+            'niall': 'sounds/stage_3.mid',
+            'ciaran': 'sounds/stage_4.mid',
+            99: 'sounds/stage_5.mid',  # Final battle
+            'default': 'sounds/stage_1.mid',
+        },
+        'policy': {
+            'boss': 'policies/boss_policy.npz',
+        },
+    }
+
+    # IDs whose loaders draw a fallback, so a missing file is not a build error
+    OPTIONAL = {('prize', 'chest')}
+
+    _instance = None
+
+    def __init__(self, root=None):
+        self.root = root or next((path for path in self.ROOTS if os.path.isdir(path)), None)
+        self.files = {}  # Relative path -> {'size', 'sha1'}, plus 'preview' for showcase pictures
+        self.source = None
+        if self.root is None:
+            print("Assets directory not found")
+        elif not self.load_manifest():
+            self.files = self.scan(self.root)
+            self.source = 'scan'
+        self.index = self.build_index()
+
+    @staticmethod
+    def get():
+        """Get the shared registry, indexing the assets on first use"""
+        if AssetRegistry._instance is None:
+            AssetRegistry._instance = AssetRegistry()
+        return AssetRegistry._instance
+
+    @staticmethod
+    def scan(root, with_hashes=False):
+        """Walk the assets tree once: relative path -> size (and hash)"""
+        files = {}
+        for directory, _, names in os.walk(root):
+            for name in names:
+                if name == AssetRegistry.MANIFEST:
+                    continue
+                path = os.path.join(directory, name)
+                relative = os.path.relpath(path, root).replace(os.sep, '/')
+                files[relative] = {
+                    'size': os.path.getsize(path),
+                    'sha1': AssetRegistry.hash_file(path) if with_hashes else None,
+                }
+        return files
+
+    @staticmethod
+    def hash_file(path):
+        digest = hashlib.sha1()
+        with open(path, 'rb') as asset_file:
+            for chunk in iter(lambda: asset_file.read(65536), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def load_manifest(self):
+        try:
+            with open(os.path.join(self.root, self.MANIFEST)) as manifest_file:
+                self.files = json.load(manifest_file)['files']
+        except (OSError, ValueError, KeyError):
+            return False
+        self.source = 'manifest'
+        return True
+
+    def build_index(self):
+        """Resolve every logical ID against the indexed files"""
+        index = {}
+        for kind, assets in self.ASSETS.items():
+            for key, relative in assets.items():
+                path = self.find(relative)
+                if path is not None:
+                    index[(kind, key)] = path
+        return index
+
+    def find(self, relative):
+        """Full path of an indexed file, or None"""
+        if relative in self.files:
+            return os.path.join(self.root, relative)
+        return None
+
+    def path(self, kind, key):
+        """Full path for a logical asset ID such as ('character', 'bren'), or None"""
+        return self.index.get((kind, key))
+
+    def info(self, kind, key):
+        """Size and hash recorded for a logical asset, or None"""
+        relative = self.ASSETS.get(kind, {}).get(key)
+        entry = self.files.get(relative)
+        if entry is None:
+            return None
+        if entry.get('sha1') is None:
+            entry['sha1'] = self.hash_file(os.path.join(self.root, relative))
+        return {'path': self.path(kind, key), **entry}
+
+    def missing(self):
+        """Logical IDs whose files are not in the index"""
+        return sorted(
+            ((kind, key, relative)
+             for kind, assets in self.ASSETS.items()
+             for key, relative in assets.items()
+             if relative not in self.files and (kind, key) not in self.OPTIONAL),
+            key=str
+        )
@@ -0,0 +1,134 @@
+import base64
+import queue
+import threading
+import pygame
+from .asset_registry import AssetRegistry
+
+class ShowcaseLoader:
+    """Decodes the large win/lose pictures on a background thread
+    request() answers at once with a placeholder: the manifest's tiny preview
+    blown up to the display size, or the caller's fallback when there is none.
+    The full picture is decoded and scaled on the worker, and only the scaled
+    copy is kept. Callbacks receive it back on the main thread from
+    run_callbacks(). Each (path, size) is decoded once: requests made while
+    it is in flight share the decode, and later ones get the finished
+    picture straight away.
+    """
+
+    PREVIEW_WIDTH = 16  # Pixels across for the previews stored in the manifest
+    SHOWCASE_DIRS = ('images/win/', 'images/lose/')  # Pictures that get a preview
+
+    _instance = None
+
+    def __init__(self, registry=None, loader=None):
+        self.registry = registry or AssetRegistry.get()
+        self.loader = loader or pygame.image.load
+        self.requests = queue.Queue()
+        self.finished = queue.Queue()
+        self.pending = {}  # (path, size) -> callbacks waiting for that decode
+        self.decoded = {}  # (path, size) -> finished picture
+        self.thread = None
+
+    @staticmethod
+    def get():
+        """Get the shared loader"""
+        if ShowcaseLoader._instance is None:
+            ShowcaseLoader._instance = ShowcaseLoader()
+        return ShowcaseLoader._instance
+
+    @staticmethod
+    def scale(image, size):
+        """Filtered scale where pygame supports it (24 and 32-bit images), nearest otherwise"""
+        try:
+            return pygame.transform.smoothscale(image, size)
+        except ValueError:
+            return pygame.transform.scale(image, size)
+
+    @staticmethod
+    def make_preview(path, width=PREVIEW_WIDTH):
+        """Manifest entry for a picture's preview: its size and base64 RGBA pixels"""
+        image = pygame.image.load(path)
+        height = max(1, round(image.get_height() * width / image.get_width()))
+        preview = ShowcaseLoader.scale(image, (width, height))
+        return {
+            'size': [width, height],
+            'rgba': base64.b64encode(pygame.image.tobytes(preview, 'RGBA')).decode('ascii'),
+        }
+
+    def placeholder(self, relative, size):
+        """The manifest preview scaled up to size, or None when the manifest has none"""
+        preview = self.registry.files.get(relative, {}).get('preview')
+        if not preview:
+            return None
+        image = pygame.image.frombytes(base64.b64decode(preview['rgba']), tuple(preview['size']), 'RGBA')
+        return self.scale(image, size)
+
+    def request(self, kind, key, size, callback, fallback=None):
+        """Start decoding a picture at its display size
+        Args:
+            callback: called with the full-quality surface, on the main thread;
+                not called when the picture was already decoded
+            fallback: shown until then if the manifest has no preview
+        Returns:
+            pygame.Surface or None: what to show meanwhile, or the picture itself once decoded
+        """
+        path = self.registry.path(kind, key)
+        if path is None:
+            return fallback
+        request_key = (path, tuple(size))
+        if request_key in self.decoded:
+            return self.decoded[request_key]
+        if request_key in self.pending:
+            self.pending[request_key].append(callback)
+        else:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="showcase-loader", daemon=True)
+                self.thread.start()
+            self.pending[request_key] = [callback]
+            self.requests.put(request_key)
+        placeholder = self.placeholder(AssetRegistry.ASSETS[kind][key], size)
+        return placeholder if placeholder is not None else fallback
+
+    def run_callbacks(self):
+        """Hand finished pictures to their callbacks; call once per frame
+        Returns:
+            int: how many callbacks were called, so the caller knows to redraw
+        """
+        delivered = 0
+        while True:
+            try:
+                request_key, surface = self.finished.get_nowait()
+            except queue.Empty:
+                return delivered
+            callbacks = self.pending.pop(request_key, ())
+            if surface is None:
+                continue  # Could not be loaded; the placeholders stay
+            self.decoded[request_key] = surface
+            for callback in callbacks:
+                callback(surface)
+                delivered += 1
+
+    def wait(self, timeout=5.0):
+        """Block until every queued picture is decoded, then deliver them"""
+        if self.thread is None:
+            return self.run_callbacks()
+        done = threading.Event()
+        self.requests.put(done)
+        done.wait(timeout)
+        return self.run_callbacks()
+
+    def _run(self):
+        while True:
+            item = self.requests.get()
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            path, size = item
+            try:
+                image = self.loader(path)
+                # Only the displayed size is kept; the full-resolution decode is dropped here
+                surface = self.scale(image, size) if image.get_size() != size else image
+            except (pygame.error, OSError) as e:
+                print(f"Error loading showcase image {path}: {e}")
+                surface = None
+            self.finished.put((item, surface))
@@ -0,0 +1,166 @@
+import json
+import os
+import queue
+import threading
+
+class CampaignSave:
+    """Campaign progress kept in an append-only JSON-lines journal
+    The file is read once, at startup, in a single small read. After that
+    progress lives in memory and every change is appended as one line by a
+    background thread, so a slow SD card never costs a frame. Once the journal
+    grows past COMPACT_AFTER records it is rewritten as a one-line snapshot
+    through a temporary file and an atomic rename. A line torn by a crash or
+    power cut is ignored on load, losing at most the last boss defeat. If a
+    rewrite fails, nothing is appended until a later rewrite succeeds.
+    """
+
+    VERSION = 1
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".2d_fighter", "campaign.jsonl")
+    COMPACT_AFTER = 32  # Journal records before the file is rewritten as a snapshot
+
+    _instance = None
+
+    def __init__(self, path=None):
+        self.path = path or self.DEFAULT_PATH
+        self.completed_bosses = []
+        self.campaigns_won = 0
+        self.records = 0  # Lines in the journal after the header
+        self.journal_ok = False  # False until there is a readable journal to append to
+        self.commands = queue.Queue()
+        self.thread = None
+        self.load()
+
+    @staticmethod
+    def get():
+        """Get the shared save, loading it on first use"""
+        if CampaignSave._instance is None:
+            CampaignSave._instance = CampaignSave()
+        return CampaignSave._instance
+
+    def load(self):
+        """Replay the journal into memory"""
+        try:
+            with open(self.path, 'rb') as save_file:
+                data = save_file.read()
+        except OSError:
+            return False
+
+        lines = data.splitlines()
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            header = {}
+        if header.get('version') != self.VERSION:
+            print(f"Ignoring campaign save with unknown format: {self.path}")
+            return False
+
+        damaged = not data.endswith(b"\n")
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                print(f"Skipping damaged campaign save record in: {self.path}")
+                damaged = True
+                continue
+            self.apply(record)
+            self.records += 1
+        # Appending after a torn line would glue the next record onto it, so compact first
+        self.journal_ok = not damaged
+        print(f"Loaded campaign progress: {len(self.completed_bosses)} bosses defeated")
+        return True
+
+    def apply(self, record):
+        """Apply one journal record to the in-memory progress"""
+        op = record.get('op')
+        if op == 'defeat' and record['boss'] not in self.completed_bosses:
+            self.completed_bosses.append(record['boss'])
+        elif op == 'complete':
+            self.completed_bosses = []
+            self.campaigns_won += 1
+        elif op == 'reset':
+            self.completed_bosses = []
+        elif op == 'snapshot':
+            self.completed_bosses = list(record['completed'])
+            self.campaigns_won = record.get('won', 0)
+
+    def record(self, op, **fields):
+        """Update progress now and queue the journal write"""
+        record = dict(op=op, **fields)
+        self.apply(record)
+        self.records += 1
+        if self.records > self.COMPACT_AFTER or not self.journal_ok:
+            # Also starts a missing or unreadable file from a fresh header
+            self.records = 1
+            self.journal_ok = True  # Appends can follow; the worker clears this if the rewrite fails
+            self.submit('compact', self.snapshot())
+        else:
+            self.submit('append', record)
+
+    def defeat(self, boss):
+        self.record('defeat', boss=boss)
+
+    def complete(self):
+        """The final battle was won; the next campaign starts from the first boss"""
+        self.record('complete')
+
+    def reset(self):
+        self.record('reset')
+
+    def snapshot(self):
+        return {'op': 'snapshot', 'completed': list(self.completed_bosses), 'won': self.campaigns_won}
+
+    def submit(self, command, record):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="save-worker", daemon=True)
+            self.thread.start()
+        self.commands.put((command, record))
+
+    def flush(self):
+        """Block until every queued write is on disk"""
+        if self.thread is not None:
+            self.commands.join()
+
+    def shutdown(self, timeout=2.0):
+        if self.thread is not None:
+            self.commands.put(None)
+            self.thread.join(timeout)
+            self.thread = None
+
+    def _run(self):
+        while True:
+            item = self.commands.get()
+            try:
+                if item is None:
+                    return
+                command, record = item
+                getattr(self, f"_{command}")(record)
+            except OSError as e:
+                print(f"Campaign save failed: {e}")
+                self.journal_ok = False  # The next record rewrites the whole journal
+            finally:
+                self.commands.task_done()
+
+    def _header(self):
+        return json.dumps({'format': 'campaign-journal', 'version': self.VERSION}) + "\n"
+
+    def _append(self, record):
+        if not self.journal_ok:
+            # The rewrite before this record failed, so there may be no header to append to
+            self._compact(self.snapshot())
+            return
+        with open(self.path, 'a') as save_file:
+            save_file.write(json.dumps(record, separators=(',', ':')) + "\n")
+            save_file.flush()
+            os.fsync(save_file.fileno())
+
+    def _compact(self, snapshot):
+        """Rewrite the journal as a header and one snapshot, swapped in atomically"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w') as save_file:
+            save_file.write(self._header())
+            save_file.write(json.dumps(snapshot, separators=(',', ':')) + "\n")
+            save_file.flush()
+            os.fsync(save_file.fileno())
+        os.replace(temp_path, self.path)
+        self.journal_ok = True
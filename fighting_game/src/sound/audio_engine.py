@@ -0,0 +1,166 @@
+import math
+from array import array
+import pygame
+from .music_worker import MusicWorker
+from resources.asset_registry import AssetRegistry
+
+class AudioEngine:
+    """Shared music and sound effect player
+    The mixer is initialised once, music paths come from the asset registry,
+    music loads on a worker thread, and sound effects play on a fixed pool
+    of channels with voice stealing.
+    """
+
+    # Effect name -> priority; a busy pool steals the lowest priority, oldest voice
+    EFFECTS = {
+        'block': 1,
+        'throw': 1,
+        'hit': 2,
+        'ko': 3,
+    }
+    SFX_CHANNELS = 6
+    CROSSFADE_MS = 600
+
+    _instance = None
+
+    def __init__(self, music_loader=None):
+        self.available = self._init_mixer()
+        self.assets = AssetRegistry.get()
+
+        # All music calls run on a worker so track changes never stall the frame
+        self.worker = MusicWorker(music_loader)
+        self.music_volume = 1.0
+        self.current_music = None  # Track requested most recently
+
+        self.sounds = {}
+        self.channels = []
+        self.channel_priority = []
+        self.channel_started = []
+        if self.available:
+            self.sounds = {name: self._load_effect(name) for name in self.EFFECTS}
+            pygame.mixer.set_reserved(self.SFX_CHANNELS)
+            self.channels = [pygame.mixer.Channel(i) for i in range(self.SFX_CHANNELS)]
+            self.channel_priority = [0] * self.SFX_CHANNELS
+            self.channel_started = [0] * self.SFX_CHANNELS
+
+    @staticmethod
+    def get():
+        """Get the shared audio engine, initialising the mixer on first use"""
+        if AudioEngine._instance is None:
+            AudioEngine._instance = AudioEngine()
+        return AudioEngine._instance
+
+    @staticmethod
+    def started():
+        """The shared engine if something has used audio yet, else None"""
+        return AudioEngine._instance
+
+    def _init_mixer(self):
+        if pygame.mixer.get_init():
+            return True
+        try:
+            pygame.mixer.init()
+            return True
+        except pygame.error as e:
+            print(f"Audio disabled: {e}")
+            return False
+
+    def _load_effect(self, name):
+        """Load assets/sounds/<name>.wav, or synthesise a placeholder"""
+        path = self.assets.find(f"sounds/{name}.wav")
+        if path:
+            try:
+                return pygame.mixer.Sound(path)
+            except pygame.error as e:
+                print(f"Error loading sound effect: {e}")
+        return self._synthesise(name)
+
+    @staticmethod
+    def _synthesise(name):
+        """Short generated tone so effects work without sample files"""
+        frequency, size, channels = pygame.mixer.get_init()
+        start_hz, end_hz, seconds = {
+            'hit': (220, 90, 0.12),
+            'block': (520, 480, 0.06),
+            'throw': (300, 700, 0.15),
+            'ko': (400, 60, 0.6),
+        }[name]
+        count = int(frequency * seconds)
+        samples = array('h')
+        phase = 0.0
+        for i in range(count):
+            t = i / count
+            phase += 2 * math.pi * (start_hz + (end_hz - start_hz) * t) / frequency
+            value = int(12000 * (1 - t) * math.sin(phase))
+            samples.extend([value] * channels)
+        return pygame.mixer.Sound(buffer=samples.tobytes())
+
+    def play_stage_music(self, stage_id):
+        """Play the music for a stage, crossfading from the current track"""
+        path = self.assets.path('music', stage_id) or self.assets.path('music', 'default')
+        if path is None:
+            print(f"Music file not found for stage: {stage_id}")
+            return
+        self.play_music(path)
+
+    def play_music(self, path, on_loaded=None):
+        """Queue a track change; on_loaded(ok) runs on the main thread once it has loaded"""
+        # Asking for the track that is already playing (or on its way) is free
+        if path == self.current_music or not self.available:
+            return
+        previous = self.current_music
+        self.current_music = path
+        self.worker.new_generation()
+        half = self.CROSSFADE_MS // 2
+        if previous is not None:
+            # Fade the old track out on the worker, then fade the new one in
+            self.worker.submit('fade', 0.0, half)
+            self.worker.submit('stop')
+        self.worker.submit('load', path, callback=on_loaded or self._on_music_loaded)
+        self.worker.submit('play', -1, half if previous is not None else 0, self.music_volume)
+
+    def _on_music_loaded(self, ok):
+        if not ok and self.current_music is not None:
+            print(f"Music unavailable: {self.current_music}")
+
+    def stop_music(self):
+        """Stop the currently playing music"""
+        self.current_music = None
+        if self.available:
+            self.worker.new_generation()
+            self.worker.submit('stop')
+
+    def update(self):
+        """Run finished music callbacks; call once per frame"""
+        if self.available:
+            self.worker.run_callbacks()
+
+    def shutdown(self):
+        """Stop the music worker before pygame quits"""
+        if self.available:
+            self.worker.shutdown()
+
+    def play_effect(self, name):
+        """Play a sound effect on a free channel, stealing one if the pool is full"""
+        if not self.available:
+            return None
+        priority = self.EFFECTS[name]
+        index = self._pick_channel(priority)
+        if index is None:
+            return None  # Every voice is busy with something more important
+        self.channels[index].play(self.sounds[name])
+        self.channel_priority[index] = priority
+        self.channel_started[index] = pygame.time.get_ticks()
+        return index
+
+    def _pick_channel(self, priority):
+        victim = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+            if self.channel_priority[i] > priority:
+                continue
+            if victim is None or (self.channel_priority[i], self.channel_started[i]) < \
+                    (self.channel_priority[victim], self.channel_started[victim]):
+                victim = i
+        return victim
@@ -0,0 +1,91 @@
+import queue
+import threading
+import time
+import pygame
+
+class MusicWorker:
+    """Background thread that owns pygame.mixer.music
+    Loading a MIDI file and starting the synth can take tens of milliseconds,
+    so the game loop only queues commands here. Completion callbacks are run
+    back on the main thread by run_callbacks().
+    """
+
+    FADE_STEP = 0.02  # Seconds between volume steps while fading
+
+    def __init__(self, loader=None):
+        self.loader = loader or pygame.mixer.music.load
+        self.commands = queue.Queue()
+        self.finished = queue.Queue()
+        self.generation = 0  # Bumped on every track change; older loads and plays are skipped
+        self.loaded = None
+        self.thread = None
+
+    def submit(self, command, *args, callback=None):
+        """Queue a 'load', 'play', 'stop' or 'fade' command"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="music-worker", daemon=True)
+            self.thread.start()
+        self.commands.put((command, args, self.generation, callback))
+
+    def new_generation(self):
+        """Drop any queued loads and plays for the previous track"""
+        self.generation += 1
+
+    def run_callbacks(self):
+        """Call the callbacks of finished commands; call once per frame"""
+        while True:
+            try:
+                callback, result = self.finished.get_nowait()
+            except queue.Empty:
+                return
+            callback(result)
+
+    def shutdown(self, timeout=1.0):
+        if self.thread is not None:
+            self.commands.put(None)
+            self.thread.join(timeout)
+            self.thread = None
+
+    def _run(self):
+        while True:
+            item = self.commands.get()
+            if item is None:
+                return
+            command, args, generation, callback = item
+            if command in ('load', 'play') and generation != self.generation:
+                result = False  # Superseded by a newer track
+            else:
+                try:
+                    result = getattr(self, f"_{command}")(*args)
+                except pygame.error as e:
+                    print(f"Music {command} failed: {e}")
+                    result = False
+            if callback is not None:
+                self.finished.put((callback, result))
+
+    def _load(self, path):
+        self.loaded = None
+        print(f"Loading stage music from: {path}")
+        self.loader(path)
+        self.loaded = path
+        return True
+
+    def _play(self, loops, fade_ms, volume):
+        if self.loaded is None:
+            return False
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops, fade_ms=fade_ms)
+        return True
+
+    def _stop(self):
+        pygame.mixer.music.stop()
+        return True
+
+    def _fade(self, volume, fade_ms):
+        """Ramp the music volume; only this thread waits on it"""
+        start = pygame.mixer.music.get_volume()
+        steps = max(1, int(fade_ms / 1000 / self.FADE_STEP))
+        for step in range(1, steps + 1):
+            pygame.mixer.music.set_volume(start + (volume - start) * step / steps)
+            time.sleep(self.FADE_STEP)
+        return True
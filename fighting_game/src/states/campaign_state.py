@@ -1,71 +1,99 @@
 import pygame
-from .game_state import GameState
+from .game_state import GameState, Transition
 from .fight_state import FightState
-from characters.boss_data import BossData
+from characters.roster import Roster
+from save.campaign_save import CampaignSave
+from ui.clips import ClipLibrary
+from ui.fonts import Fonts
 
 class CampaignState(GameState):
     def __init__(self):
         super().__init__()
-        self.font = pygame.font.Font(None, 36)
-        self.state = 'select'  # 'select', 'win', 'lose'
-        self.current_boss = 'bren'  # Start with first boss
-        self.boss_order = ['bren', 'billy', 'niall', 'ciaran']  # Updated boss order
-        self.completed_bosses = []
+        self.font = Fonts.get(36)
+        self.roster = Roster.get()
+        self.boss_order = self.roster.order
+        self.save = CampaignSave.get()
+        
+        # Prize images take a while to decode; load them before the first fight rather than after it
+        ClipLibrary.get().preload(('prize_2', 'prize_3'))
+        self.enter()
+        
+    def enter(self):
+        """Pick the campaign up from the first boss not yet defeated"""
+        self.state = 'select'  # 'select', 'win', 'lose', 'complete'
+        self.completed_bosses = list(self.save.completed_bosses)
+        self.in_final_battle = False
+        remaining = [boss for boss in self.boss_order if boss not in self.completed_bosses]
+        if remaining:
+            self.current_boss = remaining[0]
+        else:
+            # Every boss is down; ENTER goes straight to the final battle
+            self.current_boss = self.boss_order[-1]
+            self.state = 'win'
+        
+    def resume(self, result=None):
+        """Back from a fight ('win'/'lose') or a prize screen (None)"""
+        if result == 'win':
+            # Saved as soon as the boss falls, in the background
+            if self.current_boss not in self.completed_bosses:
+                self.completed_bosses.append(self.current_boss)
+                self.save.defeat(self.current_boss)
+            self.state = 'win'
+        elif result == 'lose':
+            self.state = 'lose'
+        elif self.in_final_battle:
+            # Back from the final prize; the next campaign starts over
+            self.save.complete()
+            self.state = 'complete'
+        elif self.state == 'win':
+            self.advance()
         
     def get_next_boss(self):
         """Get the next boss in the progression"""
-        current_index = self.boss_order.index(self.current_boss)
-        if current_index < len(self.boss_order) - 1:
-            return self.boss_order[current_index + 1]
-        return None
+        return self.roster.next(self.current_boss)
+        
+    def advance(self):
+        """Move on to the next boss after the prize screen"""
+        next_boss = self.get_next_boss()
+        if next_boss:
+            self.current_boss = next_boss
+            self.state = 'select'
         
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if self.state == 'select' and event.key == pygame.K_RETURN:
                 # Start fight with current boss
-                return FightState('player', self.current_boss, is_campaign=True)
+                return Transition.push(FightState('player', self.current_boss, is_campaign=True))
             elif self.state == 'win' and event.key == pygame.K_RETURN:
-                # Add current boss to completed list
-                if self.current_boss not in self.completed_bosses:
-                    self.completed_bosses.append(self.current_boss)
-                
                 # Check if all regular bosses are defeated
                 if len(self.completed_bosses) >= len(self.boss_order):
                     # Start final battle
                     from .final_battle_state import FinalBattleState
-                    return FinalBattleState()
+                    self.in_final_battle = True
+                    return Transition.push(FinalBattleState())
                     
-                # Get next boss
-                next_boss = self.get_next_boss()
-                if next_boss:
-                    self.current_boss = next_boss
-                    self.state = 'select'
-                else:
-                    # This shouldn't happen now that we have the final battle
-                    from .menu_state import MenuState
-                    return MenuState()
-            elif self.state == 'lose' and event.key == pygame.K_RETURN:
-                # Return to menu on loss
-                from .menu_state import MenuState
-                return MenuState()
+                # Collect this stage's prize, then move on to the next boss
+                from .prize_state import PrizeState
+                return Transition.push(PrizeState(self.roster.index(self.current_boss) + 1))
+            elif self.state in ('lose', 'complete') and event.key == pygame.K_RETURN:
+                # Return to menu
+                return Transition.pop()
         return None
         
-    def draw(self, screen):
-        screen.fill((0, 0, 0))  # Black background
+    def is_animating(self):
+        return False  # Only changes on input
+
+    def render(self, renderer):
+        center_x = renderer.width // 2
+        boss_data = self.roster.data(self.current_boss)
         
         if self.state == 'select':
-            # Draw current stage info
-            boss_data = BossData.get_boss_data(self.current_boss)
-            
-            # Draw boss preview
-            preview_surf = pygame.transform.scale(BossData.get_boss_face(self.current_boss), (200, 200))
-            preview_rect = preview_surf.get_rect(center=(screen.get_width() // 2, 200))
-            screen.blit(preview_surf, preview_rect)
+            # Draw boss preview, scaled once when the roster was built
+            preview = self.roster.portrait(self.current_boss, 200)
+            renderer.blit(preview, preview.get_rect(center=(center_x, 200)).topleft)
             
             # Draw boss name
-            name = self.font.render(f"VS {boss_data['name']}", True, boss_data['color'])
-            name_rect = name.get_rect(center=(screen.get_width() // 2, 350))
-            screen.blit(name, name_rect)
+            renderer.text(self.font, f"VS {boss_data['name']}", boss_data['color'], center=(center_x, 350))
             
             # Draw boss stats
             stats = [
@@ -75,41 +103,31 @@ class CampaignState(GameState):
             ]
             
             for i, stat in enumerate(stats):
-                text = self.font.render(stat, True, (255, 255, 255))
-                text_rect = text.get_rect(center=(screen.get_width() // 2, 400 + i * 30))
-                screen.blit(text, text_rect)
+                renderer.text(self.font, stat, (255, 255, 255), center=(center_x, 400 + i * 30))
                 
             # Draw prompt
-            prompt = self.font.render("Press ENTER to fight", True, (255, 255, 0))
-            prompt_rect = prompt.get_rect(center=(screen.get_width() // 2, 500))
-            screen.blit(prompt, prompt_rect)
+            renderer.text(self.font, "Press ENTER to fight", (255, 255, 0), center=(center_x, 500))
             
             # Draw progress
-            progress = self.font.render(f"Bosses Defeated: {len(self.completed_bosses)}/{len(self.boss_order)}", True, (255, 255, 255))
-            progress_rect = progress.get_rect(topleft=(20, 20))
-            screen.blit(progress, progress_rect)
+            renderer.text(self.font, f"Bosses Defeated: {len(self.completed_bosses)}/{len(self.boss_order)}",
+                          (255, 255, 255), topleft=(20, 20))
             
         elif self.state == 'win':
             # Draw victory text
-            text = self.font.render(f"You defeated {BossData.get_boss_data(self.current_boss)['name']}!", True, (0, 255, 0))
-            text_rect = text.get_rect(center=(screen.get_width() // 2, 200))
-            screen.blit(text, text_rect)
+            renderer.text(self.font, f"You defeated {boss_data['name']}!", (0, 255, 0), center=(center_x, 200))
             
-            if len(self.completed_bosses) >= len(self.boss_order) - 1:
+            if len(self.completed_bosses) >= len(self.boss_order):
                 # About to start final battle
-                prompt = self.font.render("Press ENTER to face your final challenge!", True, (255, 0, 0))
+                renderer.text(self.font, "Press ENTER to face your final challenge!", (255, 0, 0), center=(center_x, 300))
             else:
                 # More regular bosses to fight
-                prompt = self.font.render("Press ENTER to continue", True, (255, 255, 0))
-            prompt_rect = prompt.get_rect(center=(screen.get_width() // 2, 300))
-            screen.blit(prompt, prompt_rect)
+                renderer.text(self.font, "Press ENTER to continue", (255, 255, 0), center=(center_x, 300))
+            
+        elif self.state == 'complete':
+            renderer.text(self.font, "Campaign complete! You are the champion!", (255, 215, 0), center=(center_x, 200))
+            renderer.text(self.font, "Press ENTER to return to menu", (255, 255, 0), center=(center_x, 300))
             
         elif self.state == 'lose':
             # Draw defeat text
-            text = self.font.render(f"{BossData.get_boss_data(self.current_boss)['name']} defeated you!", True, (255, 0, 0))
-            text_rect = text.get_rect(center=(screen.get_width() // 2, 200))
-            screen.blit(text, text_rect)
-            
-            prompt = self.font.render("Press ENTER to return to menu", True, (255, 255, 0))
-            prompt_rect = prompt.get_rect(center=(screen.get_width() // 2, 300))
-            screen.blit(prompt, prompt_rect) 
\ No newline at end of file
+            renderer.text(self.font, f"{boss_data['name']} defeated you!", (255, 0, 0), center=(center_x, 200))
+            renderer.text(self.font, "Press ENTER to return to menu", (255, 255, 0), center=(center_x, 300))
@@ -1,12 +1,17 @@
 import pygame
-from .game_state import GameState
+from .game_state import GameState, Transition
 from .fight_state import FightState
+from ui.fonts import Fonts
 
 class CharacterSelectState(GameState):
     def __init__(self, ai_opponent=False, ai_difficulty='medium'):
         super().__init__()  # Initialize parent class
-        self.font = pygame.font.Font(None, 74)
+        self.font = Fonts.get(74)
         self.characters = ["Fighter 1", "Fighter 2"]
+        self.enter(ai_opponent, ai_difficulty)
+        
+    def enter(self, ai_opponent=False, ai_difficulty='medium'):
+        """Start a fresh selection; the instance is reused between visits"""
         self.selected_char = 0
         self.player1_selected = None
         self.player2_selected = None
@@ -28,26 +33,28 @@ class CharacterSelectState(GameState):
                         # AI automatically selects its character
                         self.player2_selected = (self.selected_char + 1) % len(self.characters)
                         print(f"Starting AI fight: P1={self.player1_selected}, P2={self.player2_selected}, Difficulty={self.ai_difficulty}")  # Debug print
-                        next_state = FightState(
+                        next_state = Transition.replace(FightState(
                             p1_char_id=self.player1_selected,
                             p2_char_id=self.player2_selected,
                             ai_opponent=True,
                             ai_difficulty=self.ai_difficulty
-                        )
+                        ))
                 elif not self.ai_opponent and self.player2_selected is None:
                     self.player2_selected = self.selected_char
                     print(f"Starting PvP fight: P1={self.player1_selected}, P2={self.player2_selected}")  # Debug print
-                    next_state = FightState(
+                    next_state = Transition.replace(FightState(
                         p1_char_id=self.player1_selected,
                         p2_char_id=self.player2_selected,
                         ai_opponent=False
-                    )
+                    ))
             elif event.key == pygame.K_ESCAPE:
-                from .menu_state import MenuState  # Import here to avoid circular import
-                next_state = MenuState()
+                next_state = Transition.pop()
                 print("Returning to menu")  # Debug print
         return next_state
 
+    def is_animating(self):
+        return False  # Only changes on input
+
     def update(self):
         return None
 
@@ -1,20 +1,49 @@
+import time
 import pygame
-from .game_state import GameState
+from .game_state import GameState, Transition
 from characters.character import Character
 from characters.ai_controller import AIController
+from characters.player_controller import PlayerController
+from characters.fight_simulator import FightSimulator
 from characters.boss_data import BossData
 from map.map_manager import MapManager
-from sound.sound_manager import SoundManager
+from sound.audio_engine import AudioEngine
+from debug.frame_profiler import FrameProfiler
+from input.actions import Action
+from render.viewport import Viewport
+from render.particles import ParticleSystem
+from ui.clips import ClipLibrary, ClipPlayer
+from ui.fonts import Fonts
+
+class FightSnapshot:
+    """A fight frame as it was at the end of a tick: fighters, particles and HUD values"""
+
+    __slots__ = ('fighters', 'particles', 'round_time', 'round_number', 'p1_rounds_won', 'p2_rounds_won',
+                 'round_state', 'winner', 'round_end_timer', 'intro_frame')
+
+    def __init__(self, fight):
+        self.fighters = (fight.p1.snapshot(),) + tuple(opp['character'].snapshot() for opp in fight.opponents)
+        self.particles = fight.particles.snapshot()
+        self.round_time = fight.round_time
+        self.round_number = fight.round_number
+        self.p1_rounds_won = fight.p1_rounds_won
+        self.p2_rounds_won = fight.p2_rounds_won
+        self.round_state = fight.round_state
+        self.winner = fight.winner
+        self.round_end_timer = fight.round_end_timer
+        self.intro_frame = fight.intro.frame if fight.intro is not None else None
 
 class FightState(GameState):
+    pipelined = True  # Everything render() needs is copied into a FightSnapshot
+    AI_TICK_BUDGET = 0.002  # Seconds of lookahead search every AI opponent shares in one tick
+
     def __init__(self, p1_char_id, p2_char_id, ai_opponent=False, ai_difficulty='medium', is_campaign=False, is_final_battle=False):
         super().__init__()  # Initialize parent class
-        self.font = pygame.font.Font(None, 72)  # 2x font size
+        self.font = Fonts.get(72)  # 2x font size
         self.round_time = 99 * 60  # 99 seconds in frames
         
-        # Screen dimensions (2x scale)
-        self.SCREEN_WIDTH = 1600  # 2x of 800
-        self.SCREEN_HEIGHT = 1200  # 2x of 600
+        # Logical arena size; the renderer scales it to the display
+        self.SCREEN_WIDTH, self.SCREEN_HEIGHT = Viewport.LOGICAL_SIZE
         
         # Campaign mode attributes
         self.is_campaign = is_campaign
@@ -26,8 +55,8 @@ class FightState(GameState):
         self.map_manager = MapManager(self.SCREEN_WIDTH, self.SCREEN_HEIGHT, stage_id)
         
         # Initialize sound manager and play stage music
-        self.sound_manager = SoundManager()
-        self.sound_manager.play_stage_music(stage_id)
+        self.audio = AudioEngine.get()
+        self.audio.play_stage_music(stage_id)
         
         # Initialize player character (2x positions)
         self.p1 = Character(400, 1000, char_id=p1_char_id, facing_right=True)  # Start on left
@@ -43,11 +72,13 @@ class FightState(GameState):
                     boss_data = BossData.get_boss_data(opponent_id)
                     if boss_data:
                         opponent.health *= boss_data['health_multiplier']
+                        opponent.max_health = opponent.health
                         opponent.speed *= boss_data['speed_multiplier']
                         opponent.damage_multiplier = boss_data['damage_multiplier']
+                        opponent.special_moves = boss_data['special_moves']
                 self.opponents.append({
                     'character': opponent,
-                    'ai': AIController(boss_data['difficulty'] if boss_data else 'medium')
+                    'ai': self.create_ai(boss_data.get('ai', boss_data['difficulty']) if boss_data else 'medium')
                 })
         else:
             # Single opponent (2x position)
@@ -55,11 +86,16 @@ class FightState(GameState):
             if is_campaign:
                 self.boss_data = BossData.get_boss_data(p2_char_id)
                 self.p2.health *= self.boss_data['health_multiplier']
+                self.p2.max_health = self.p2.health
                 self.p2.speed *= self.boss_data['speed_multiplier']
                 self.p2.damage_multiplier = self.boss_data['damage_multiplier']
+                self.p2.special_moves = self.boss_data['special_moves']
+            # In VS Player mode the second player is human
+            human_p2 = not ai_opponent and not is_campaign
             self.opponents = [{
                 'character': self.p2,
-                'ai': AIController(self.boss_data['difficulty'] if self.boss_data else ai_difficulty)
+                'ai': None if human_p2 else self.create_ai(
+                    self.boss_data.get('ai', self.boss_data['difficulty']) if self.boss_data else ai_difficulty)
             }]
         
         # Round system
@@ -69,12 +105,31 @@ class FightState(GameState):
         self.round_state = 'fighting'  # 'fighting', 'round_over', 'match_over'
         self.round_end_timer = 180  # 3 seconds at 60 FPS
         self.winner = None
+        self.intro = None  # Clip playing over the arena, e.g. Lee's entrance
         
-    def __del__(self):
-        """Clean up when the state is destroyed"""
-        if hasattr(self, 'sound_manager'):
-            self.sound_manager.stop_music()
-            
+        self.profiler = FrameProfiler.get()
+        
+        # Hit sparks, KO bursts and projectile trails
+        self.particles = ParticleSystem()
+        
+        # Human players driven by the input router's per-player action masks
+        self.controllers = [PlayerController(self.p1)]
+        if self.opponents[0]['ai'] is None:
+            self.controllers.append(PlayerController(self.p2))
+        self.player_count = len(self.controllers)
+        
+    def create_ai(self, difficulty):
+        """Create the AI controller for a difficulty, including the 'search' and 'policy' tiers
+        Bosses name their tier with an 'ai' entry in BossData.
+        """
+        if difficulty == 'search':
+            from characters.search_ai import SearchAIController
+            return SearchAIController(self.map_manager)
+        if difficulty == 'policy':
+            from characters.policy_ai import PolicyAIController
+            return PolicyAIController()
+        return AIController(difficulty)
+
     def check_round_end(self):
         """Check if the round should end"""
         if self.round_state == 'fighting':
@@ -96,12 +151,13 @@ class FightState(GameState):
                 # Special case: After defeating Bren, Lee appears
                 if self.is_campaign and self.boss_data and self.boss_data['name'] == 'Bren' and self.p1_rounds_won >= 2:
                     self.round_state = 'lee_intro'
+                    self.intro = ClipPlayer(ClipLibrary.get().clip('lee_intro'))
                     self.round_end_timer = 180  # 3 seconds for Lee's intro
                     # Create Lee as the new opponent
                     self.p2 = Character(1200, 1000, char_id='lee', facing_right=False)
                     self.opponents = [{
                         'character': self.p2,
-                        'ai': AIController('hard')  # Lee is a tough opponent
+                        'ai': self.create_ai('search')  # Lee is a tough opponent
                     }]
                     self.boss_data = {
                         'name': 'Lee',
@@ -117,7 +173,7 @@ class FightState(GameState):
                     self.p2_rounds_won = 0
                     self.p1.health = 200  # Reset player health
                     # Change music for Lee's fight
-                    self.sound_manager.play_stage_music('lee')
+                    self.audio.play_stage_music('lee')
                     return
                     
             elif self.round_time <= 0:
@@ -143,71 +199,70 @@ class FightState(GameState):
                 self.round_state = 'match_over'
                 
     def handle_event(self, event):
-        """Handle keyboard events for jumping and attacks"""
+        """During round end, any key press continues to the next round"""
         if event.type == pygame.KEYDOWN:
-            # During round end, any key press continues to next round
-            if self.round_end_timer <= 0:
-                if self.winner is not None:
-                    if self.p1_rounds_won >= 2 or self.p2_rounds_won >= 2:
-                        # Game is over, transition to appropriate state
-                        if self.is_campaign and self.p1_rounds_won >= 2:
-                            return PrizeState(self.current_stage)
-                        else:
-                            return MenuState()
-                    else:
-                        # Reset for next round
-                        self.reset_round()
-                        return None
-            
-            # During active gameplay, handle normal controls
-            if event.key == pygame.K_LEFT:
-                self.p1.move(-1)
-            elif event.key == pygame.K_RIGHT:
-                self.p1.move(1)
-            elif event.key == pygame.K_SPACE:
-                self.p1.jump()
-            elif event.key == pygame.K_z:
-                self.p1.attack('punch')
-            elif event.key == pygame.K_x:
-                self.p1.attack('kick')
-            elif event.key == pygame.K_c:
-                self.p1.throw_item()
-        
-        elif event.type == pygame.KEYUP:
-            if event.key in (pygame.K_LEFT, pygame.K_RIGHT):
-                # Only stop movement if the released key matches the current movement direction
-                if (event.key == pygame.K_LEFT and self.p1.vel_x < 0) or \
-                   (event.key == pygame.K_RIGHT and self.p1.vel_x > 0):
-                    self.p1.move(0)
-        
+            return self.advance_round()
+        return None
+
+    def handle_input(self, held, pressed, virtual_pressed, player=0):
+        """Sample this tick's actions for a player; update() applies them"""
+        self.controllers[player].handle_input(held, pressed)
+        if virtual_pressed & Action.CONFIRM:
+            return self.advance_round()
+        return None
+
+    def advance_round(self):
+        """Move on once the round end pause is over"""
+        if self.round_end_timer <= 0:
+            if self.winner is not None:
+                if self.p1_rounds_won >= 2 or self.p2_rounds_won >= 2:
+                    # Match is over, hand the result back to whoever started the fight
+                    return Transition.pop('win' if self.p1_rounds_won >= 2 else 'lose')
+                else:
+                    # Reset for next round
+                    self.reset_round()
         return None
 
+    def reset_round(self):
+        """Put every fighter back on their mark for the next round"""
+        if self.round_state != 'lee_intro':  # Lee's fight already starts at round 1
+            self.round_number += 1
+        self.p1.reset_for_round()
+        for opp in self.opponents:
+            opp['character'].reset_for_round()
+        for controller in self.controllers:
+            controller.input_buffer.clear()
+        self.round_time = 99 * 60
+        self.round_end_timer = 180
+        self.winner = None
+        self.round_state = 'fighting'
+        self.intro = None
+        self.particles.clear()
+
+    def exit(self):
+        """Leaving the fight: release the stage music"""
+        self.audio.stop_music()
+
     def update(self):
         if self.round_state == 'fighting':
-            # Get pressed keys for continuous movement
-            keys = pygame.key.get_pressed()
+            fighters = [self.p1] + [opp['character'] for opp in self.opponents]
+            before = [(c.health, c.blockstun, len(c.thrown_items)) for c in fighters]
             
-            # Player 1 movement (only move if keys are pressed)
-            dx1 = 0
-            if keys[pygame.K_LEFT]: dx1 -= 1
-            if keys[pygame.K_RIGHT]: dx1 += 1
-            if dx1 != 0:  # Only update movement if there's input
-                self.p1.move(dx1)
+            for controller in self.controllers:
+                controller.apply()
             
-            # Update all opponents with AI
-            for opp in self.opponents:
-                # Get AI decision
-                actions = opp['ai'].decide_action(opp['character'], self.p1)
-                # Apply AI actions
-                opp['ai'].apply_actions(opp['character'], actions)
+            with self.profiler.section('ai'):
+                self.update_ai()
             
             # Update all characters with map collision handling
-            self.p1.update(self.map_manager)
-            for opp in self.opponents:
-                opp['character'].update(self.map_manager)
+            with self.profiler.section('character_update'):
+                self.p1.update(self.map_manager)
+                for opp in self.opponents:
+                    opp['character'].update(self.map_manager)
             
             # Check all collisions
-            self.check_collisions()
+            with self.profiler.section('collisions'):
+                self.check_collisions()
             
             # Update timer
             if self.round_time > 0:
@@ -215,121 +270,167 @@ class FightState(GameState):
                 
             # Check for round end
             self.check_round_end()
+            self.play_effects(fighters, before)
+            self.emit_particles(fighters, before)
         else:
             # Update round end timer
             if self.round_end_timer > 0:
                 self.round_end_timer -= 1
+            if self.intro is not None:
+                self.intro.update()
+        
+        # KO bursts keep flying through the round end pause
+        with self.profiler.section('particles'):
+            self.particles.update()
             
         return None
             
-    def check_collisions(self):
-        # Check player collisions with all opponents
+    def play_effects(self, fighters, before):
+        """Sound effects for the throws, hits, blocks and KOs of this tick"""
+        for fighter, (health, blockstun, thrown) in zip(fighters, before):
+            if len(fighter.thrown_items) > thrown:
+                self.audio.play_effect('throw')
+            if fighter.health < health:
+                self.audio.play_effect('ko' if fighter.health <= 0 else 'hit')
+            elif fighter.blockstun > blockstun:
+                self.audio.play_effect('block')
+            
+    def emit_particles(self, fighters, before):
+        """Sparks for the hits, blocks and KOs of this tick and trails behind thrown items"""
+        for fighter, (health, blockstun, _) in zip(fighters, before):
+            if fighter.health < health:
+                box = fighter.hurtbox()
+                # Knockback points away from the attacker, so the sparks fly the same way
+                direction = 1 if fighter.vel_x > 0 else -1
+                x = box.left if direction > 0 else box.right
+                self.particles.emit('spark', x, box.centery, direction)
+                if fighter.health <= 0:
+                    self.particles.emit('ko', box.centerx, box.centery)
+            elif fighter.blockstun > blockstun:
+                box = fighter.hurtbox()
+                self.particles.emit('block', box.centerx, box.centery)
+            for item in fighter.thrown_items:
+                if item['active']:
+                    direction = -1 if item['vel_x'] > 0 else 1  # Drifts back the way it came
+                    self.particles.emit('trail', item['rect'].centerx, item['rect'].centery, direction)
+            
+    def update_ai(self):
+        """Let every AI opponent decide and apply its actions"""
+        # Policy-driven opponents share one batched forward pass
+        policy_opps = [opp for opp in self.opponents if opp['ai'] is not None and opp['ai'].difficulty == 'policy']
+        policy_actions = {}
+        if policy_opps:
+            from characters.policy_ai import PolicyAIController
+            batch = PolicyAIController.decide_batch(
+                [opp['ai'] for opp in policy_opps],
+                [opp['character'] for opp in policy_opps],
+                self.p1
+            )
+            policy_actions = {id(opp['ai']): actions for opp, actions in zip(policy_opps, batch)}
+
+        # Update all opponents with AI
+        deadline = time.perf_counter() + self.AI_TICK_BUDGET
         for opp in self.opponents:
-            if self.p1.rect.colliderect(opp['character'].rect):
-                # Push characters apart
-                if self.p1.x < opp['character'].x:
-                    self.p1.x = opp['character'].x - self.p1.width
-                else:
-                    self.p1.x = opp['character'].x + opp['character'].width
-                self.p1.rect.x = self.p1.x
-                opp['character'].rect.x = opp['character'].x
+            if opp['ai'] is None:
+                continue  # Human player 2
+            # Get AI decision
+            actions = policy_actions.get(id(opp['ai']))
+            if actions is None:
+                if opp['ai'].difficulty == 'search':
+                    opp['ai'].deadline = deadline
+                actions = opp['ai'].decide_action(opp['character'], self.p1)
+            # Apply AI actions
+            opp['ai'].apply_actions(opp['character'], actions)
             
-            # Check attack collisions
-            if self.p1.attack_rect and self.p1.attack_rect.colliderect(opp['character'].rect):
-                opp['character'].take_damage(10 * self.p1.damage_multiplier)
-                
-            if opp['character'].attack_rect and opp['character'].attack_rect.colliderect(self.p1.rect):
-                self.p1.take_damage(10 * opp['character'].damage_multiplier)
-                
-            # Check thrown item collisions
-            for item in self.p1.thrown_items[:]:
-                if item['active'] and item['rect'].colliderect(opp['character'].rect):
-                    opp['character'].take_damage(15 * self.p1.damage_multiplier)
-                    item['active'] = False
-                    self.p1.thrown_items.remove(item)
-                    
-            for item in opp['character'].thrown_items[:]:
-                if item['active'] and item['rect'].colliderect(self.p1.rect):
-                    self.p1.take_damage(15 * opp['character'].damage_multiplier)
-                    item['active'] = False
-                    opp['character'].thrown_items.remove(item)
+    def check_collisions(self):
+        # Collision rules live in the simulator so AI lookahead uses the same ones
+        FightSimulator.resolve_collisions(self.p1, [opp['character'] for opp in self.opponents])
                     
-    def draw(self, screen):
+    def snapshot(self):
+        return FightSnapshot(self)
+        
+    def render(self, renderer):
+        self.render_snapshot(renderer, self.snapshot())
+        
+    def render_snapshot(self, renderer, snapshot):
         # Draw the stage and obstacles
-        self.map_manager.draw(screen)
+        with self.profiler.section('stage_draw'):
+            self.map_manager.render(renderer)
         
         # Draw all characters
-        self.p1.draw(screen)
-        for opp in self.opponents:
-            opp['character'].draw(screen)
+        with self.profiler.section('character_draw'):
+            for fighter in snapshot.fighters:
+                fighter.render(renderer)
+        
+        with self.profiler.section('particles'):
+            ParticleSystem.draw(renderer, snapshot.particles)
         
+        with self.profiler.section('hud'):
+            self.draw_hud(renderer, snapshot)
+            
+    def draw_hud(self, renderer, snapshot):
+        """Draw timer, round info, health bars and round end messages"""
         # Draw timer
-        seconds = self.round_time // 60
-        timer_text = self.font.render(str(seconds), True, (255, 255, 255))
-        timer_rect = timer_text.get_rect(center=(screen.get_width() // 2, 50))
-        screen.blit(timer_text, timer_rect)
+        seconds = snapshot.round_time // 60
+        renderer.text(self.font, str(seconds), (255, 255, 255), center=(renderer.width // 2, 50))
         
         # Draw round indicators
-        if self.round_state == 'lee_intro':
-            round_text = self.font.render("LEE HAS APPEARED!", True, (255, 0, 0))
-        elif self.is_final_battle:
-            round_text = self.font.render("FINAL BATTLE - Round " + str(self.round_number), True, (255, 0, 0))
-        elif self.is_campaign:
-            round_text = self.font.render(f"VS {self.boss_data['name']} - Round {self.round_number}", True, self.boss_data['color'])
+        if snapshot.intro_frame is not None:
+            frame = snapshot.intro_frame  # "LEE HAS APPEARED!", flashing
+            renderer.blit(frame, frame.get_rect(center=(renderer.width // 2, 20)).topleft)
         else:
-            round_text = self.font.render(f"Round {self.round_number}", True, (255, 255, 255))
-        round_rect = round_text.get_rect(center=(screen.get_width() // 2, 20))
-        screen.blit(round_text, round_rect)
+            if self.is_final_battle:
+                round_text, round_color = "FINAL BATTLE - Round " + str(snapshot.round_number), (255, 0, 0)
+            elif self.is_campaign:
+                round_text, round_color = f"VS {self.boss_data['name']} - Round {snapshot.round_number}", self.boss_data['color']
+            else:
+                round_text, round_color = f"Round {snapshot.round_number}", (255, 255, 255)
+            renderer.text(self.font, round_text, round_color, center=(renderer.width // 2, 20))
         
         # Draw round wins
-        p1_wins_text = self.font.render(f"Wins: {self.p1_rounds_won}", True, (0, 255, 0))
-        p2_wins_text = self.font.render(f"Wins: {self.p2_rounds_won}", True, (0, 255, 0))
-        screen.blit(p1_wins_text, (50, 50))
-        screen.blit(p2_wins_text, (700, 50))
+        renderer.text(self.font, f"Wins: {snapshot.p1_rounds_won}", (0, 255, 0), topleft=(50, 50))
+        renderer.text(self.font, f"Wins: {snapshot.p2_rounds_won}", (0, 255, 0), topleft=(700, 50))
         
         # Draw health bars
         # Player health bar
-        pygame.draw.rect(screen, (128, 128, 128), (50, 20, 300, 20))
-        p1_health_width = 300 * (self.p1.health / 200)
-        pygame.draw.rect(screen, (255, 0, 0), (50, 20, p1_health_width, 20))
+        renderer.fill_rect((128, 128, 128), (50, 20, 300, 20))
+        p1_health_width = 300 * (snapshot.fighters[0].health / 200)
+        renderer.fill_rect((255, 0, 0), (50, 20, p1_health_width, 20))
         
         # Opponents' health bars
         total_width = 300
-        bar_width = total_width / len(self.opponents)
-        for i, opp in enumerate(self.opponents):
+        bar_width = total_width / (len(snapshot.fighters) - 1)
+        for i, opponent in enumerate(snapshot.fighters[1:]):
             x_pos = 450 + (i * bar_width)
-            pygame.draw.rect(screen, (128, 128, 128), (x_pos, 20, bar_width - 5, 20))
-            health_width = (bar_width - 5) * (opp['character'].health / (200 * (self.boss_data['health_multiplier'] if self.is_campaign else 1)))
-            if self.is_campaign:
-                health_color = self.boss_data['color']
+            renderer.fill_rect((128, 128, 128), (x_pos, 20, bar_width - 5, 20))
+            # Each final battle boss has its own data; Lee only has the fight's boss_data
+            boss_data = (BossData.get_boss_data(opponent.char_id) or self.boss_data) if self.is_campaign else None
+            health_width = (bar_width - 5) * (opponent.health / (200 * (boss_data['health_multiplier'] if boss_data else 1)))
+            if boss_data:
+                health_color = boss_data['color']
             else:
                 health_color = (255, 0, 0)
-            pygame.draw.rect(screen, health_color, (x_pos, 20, health_width, 20))
+            renderer.fill_rect(health_color, (x_pos, 20, health_width, 20))
             
             # Draw opponent name
-            if self.is_campaign or self.is_final_battle:
-                boss_data = BossData.get_boss_data(opp['character'].char_id)
-                name = self.font.render(boss_data['name'], True, boss_data['color'])
-                name_rect = name.get_rect(center=(x_pos + bar_width/2, 50))
-                screen.blit(name, name_rect)
+            if boss_data:
+                renderer.text(self.font, boss_data['name'], boss_data['color'], center=(x_pos + bar_width/2, 50))
         
         # Draw round end message
-        if self.round_state == 'round_over':
-            if self.winner == 'P1':
+        if snapshot.round_state == 'round_over':
+            if snapshot.winner == 'P1':
                 win_text = "You Win Round!"
             else:
                 win_text = "Opponents Win Round!"
                 
-            if self.round_end_timer <= 0:
+            if snapshot.round_end_timer <= 0:
                 win_text += " - Press ENTER to continue"
                 
-            text = self.font.render(win_text, True, (255, 255, 0))
-            text_rect = text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
-            screen.blit(text, text_rect)
+            renderer.text(self.font, win_text, (255, 255, 0), center=(renderer.width // 2, renderer.height // 2))
             
         # Draw match end message
-        elif self.round_state == 'match_over':
-            if self.p1_rounds_won >= 2:
+        elif snapshot.round_state == 'match_over':
+            if snapshot.p1_rounds_won >= 2:
                 if self.is_final_battle:
                     win_text = "LEGENDARY VICTORY! You've defeated all champions!"
                 elif self.is_campaign:
@@ -344,9 +445,7 @@ class FightState(GameState):
                 else:
                     win_text = "Player 2 Wins Match!"
                 
-            if self.round_end_timer <= 0:
+            if snapshot.round_end_timer <= 0:
                 win_text += " - Press ENTER to continue"
                 
-            text = self.font.render(win_text, True, (255, 255, 0))
-            text_rect = text.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
-            screen.blit(text, text_rect) 
\ No newline at end of file
+            renderer.text(self.font, win_text, (255, 255, 0), center=(renderer.width // 2, renderer.height // 2)) 
\ No newline at end of file
@@ -1,18 +1,22 @@
 import pygame
-from .game_state import GameState
+from .game_state import GameState, Transition
 from .fight_state import FightState
 from .prize_state import PrizeState
-from characters.boss_data import BossData
+from characters.roster import Roster
+from ui.clips import ClipLibrary, ClipPlayer
+from ui.fonts import Fonts
 
 class FinalBattleState(GameState):
+    pipelined = True  # The fight snapshots itself and the intro is one clip frame
+
     def __init__(self):
         super().__init__()
-        self.font = pygame.font.Font(None, 36)
+        self.font = Fonts.get(36)
         self.state = 'intro'  # 'intro', 'fighting', 'victory', 'defeat'
-        self.intro_timer = 180  # 3 seconds at 60 FPS
+        self.intro = ClipPlayer(ClipLibrary.get().clip('final_battle_intro'))  # 3 seconds
         
         # Final battle opponents in order of appearance
-        self.final_bosses = ['niall', 'billy', 'ciaran']
+        self.final_bosses = list(Roster.FINAL_BATTLE)
         
         # Initialize the fight state with all opponents
         self.fight_state = FightState(
@@ -24,56 +28,57 @@ class FinalBattleState(GameState):
         
     def update(self):
         if self.state == 'intro':
-            if self.intro_timer > 0:
-                self.intro_timer -= 1
+            if not self.intro.finished:
+                self.intro.update()
             else:
                 self.state = 'fighting'
         elif self.state == 'fighting':
-            result = self.fight_state.update()
-            if result is not None:
-                if isinstance(result, PrizeState):
-                    # Player won the final battle
-                    self.state = 'victory'
-                    return PrizeState(level='final')  # Special final prize
-                else:
-                    # Player lost
-                    self.state = 'defeat'
-                    from .menu_state import MenuState
-                    return MenuState()
+            self.fight_state.update()
         return None
         
+    def finish(self, transition):
+        """Turn the inner fight's result into this state's own transition"""
+        if transition is None or transition.op != Transition.POP:
+            return transition
+        if transition.result == 'win':
+            # Player won the final battle
+            self.state = 'victory'
+            return Transition.replace(PrizeState(level='final'))  # Special final prize
+        # Player lost
+        self.state = 'defeat'
+        return Transition.pop('lose')
+        
+    def exit(self):
+        self.fight_state.exit()
+        
     def handle_event(self, event):
         if self.state == 'intro':
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                self.intro_timer = 0
+                self.intro.skip()
         elif self.state == 'fighting':
-            return self.fight_state.handle_event(event)
+            return self.finish(self.fight_state.handle_event(event))
         return None
         
-    def draw(self, screen):
-        if self.state == 'intro':
-            # Draw dramatic intro screen
-            screen.fill((0, 0, 0))  # Black background
-            
-            # Draw title
-            title = self.font.render("FINAL BATTLE", True, (255, 0, 0))
-            title_rect = title.get_rect(center=(screen.get_width() // 2, 100))
-            screen.blit(title, title_rect)
+    def handle_input(self, held, pressed, virtual_pressed, player=0):
+        if self.state == 'fighting':
+            return self.finish(self.fight_state.handle_input(held, pressed, virtual_pressed, player))
+        return super().handle_input(held, pressed, virtual_pressed, player)
+        
+    def snapshot(self):
+        fight = self.fight_state.snapshot() if self.state == 'fighting' else None
+        return (self.state, fight, self.intro.frame, self.intro.finished)
+        
+    def render(self, renderer):
+        self.render_snapshot(renderer, self.snapshot())
+        
+    def render_snapshot(self, renderer, snapshot):
+        state, fight, intro_frame, intro_finished = snapshot
+        if state == 'fighting':
+            self.fight_state.render_snapshot(renderer, fight)
+        elif state == 'intro':
+            # Dramatic intro: the title, then each boss's name in turn
+            renderer.blit(intro_frame, intro_frame.get_rect(midtop=(renderer.width // 2, 0)).topleft)
             
-            # Draw boss names with dramatic spacing
-            y_pos = 200
-            for boss_id in self.final_bosses:
-                boss_data = BossData.get_boss_data(boss_id)
-                name = self.font.render(boss_data['name'], True, boss_data['color'])
-                name_rect = name.get_rect(center=(screen.get_width() // 2, y_pos))
-                screen.blit(name, name_rect)
-                y_pos += 100
-                
             # Draw prompt
-            if self.intro_timer <= 0:
-                prompt = self.font.render("Press ENTER to begin", True, (255, 255, 255))
-                prompt_rect = prompt.get_rect(center=(screen.get_width() // 2, 500))
-                screen.blit(prompt, prompt_rect)
-                
-        elif self.state == 'fighting':
-            self.fight_state.draw(screen) 
\ No newline at end of file
+            if intro_finished:
+                renderer.text(self.font, "Press ENTER to begin", (255, 255, 255), center=(renderer.width // 2, 500))
@@ -1,12 +1,88 @@
+import pygame
+from input.actions import Action
+
+class Transition:
+    """A state stack operation returned from handle_event, handle_input or update
+    A state class (rather than an instance) means the pooled instance of it.
+    """
+
+    PUSH = 'push'
+    POP = 'pop'
+    REPLACE = 'replace'
+    RESET = 'reset'  # Clear the stack down to a new root
+
+    __slots__ = ('op', 'state', 'kwargs', 'result')
+
+    def __init__(self, op, state=None, kwargs=None, result=None):
+        self.op = op
+        self.state = state
+        self.kwargs = kwargs or {}
+        self.result = result
+
+    @staticmethod
+    def push(state, **kwargs):
+        return Transition(Transition.PUSH, state, kwargs)
+
+    @staticmethod
+    def pop(result=None):
+        return Transition(Transition.POP, result=result)
+
+    @staticmethod
+    def replace(state, **kwargs):
+        return Transition(Transition.REPLACE, state, kwargs)
+
+    @staticmethod
+    def reset(state, **kwargs):
+        return Transition(Transition.RESET, state, kwargs)
+
 class GameState:
+    player_count = 1  # Human players the input router should split devices between
+    pipelined = False  # Whether update() may run on the simulation thread; see snapshot()
+
+    def enter(self, **kwargs):
+        """Called each time the state is pushed; pooled states reset here"""
+        pass
+
+    def exit(self):
+        """Called when the state leaves the stack; release music and big resources here"""
+        pass
+
+    def suspend(self):
+        """Called when another state is pushed on top of this one"""
+        pass
+
+    def resume(self, result=None):
+        """Called when the state above this one pops, with the result it popped"""
+        pass
+
     def handle_event(self, event):
         """Handle pygame events"""
         pass
 
+    def handle_input(self, held, pressed, virtual_pressed, player=0):
+        """Handle one player's action masks for this tick
+        Menu screens only read keys, so touch and gamepad presses are
+        forwarded to handle_event as the keys they stand in for.
+        Returns:
+            Transition or None: The stack change to make, or None to stay in current state
+        """
+        for bit, key in Action.MENU_KEYS:
+            if virtual_pressed & bit:
+                transition = self.handle_event(pygame.event.Event(pygame.KEYDOWN, {'key': key}))
+                if transition is not None:
+                    return transition
+        return None
+
+    def is_animating(self):
+        """Whether the screen changes without input, so it must be redrawn every frame
+        Static screens return False and the loop sleeps until the next event.
+        """
+        return True
+
     def update(self):
         """Update game state logic
         Returns:
-            GameState or None: The next state to transition to, or None to stay in current state
+            Transition or None: The stack change to make, or None to stay in current state
         """
         return None
 
@@ -15,4 +91,22 @@ class GameState:
         Args:
             screen: pygame surface to draw on
         """
-        pass 
\ No newline at end of file
+        pass
+
+    def snapshot(self):
+        """Immutable copy of everything render() draws, for pipelined states
+        Taken on the simulation thread at the end of update(); render_snapshot()
+        draws it on the main thread while the next update runs, so it must not
+        share anything update() changes.
+        """
+        return None
+
+    def render_snapshot(self, renderer, snapshot):
+        """Draw a copy taken by snapshot()"""
+        self.render(renderer)
+
+    def render(self, renderer):
+        """Draw the current state through the render backend
+        States that only know how to draw on a surface get the renderer's canvas.
+        """
+        self.draw(renderer.canvas())
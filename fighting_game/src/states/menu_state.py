@@ -1,16 +1,18 @@
 import pygame
-from .game_state import GameState
-from .character_select_state import CharacterSelectState
-from .campaign_state import CampaignState
+from .game_state import GameState, Transition
+from ui.fonts import Fonts
 
 class MenuState(GameState):
     def __init__(self):
         super().__init__()  # Initialize parent class
-        self.font = pygame.font.Font(None, 74)
+        self.font = Fonts.get(74)
         self.menu_items = ["VS Player", "Campaign", "Quit"]
         self.selected_item = 0
         print("Menu State initialized")  # Debug print
         
+    def enter(self):
+        self.selected_item = 0
+        
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
@@ -20,15 +22,20 @@ class MenuState(GameState):
             elif event.key == pygame.K_RETURN:
                 if self.selected_item == 0:  # VS Player
                     print("Starting VS Player mode")  # Debug print
-                    return CharacterSelectState(ai_opponent=False)
+                    from .character_select_state import CharacterSelectState
+                    return Transition.push(CharacterSelectState, ai_opponent=False)
                 elif self.selected_item == 1:  # Campaign
                     print("Starting Campaign mode")  # Debug print
-                    return CampaignState()
+                    from .campaign_state import CampaignState
+                    return Transition.push(CampaignState)
                 elif self.selected_item == 2:  # Quit
                     pygame.quit()
                     exit()
         return None
 
+    def is_animating(self):
+        return False  # Only changes on input
+
     def update(self):
         return None
 
@@ -0,0 +1,71 @@
+import queue
+import threading
+
+class SimulationPipeline:
+    """Runs a state's next update on a worker thread while the main thread draws the last one
+    Each tick ends with the worker taking the state's snapshot() into the back
+    slot of a double buffer; finish() swaps it to the front for the next frame
+    to draw. The main thread only touches the state between finish() and
+    start(), when the worker is idle, so events, input and transitions are
+    handled exactly as in the serial loop, one frame later on screen.
+    """
+
+    def __init__(self):
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.slots = [None, None]  # (state, snapshot) pairs: front is drawn, back is written
+        self.front_slot = 0
+        self.thread = None
+
+    def front(self, state):
+        """Snapshot of the last finished tick of state, taken now if there is none
+        Only call while the worker is idle.
+        """
+        entry = self.slots[self.front_slot]
+        if entry is None or entry[0] is not state:
+            entry = self.slots[self.front_slot] = (state, state.snapshot())
+        return entry[1]
+
+    def invalidate(self):
+        """Drop the front snapshot; called when the state stack changes"""
+        self.slots[self.front_slot] = None
+
+    def start(self, state):
+        """Run state.update() and state.snapshot() on the worker"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+            self.thread.start()
+        self.requests.put(state)
+
+    def finish(self):
+        """Wait for the tick started by start() and make its snapshot the front one
+        Returns:
+            Transition or None: what the state's update() returned
+        Raises:
+            Exception: whatever update() raised, re-raised on the main thread
+        """
+        transition, error = self.results.get()
+        if error is not None:
+            self.slots[1 - self.front_slot] = None
+            raise error
+        self.front_slot = 1 - self.front_slot
+        return transition
+
+    def shutdown(self, timeout=1.0):
+        if self.thread is not None:
+            self.requests.put(None)
+            self.thread.join(timeout)
+            self.thread = None
+
+    def _run(self):
+        while True:
+            state = self.requests.get()
+            if state is None:
+                return
+            try:
+                transition = state.update()
+                self.slots[1 - self.front_slot] = (state, state.snapshot())
+            except Exception as e:
+                self.results.put((None, e))
+                continue
+            self.results.put((transition, None))
@@ -0,0 +1,72 @@
+from .game_state import Transition
+
+class StateManager:
+    """Stack of game states with lifecycle hooks and pooled instances"""
+
+    def __init__(self):
+        self.stack = []
+        self.pool = {}  # State class -> reusable instance
+
+    @property
+    def current(self):
+        return self.stack[-1] if self.stack else None
+
+    def resolve(self, state):
+        """Turn a state class into its pooled instance"""
+        if isinstance(state, type):
+            instance = self.pool.get(state)
+            if instance is None:
+                instance = self.pool[state] = state()
+            return instance
+        return state
+
+    def push(self, state, **kwargs):
+        state = self.resolve(state)
+        if self.stack:
+            self.stack[-1].suspend()
+        self.stack.append(state)
+        state.enter(**kwargs)
+        return state
+
+    def pop(self, result=None):
+        state = self.stack.pop()
+        state.exit()
+        if self.stack:
+            self.stack[-1].resume(result)
+        return state
+
+    def replace(self, state, **kwargs):
+        state = self.resolve(state)
+        if self.stack:
+            self.stack.pop().exit()
+        self.stack.append(state)
+        state.enter(**kwargs)
+        return state
+
+    def reset(self, state, **kwargs):
+        """Exit every state, top first, and start again from `state`"""
+        while self.stack:
+            self.stack.pop().exit()
+        return self.push(state, **kwargs)
+
+    def apply(self, transition):
+        """Carry out a transition returned by the current state
+        Returns:
+            bool: whether the current state changed
+        """
+        if transition is None:
+            return False
+        if transition.op == Transition.PUSH:
+            self.push(transition.state, **transition.kwargs)
+        elif transition.op == Transition.POP:
+            self.pop(transition.result)
+        elif transition.op == Transition.REPLACE:
+            self.replace(transition.state, **transition.kwargs)
+        elif transition.op == Transition.RESET:
+            self.reset(transition.state, **transition.kwargs)
+        return True
+
+    def shutdown(self):
+        """Exit every state so music and resources are released in order"""
+        while self.stack:
+            self.stack.pop().exit()
@@ -0,0 +1,196 @@
+import pygame
+from characters.boss_data import BossData
+from characters.roster import Roster
+from resources.asset_registry import AssetRegistry
+from ui.fonts import Fonts
+
+TICK_MS = 1000 / 60  # One simulation tick
+
+class Clip:
+    """A named run of frames and how long each one shows
+    The last frame holds until duration_ms unless the clip loops.
+    """
+
+    def __init__(self, name, frames, frame_ms, duration_ms=None, loop=False):
+        self.name = name
+        self.frames = tuple(frames)
+        self.frame_ms = frame_ms
+        self.duration_ms = duration_ms if duration_ms is not None else len(self.frames) * frame_ms
+        self.loop = loop
+
+    def frame_at(self, elapsed_ms):
+        """The frame showing elapsed_ms into the clip"""
+        index = int(elapsed_ms // self.frame_ms)
+        if self.loop:
+            return self.frames[index % len(self.frames)]
+        return self.frames[min(index, len(self.frames) - 1)]
+
+class ClipPlayer:
+    """Plays a clip on the simulation clock; frames are picked by elapsed time"""
+
+    def __init__(self, clip):
+        self.clip = clip
+        self.elapsed_ms = 0.0
+
+    def update(self, dt_ms=TICK_MS):
+        self.elapsed_ms += dt_ms
+
+    def skip(self):
+        """Jump to the end, e.g. when the player presses ENTER"""
+        self.elapsed_ms = max(self.elapsed_ms, self.clip.duration_ms)
+
+    @property
+    def frame(self):
+        return self.clip.frame_at(self.elapsed_ms)
+
+    @property
+    def finished(self):
+        # Half a tick of slack so float time lands on the same tick as a frame count would
+        return self.elapsed_ms >= self.clip.duration_ms - TICK_MS / 2
+
+class ClipLibrary:
+    """Named clips, generated or loaded the first time they are asked for and shared after
+    A clip whose asset cannot be loaded is remembered as None.
+    """
+
+    PRIZE_SIZE = (100, 100)
+    GENERATED = ('whiskey_pour', 'prize_chest', 'final_battle_intro', 'lee_intro')  # Cheap enough for startup
+
+    _instance = None
+
+    def __init__(self):
+        self.clips = {}
+        self.builders = {
+            'whiskey_pour': self.build_whiskey_pour,
+            'prize_2': lambda: self.build_prize(2),
+            'prize_3': lambda: self.build_prize(3),
+            'prize_chest': self.build_chest,
+            'final_battle_intro': self.build_final_battle_intro,
+            'lee_intro': self.build_lee_intro,
+        }
+
+    @staticmethod
+    def get():
+        """Get the shared clip library"""
+        if ClipLibrary._instance is None:
+            ClipLibrary._instance = ClipLibrary()
+        return ClipLibrary._instance
+
+    def clip(self, name):
+        """The named clip, or None if its asset is missing
+        Raises:
+            KeyError: for a name with no builder
+        """
+        if name not in self.clips:
+            self.clips[name] = self.builders[name]()
+        return self.clips[name]
+
+    def preload(self, names=GENERATED):
+        """Build clips ahead of the screens that play them"""
+        for name in names:
+            self.clip(name)
+
+    def build_prize(self, level):
+        """A stage's prize image, held for three seconds"""
+        path = AssetRegistry.get().path('prize', level)
+        try:
+            image = pygame.transform.scale(pygame.image.load(path), self.PRIZE_SIZE)
+        except (pygame.error, TypeError, OSError):
+            return None
+        return Clip(f'prize_{level}', [image], frame_ms=3000)
+
+    def build_chest(self):
+        """The treasure chest, drawn when its image is missing"""
+        path = AssetRegistry.get().path('prize', 'chest')
+        try:
+            image = pygame.transform.scale(pygame.image.load(path), self.PRIZE_SIZE)
+        except (pygame.error, TypeError, OSError):
+            image = pygame.Surface(self.PRIZE_SIZE, pygame.SRCALPHA)
+            # Draw basic chest shape
+            pygame.draw.rect(image, (139, 69, 19), (10, 40, 80, 50))  # Main body
+            pygame.draw.rect(image, (101, 67, 33), (10, 40, 80, 25))  # Top half
+            pygame.draw.rect(image, (255, 215, 0), (45, 55, 10, 10))  # Lock
+        return Clip('prize_chest', [image], frame_ms=3000)
+
+    def build_whiskey_pour(self):
+        """The barman pouring a triple whiskey; the full glass holds for three seconds"""
+        frames = []
+        glass_height = 40
+        liquid_height = 0
+        glass_width = 30
+        barman_width = 60
+        barman_height = 100
+
+        for i in range(6):  # 6 frame animation
+            surface = pygame.Surface((200, 150), pygame.SRCALPHA)
+
+            # Draw barman
+            pygame.draw.rect(surface, (100, 100, 100), (20, 10, barman_width, barman_height))  # Body
+            pygame.draw.circle(surface, (200, 150, 100), (50, 5), 15)  # Head
+
+            # Draw arm holding bottle
+            bottle_start = (60, 40)
+            bottle_end = (100, 40 + i * 5)  # Bottle moves down slightly
+            pygame.draw.line(surface, (100, 100, 100), bottle_start, bottle_end, 8)  # Arm
+
+            # Draw bottle
+            bottle_color = (139, 69, 19)  # Brown for whiskey bottle
+            pygame.draw.rect(surface, bottle_color, (bottle_end[0] - 5, bottle_end[1] - 20, 10, 20))
+
+            # Draw glass
+            glass_x = 120
+            glass_y = 80
+            # Glass outline
+            pygame.draw.polygon(surface, (200, 200, 200), [
+                (glass_x, glass_y),  # Top left
+                (glass_x + glass_width, glass_y),  # Top right
+                (glass_x + glass_width - 5, glass_y + glass_height),  # Bottom right
+                (glass_x + 5, glass_y + glass_height)  # Bottom left
+            ])
+
+            # Draw liquid
+            if i > 0:  # Start filling after first frame
+                liquid_height = min((i * 8), glass_height - 5)  # Fill gradually
+                liquid_y = glass_y + glass_height - liquid_height
+                liquid_width = glass_width - (10 * (glass_y + glass_height - liquid_y) / glass_height)
+                liquid_x = glass_x + (glass_width - liquid_width) / 2
+                pygame.draw.rect(surface, (160, 82, 45), (liquid_x, liquid_y, liquid_width, liquid_height))
+
+                # Draw pouring stream
+                if i < 5:  # Only show stream while pouring
+                    stream_start = (bottle_end[0], bottle_end[1])
+                    stream_end = (glass_x + glass_width/2, liquid_y)
+                    pygame.draw.line(surface, (160, 82, 45), stream_start, stream_end, 2)
+
+            frames.append(surface)
+
+        # A new frame every 10 ticks, then 3 seconds on the full glass
+        frame_ms = 10 * TICK_MS
+        return Clip('whiskey_pour', frames, frame_ms, duration_ms=(len(frames) - 1) * frame_ms + 3000)
+
+    def build_final_battle_intro(self):
+        """'FINAL BATTLE' and then each boss's name, one at a time
+        Frames are as wide as the longest line and go at the top centre of the canvas.
+        """
+        font = Fonts.get(36)
+        lines = [font.render("FINAL BATTLE", True, (255, 0, 0))]
+        for boss_id in Roster.FINAL_BATTLE:
+            boss_data = BossData.get_boss_data(boss_id)
+            lines.append(font.render(boss_data['name'], True, boss_data['color']))
+
+        # Lines are centred 100 logical pixels apart, as the intro always laid them out
+        width = max(line.get_width() for line in lines)
+        height = 100 * len(lines) + lines[-1].get_height()
+        frames = []
+        for shown in range(1, len(lines) + 1):
+            frame = pygame.Surface((width, height), pygame.SRCALPHA)
+            for i, line in enumerate(lines[:shown]):
+                frame.blit(line, line.get_rect(center=(width // 2, 100 + i * 100)))
+            frames.append(frame)
+        return Clip('final_battle_intro', frames, frame_ms=500, duration_ms=3000)
+
+    def build_lee_intro(self):
+        """'LEE HAS APPEARED!' flashing between red and white"""
+        font = Fonts.get(72)
+        frames = [font.render("LEE HAS APPEARED!", True, color) for color in ((255, 0, 0), (255, 255, 255))]
+        return Clip('lee_intro', frames, frame_ms=250, duration_ms=3000, loop=True)
@@ -0,0 +1,13 @@
+import pygame
+
+class Fonts:
+    """Default-font objects shared by every state and HUD, one per size"""
+
+    _cache = {}
+
+    @staticmethod
+    def get(size):
+        font = Fonts._cache.get(size)
+        if font is None:
+            font = Fonts._cache[size] = pygame.font.Font(None, size)
+        return font
@@ -0,0 +1,50 @@
+import pygame
+from ui.fonts import Fonts
+
+class ProfilerOverlay:
+    """HUD panel showing rolling FrameProfiler timings"""
+
+    REFRESH_FRAMES = 15  # Re-render the panel four times a second
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.font = Fonts.get(24)
+        self.panel = None
+        self.frame_counter = 0
+
+    def build_lines(self):
+        """Text lines for the current profiler state"""
+        lines = []
+        averages = self.profiler.averages()
+        for name in self.profiler.SECTIONS:
+            lines.append(f"{name:<16}{averages.get(name, 0.0):7.2f} ms")
+
+        frame = self.profiler.percentiles(self.profiler.frame_times)
+        lines.append(f"frame p50 {frame[50]:.1f}  p95 {frame[95]:.1f}  p99 {frame[99]:.1f} ms")
+
+        pauses = self.profiler.gc_pauses
+        worst = max(pauses) if pauses else 0.0
+        lines.append(f"gc pauses {len(pauses)}  worst {worst:.2f} ms")
+        lines.append("F3 hide  F4 dump trace")
+        return lines
+
+    def render_panel(self):
+        """Render the panel surface from the current timings"""
+        lines = self.build_lines()
+        line_height = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines) + 20
+        panel = pygame.Surface((width, line_height * len(lines) + 20), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        for i, line in enumerate(lines):
+            text = self.font.render(line, True, (0, 255, 0))
+            panel.blit(text, (10, 10 + i * line_height))
+        return panel
+
+    def render(self, renderer):
+        if not self.profiler.enabled:
+            self.panel = None
+            return
+        if self.panel is None or self.frame_counter % self.REFRESH_FRAMES == 0:
+            self.panel = self.render_panel()
+        self.frame_counter += 1
+        renderer.blit(self.panel, (renderer.width - self.panel.get_width() - 10, 10))
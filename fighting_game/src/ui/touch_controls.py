@@ -1,9 +1,15 @@
 import pygame
+from array import array
+from input.actions import Action
+from ui.fonts import Fonts
 
 class TouchControls:
-    def __init__(self, screen_width, screen_height):
+    GRID_CELL = 8  # Pixel size of a hit-test grid cell
+
+    def __init__(self, screen_width, screen_height, viewport=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.viewport = viewport  # Maps window touches onto the logical canvas
         
         # Calculate UI element sizes based on screen dimensions
         self.button_size = min(screen_width, screen_height) // 8
@@ -101,89 +107,106 @@ class TouchControls:
             'jump_pressed': (100, 255, 100)
         }
         
-        # Touch state
-        self.touch_state = {
-            'move': 0,  # -1 for left, 0 for none, 1 for right
-            'up': False,
-            'down': False,
-            'punch': False,
-            'kick': False,
-            'jump': False
-        }
+        # Precomputed hit-test grid: each cell holds the action bits of the zone under it
+        self.buttons = (
+            (self.dpad_left, Action.LEFT),
+            (self.dpad_right, Action.RIGHT),
+            (self.dpad_up, Action.UP),
+            (self.dpad_down, Action.DOWN),
+            (self.punch_rect, Action.PUNCH),
+            (self.kick_rect, Action.KICK),
+            (self.jump_rect, Action.JUMP),
+        )
+        self.grid_cols = screen_width // self.GRID_CELL + 1
+        self.grid_rows = screen_height // self.GRID_CELL + 1
+        self.grid = self._build_grid()
         
-        # Store active touches
+        # Action bits held by each active finger, and all of them combined
         self.active_touches = {}
+        self.mask = Action.NONE
+        
+        self.font = Fonts.get(36)
+        
+        # The controls are drawn as two cut-out images per combination of pressed buttons
+        screen_rect = pygame.Rect(0, 0, screen_width, screen_height)
+        self.regions = (
+            self.dpad_left.unionall([self.dpad_right, self.dpad_up, self.dpad_down]).clip(screen_rect),
+            # Inflated for the pressed/raised offset of the buttons
+            self.punch_rect.unionall([self.kick_rect, self.jump_rect]).inflate(0, 8).clip(screen_rect),
+        )
+        self.overlays = {}  # (pressed mask, shadows) -> one image per region
+        
+    def _build_grid(self):
+        """Fill the grid cells whose centre lies inside each button"""
+        grid = array('H', bytes(2 * self.grid_cols * self.grid_rows))
+        cell = self.GRID_CELL
+        for rect, bit in self.buttons:
+            for row in range(max(0, rect.top // cell), min(self.grid_rows, rect.bottom // cell + 1)):
+                for col in range(max(0, rect.left // cell), min(self.grid_cols, rect.right // cell + 1)):
+                    if rect.collidepoint(col * cell + cell // 2, row * cell + cell // 2):
+                        grid[row * self.grid_cols + col] |= bit
+        return grid
+        
+    def hit_test(self, x, y):
+        """Action bits of the touch zone at a screen position"""
+        col = int(x) // self.GRID_CELL
+        row = int(y) // self.GRID_CELL
+        if 0 <= col < self.grid_cols and 0 <= row < self.grid_rows:
+            return self.grid[row * self.grid_cols + col]
+        return Action.NONE
         
     def handle_touch(self, event):
-        """Handle touch events and return the current touch state"""
-        if event.type == pygame.FINGERDOWN:
-            x = event.x * self.screen_width
-            y = event.y * self.screen_height
-            touch_pos = (x, y)
-            self.active_touches[event.finger_id] = touch_pos
-            self._update_touch_state(touch_pos, True)
-            
-        elif event.type == pygame.FINGERUP:
-            if event.finger_id in self.active_touches:
-                touch_pos = self.active_touches[event.finger_id]
-                self._update_touch_state(touch_pos, False)
-                del self.active_touches[event.finger_id]
-                
-        elif event.type == pygame.FINGERMOTION:
-            x = event.x * self.screen_width
-            y = event.y * self.screen_height
-            touch_pos = (x, y)
-            self.active_touches[event.finger_id] = touch_pos
-            self._reset_touch_state()
-            for pos in self.active_touches.values():
-                self._update_touch_state(pos, True)
-        
-        return self.touch_state
-    
-    def _update_touch_state(self, pos, is_pressed):
-        """Update touch state based on touch position"""
-        x, y = pos
-        
-        # D-pad movement
-        if self.dpad_left.collidepoint(x, y):
-            self.touch_state['move'] = -1 if is_pressed else 0
-        elif self.dpad_right.collidepoint(x, y):
-            self.touch_state['move'] = 1 if is_pressed else 0
-        elif self.dpad_up.collidepoint(x, y):
-            self.touch_state['up'] = is_pressed
-        elif self.dpad_down.collidepoint(x, y):
-            self.touch_state['down'] = is_pressed
-        
-        # Action buttons
-        if self.punch_rect.collidepoint(x, y):
-            self.touch_state['punch'] = is_pressed
-        elif self.kick_rect.collidepoint(x, y):
-            self.touch_state['kick'] = is_pressed
-        elif self.jump_rect.collidepoint(x, y):
-            self.touch_state['jump'] = is_pressed
-    
-    def _reset_touch_state(self):
-        """Reset all touch states to default"""
-        self.touch_state = {
-            'move': 0,
-            'up': False,
-            'down': False,
-            'punch': False,
-            'kick': False,
-            'jump': False
-        }
+        """Update the held mask from a touch event
+        Returns:
+            int: action bits newly pressed by this event
+        """
+        previous = self.mask
+        if event.type == pygame.FINGERUP:
+            self.active_touches.pop(event.finger_id, None)
+        else:
+            if self.viewport is not None:
+                bits = self.hit_test(*self.viewport.to_logical(event.x, event.y))
+            else:
+                bits = self.hit_test(event.x * self.screen_width, event.y * self.screen_height)
+            self.active_touches[event.finger_id] = bits
+            # A tap outside the buttons confirms menus and round transitions
+            if event.type == pygame.FINGERDOWN and not bits:
+                return Action.CONFIRM
+        self.mask = self._combined_mask()
+        return self.mask & ~previous
+        
+    def _combined_mask(self):
+        mask = Action.NONE
+        for bits in self.active_touches.values():
+            mask |= bits
+        return mask
     
-    def draw(self, screen):
+    def render(self, renderer):
+        """Draw the cached images for the buttons currently pressed"""
+        key = (self.mask, renderer.effects)
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = self.overlays[key] = self.build_overlay(shadows=renderer.effects)
+        for region, image in zip(self.regions, overlay):
+            renderer.blit(image, region.topleft)
+        
+    def build_overlay(self, shadows=True):
+        """Draw the controls once and cut out the regions they cover"""
+        scratch = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        self.draw(scratch, shadows)
+        return tuple(scratch.subsurface(region).copy() for region in self.regions)
+        
+    def draw(self, screen, shadows=True):
         """Draw the touch controls"""
         # Draw D-pad base
         pygame.draw.rect(screen, self.colors['dpad'], self.dpad_center_rect)
         
         # Draw D-pad directional buttons
         for dpad_button, is_pressed in [
-            (self.dpad_left, self.touch_state['move'] == -1),
-            (self.dpad_right, self.touch_state['move'] == 1),
-            (self.dpad_up, self.touch_state['up']),
-            (self.dpad_down, self.touch_state['down'])
+            (self.dpad_left, self.mask & Action.LEFT),
+            (self.dpad_right, self.mask & Action.RIGHT),
+            (self.dpad_up, self.mask & Action.UP),
+            (self.dpad_down, self.mask & Action.DOWN)
         ]:
             color = self.colors['dpad_pressed'] if is_pressed else self.colors['dpad']
             pygame.draw.rect(screen, color, dpad_button)
@@ -226,15 +249,16 @@ class TouchControls:
         
         # Draw action buttons with a more 3D look
         for button, color, pressed, label in [
-            (self.punch_rect, self.colors['punch'], self.touch_state['punch'], 'PUNCH'),
-            (self.kick_rect, self.colors['kick'], self.touch_state['kick'], 'KICK'),
-            (self.jump_rect, self.colors['jump'], self.touch_state['jump'], 'JUMP')
+            (self.punch_rect, self.colors['punch'], self.mask & Action.PUNCH, 'PUNCH'),
+            (self.kick_rect, self.colors['kick'], self.mask & Action.KICK, 'KICK'),
+            (self.jump_rect, self.colors['jump'], self.mask & Action.JUMP, 'JUMP')
         ]:
             # Draw button shadow
-            shadow_offset = 0 if pressed else 4
-            shadow_rect = button.copy()
-            shadow_rect.y += shadow_offset
-            pygame.draw.rect(screen, (30, 30, 30), shadow_rect)
+            if shadows:
+                shadow_offset = 0 if pressed else 4
+                shadow_rect = button.copy()
+                shadow_rect.y += shadow_offset
+                pygame.draw.rect(screen, (30, 30, 30), shadow_rect)
             
             # Draw button face
             button_rect = button.copy()
@@ -242,7 +266,6 @@ class TouchControls:
             pygame.draw.rect(screen, color, button_rect)
             
             # Draw button label
-            font = pygame.font.Font(None, 36)
-            text = font.render(label, True, (255, 255, 255))
+            text = self.font.render(label, True, (255, 255, 255))
             screen.blit(text, (button_rect.centerx - text.get_width()//2,
                              button_rect.centery - text.get_height()//2)) 
\ No newline at end of file
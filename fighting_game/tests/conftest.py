@@ -0,0 +1,35 @@
+import os
+import sys
+
+# Run pygame headless so the suite works without a display or sound card
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# The game imports its packages relative to src/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import pygame
+
+pygame.display.init()
+pygame.font.init()
+# A display the size of the logical canvas, as the game draws at by default
+pygame.display.set_mode((1600, 1200))
+
+import pytest
+from characters.character import Character
+from save.campaign_save import CampaignSave
+
+@pytest.fixture(autouse=True)
+def campaign_save(tmp_path):
+    """Keep campaign progress out of the real save file"""
+    CampaignSave._instance = CampaignSave(str(tmp_path / "campaign.jsonl"))
+    yield CampaignSave._instance
+    CampaignSave._instance.shutdown()
+    CampaignSave._instance = None
+
+@pytest.fixture
+def characters():
+    """An AI fighter on the right facing a player on the left"""
+    ai_char = Character(600, 450, facing_right=False)
+    player_char = Character(200, 450, facing_right=True)
+    return ai_char, player_char
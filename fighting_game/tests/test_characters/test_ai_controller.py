@@ -1,17 +1,10 @@
 import pytest
 from characters.ai_controller import AIController
-from characters.character import Character
 
 @pytest.fixture
 def ai_controller():
     return AIController(difficulty='medium')
 
-@pytest.fixture
-def characters():
-    ai_char = Character(600, 450, facing_right=False)
-    player_char = Character(200, 450, facing_right=True)
-    return ai_char, player_char
-
 def test_ai_controller_initialization():
     # Test different difficulty levels
     easy_ai = AIController('easy')
@@ -54,8 +47,8 @@ def test_ai_attack_behavior(ai_controller, characters):
     ai_char, player_char = characters
     
     # Test attack behavior when in range
-    ai_char.x = 300
-    player_char.x = 340  # Within attack range
+    ai_char.x = ai_char.rect.x = 300
+    player_char.x = player_char.rect.x = 340  # Within attack range
     
     # Make multiple attempts since behavior has random elements
     attack_decisions = []
@@ -0,0 +1,121 @@
+import pytest
+from characters.boss_data import BossData
+from characters.character import Character
+from characters.fight_simulator import FightSimulator
+from characters.move_engine import MoveData
+
+@pytest.fixture
+def characters():
+    boss = Character(300, 1050, facing_right=False)
+    player = Character(180, 1050, facing_right=True)  # Just within reach
+    return boss, player
+
+def test_every_boss_special_is_defined():
+    for boss in BossData.BOSSES.values():
+        for move_name in boss['special_moves']:
+            assert MoveData.get(move_name) is not None
+
+def test_compiled_tables_match_phases():
+    move = MoveData.get('double_kick')
+    assert move['length'] == sum(phase['frames'] for phase in MoveData.MOVES['double_kick'])
+    assert len(move['hitbox']) == move['length'] * 4
+    assert set(move['hit_id']) == {0, 1, 2}
+
+def test_special_requires_known_move(characters):
+    boss, player = characters
+    assert not boss.special_move('double_kick')
+    boss.special_moves = ['double_kick']
+    assert boss.special_move('double_kick')
+    assert boss.move_executor.active
+
+def test_launching_move_only_starts_on_the_ground(characters):
+    boss, player = characters
+    boss.special_moves = ['jump_kick', 'quick_punch']
+    boss.jump()
+    boss.update()
+    assert not boss.special_move('jump_kick')  # Would be a second jump
+    assert boss.special_move('quick_punch')
+
+    boss.move_executor.cancel()
+    while boss.is_jumping:
+        boss.update()
+    assert boss.special_move('jump_kick')
+    boss.update()
+    assert boss.is_jumping and boss.vel_y < 0
+
+def test_move_runs_to_completion(characters):
+    boss, player = characters
+    boss.special_moves = ['quick_punch']
+    boss.special_move('quick_punch')
+    for _ in range(MoveData.get('quick_punch')['length']):
+        boss.update()
+    assert boss.move_executor.active
+    boss.update()
+    assert not boss.move_executor.active
+    assert boss.state == 'idle'
+
+def test_each_hit_lands_once(characters):
+    boss, player = characters
+    boss.special_moves = ['double_kick']
+    boss.special_move('double_kick')
+    for _ in range(MoveData.get('double_kick')['length'] + 1):
+        boss.update()
+        player.update()
+        FightSimulator.resolve_collisions(player, [boss])
+    assert player.health == 200 - 2 * 9
+
+def test_ultimate_combo_spawns_projectile(characters):
+    boss, player = characters
+    boss.special_moves = ['ultimate_combo']
+    boss.special_move('ultimate_combo')
+    for _ in range(MoveData.get('ultimate_combo')['length']):
+        boss.update()
+    assert len(boss.thrown_items) == 1
+
+def fight_frames(attacker, defender, frames):
+    for _ in range(frames):
+        attacker.update()
+        defender.update()
+        FightSimulator.resolve_collisions(defender, [attacker])
+
+def test_punch_hits_once_per_move(characters):
+    boss, player = characters
+    boss.attack('punch')
+    fight_frames(boss, player, 20)
+    assert player.health == 190
+
+def test_hitstun_blocks_actions(characters):
+    boss, player = characters
+    boss.attack('kick')
+    fight_frames(boss, player, 3)
+    assert player.hitstun > 0
+    player.attack('punch')
+    player.jump()
+    assert not player.is_attacking
+    assert not player.is_jumping
+
+def test_hit_reaction_is_not_the_defeat_pose(characters):
+    boss, player = characters
+    boss.attack('kick')
+    fight_frames(boss, player, 3)
+    assert player.hitstun > 0 and player.state == 'hit'
+    frame = player.sprite_manager.get_frame(player.state, player.frame_counter)
+    assert frame in player.sprite_manager.sprites['hit']
+    assert frame not in player.sprite_manager.sprites['loss']  # Kept for a KO
+    assert player.hurtbox().left < player.rect.left + player.rect.width * 0.1  # Knocked back
+
+def test_walking_away_blocks(characters):
+    boss, player = characters
+    boss.attack('punch')
+    player.move(-1)  # Away from the boss on the right
+    fight_frames(boss, player, 3)
+    assert player.health == 200
+    assert player.blockstun > 0
+    assert player.hitstun == 0
+
+def test_hurtbox_follows_state_table(characters):
+    boss, player = characters
+    standing = player.hurtbox().height
+    player.state = 'crouch'
+    assert player.hurtbox().height < standing
+    assert player.hurtbox().bottom == player.rect.bottom
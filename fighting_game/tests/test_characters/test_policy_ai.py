@@ -0,0 +1,66 @@
+import numpy as np
+from characters.ai_controller import AIController
+from characters.character import Character
+from characters.policy_ai import Policy, PolicyAIController
+
+def make_policy(preferred):
+    """Policy whose output always favours one macro action"""
+    n_features = len(Policy.FEATURES)
+    n_actions = len(AIController.MACRO_ACTIONS)
+    b2 = np.zeros(n_actions)
+    b2[AIController.MACRO_ACTIONS.index(preferred)] = 1.0
+    return Policy(np.zeros((n_features, 4)), np.zeros(4), np.zeros((4, n_actions)), b2)
+
+def test_features_shape(characters):
+    ai_char, player_char = characters
+    features = Policy.features(ai_char, player_char)
+    assert len(features) == len(Policy.FEATURES)
+
+def test_projectile_feature(characters):
+    ai_char, player_char = characters
+    assert Policy.features(ai_char, player_char)[-1] == 0.0
+    player_char.throw_item()
+    assert Policy.features(ai_char, player_char)[-1] > 0.0
+
+def test_policy_action(characters):
+    ai_char, player_char = characters
+    ai = PolicyAIController(policy=make_policy('advance'))
+    decision = ai.decide_action(ai_char, player_char)
+    assert decision == {'move': -1, 'jump': False, 'attack': None}
+
+def test_batch_matches_single_decisions(characters):
+    ai_char, player_char = characters
+    other = Character(1000, 450, facing_right=False)
+    kick = make_policy('kick')
+    controllers = [PolicyAIController(policy=kick), PolicyAIController(policy=make_policy('jump')),
+                   PolicyAIController(policy=kick)]
+
+    batch = PolicyAIController.decide_batch(controllers, [ai_char, other, ai_char], player_char)
+    single = [c.decide_action(ch, player_char) for c, ch in zip(controllers, [ai_char, other, ai_char])]
+    assert batch == single
+
+def test_save_and_load_round_trip(tmp_path, characters):
+    ai_char, player_char = characters
+    policy = make_policy('throw')
+    path = str(tmp_path / 'policy.npz')
+    policy.save(path)
+
+    loaded = Policy.load(path)
+    features = np.array([Policy.features(ai_char, player_char)], dtype=np.float32)
+    assert loaded.actions == AIController.MACRO_ACTIONS
+    assert np.allclose(loaded.scores(features), policy.scores(features))
+
+def test_final_campaign_boss_uses_the_policy():
+    from states.fight_state import FightState
+    fight = FightState('player', 'ciaran', is_campaign=True)
+    assert isinstance(fight.opponents[0]['ai'], PolicyAIController)
+
+def test_final_battle_batches_policy_opponents(monkeypatch):
+    from states.fight_state import FightState
+    fight = FightState('player', ['niall', 'billy', 'ciaran'], is_campaign=True, is_final_battle=True)
+    batches = []
+    decide_batch = PolicyAIController.decide_batch
+    monkeypatch.setattr(PolicyAIController, 'decide_batch',
+                        staticmethod(lambda ais, chars, target: batches.append(len(ais)) or decide_batch(ais, chars, target)))
+    fight.update()
+    assert batches == [1]
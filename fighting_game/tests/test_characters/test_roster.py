@@ -0,0 +1,32 @@
+import pygame
+from characters.boss_data import BossData
+from characters.roster import Roster
+from render.renderer import SoftwareRenderer
+from states.campaign_state import CampaignState
+
+def test_links_follow_the_campaign_order():
+    roster = Roster()
+    assert [roster.index(boss) for boss in roster.order] == list(range(len(roster)))
+    assert roster.previous('bren') is None
+    assert roster.next('bren') == 'billy'
+    assert roster.previous('niall') == 'billy'
+    assert roster.next('ciaran') is None
+    assert BossData.get_next_boss('bren') == 'billy'  # BOSSES order, not the campaign's
+    assert BossData.get_next_boss('ciaran') is None
+
+def test_portraits_are_scaled_once():
+    roster = Roster()
+    portrait = roster.portrait('niall', 200)
+    assert portrait.get_size() == (200, 200)
+    assert roster.portrait('niall', 200) is portrait
+    expected = pygame.transform.scale(BossData.get_boss_face('niall'), (200, 200))
+    assert pygame.image.tobytes(portrait, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+
+def test_campaign_preview_blits_the_cached_portrait(monkeypatch):
+    campaign = CampaignState()
+    scaled = []
+    monkeypatch.setattr(pygame.transform, 'scale', lambda *args: scaled.append(args) or args[0])
+    surface = pygame.Surface((1600, 1200))
+    campaign.render(SoftwareRenderer(surface))
+    assert scaled == []
+    assert surface.get_at((800, 200))[:3] == BossData.get_boss_data('bren')['color']
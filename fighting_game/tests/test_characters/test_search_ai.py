@@ -0,0 +1,78 @@
+from characters.fight_simulator import FightSimulator
+from characters.search_ai import SearchAIController
+
+def test_clone_is_independent(characters):
+    ai_char, player_char = characters
+    player_char.throw_item()
+    clone = player_char.clone()
+
+    clone.update()
+    clone.take_damage(50)
+
+    assert clone.sprite_manager is player_char.sprite_manager
+    assert clone.health != player_char.health
+    assert clone.rect is not player_char.rect
+    assert clone.thrown_items[0]['rect'].x != player_char.thrown_items[0]['rect'].x
+
+def test_simulator_does_not_touch_live_state(characters):
+    ai_char, player_char = characters
+    sim = FightSimulator(player_char, [ai_char]).clone()
+    for _ in range(30):
+        sim.step(None, [{'move': 1, 'jump': False, 'attack': 'punch'}])
+
+    assert ai_char.x == 600
+    assert sim.opponents[0].x != 600
+
+def test_search_decision_format(characters):
+    ai_char, player_char = characters
+    ai = SearchAIController()
+    decision = ai.decide_action(ai_char, player_char)
+
+    assert set(decision) == {'move', 'jump', 'attack'}
+    # Far away the only way to score is to close the distance
+    assert decision['move'] < 0
+
+def test_search_attacks_in_range(characters):
+    ai_char, player_char = characters
+    ai_char.x = ai_char.rect.x = 300
+    player_char.x = player_char.rect.x = 180  # Within punch reach
+    ai = SearchAIController(time_budget=1.0)
+
+    decision = ai.decide_action(ai_char, player_char)
+    assert decision['attack'] is not None
+
+def test_search_uses_transposition_cache(characters):
+    ai_char, player_char = characters
+    ai = SearchAIController()
+    ai.decide_action(ai_char, player_char)
+    ai.decision_cooldown = 0
+    ai.decide_action(ai_char, player_char)
+
+    assert ai.searches == 1
+    assert ai.cache_hits == 1
+
+def test_search_respects_time_budget(characters):
+    ai_char, player_char = characters
+    ai = SearchAIController(time_budget=0)
+    ai.decide_action(ai_char, player_char)
+    # With no budget only the first candidate is rolled out
+    assert ai.rollouts == 1
+
+def test_hard_campaign_bosses_search():
+    from states.fight_state import FightState
+    fight = FightState('player', 'niall', is_campaign=True)
+    ai = fight.opponents[0]['ai']
+    assert isinstance(ai, SearchAIController)
+    for _ in range(5):
+        fight.update()
+    assert ai.searches > 0
+
+def test_search_stops_at_the_fight_tick_budget(monkeypatch):
+    from states.fight_state import FightState
+    monkeypatch.setattr(FightState, 'AI_TICK_BUDGET', 0)
+    fight = FightState('player', 'niall', is_campaign=True)
+    ai = fight.opponents[0]['ai']
+    for _ in range(5):
+        fight.update()
+    # With no time left in the tick only the first candidate is rolled out
+    assert ai.searches > 0 and ai.rollouts == ai.searches
@@ -0,0 +1,93 @@
+import pygame
+import pytest
+from characters.sprite_manager import SpriteManager
+from render.renderer import SoftwareRenderer
+from resources.asset_registry import AssetRegistry
+from resources.showcase_loader import ShowcaseLoader
+
+@pytest.fixture
+def sheet_character(tmp_path, monkeypatch):
+    """A character with a full sprite sheet, as the loaded-sprite path builds it"""
+    sheet = pygame.Surface((75, 150), pygame.SRCALPHA)
+    sheet.fill((40, 80, 160, 255), (10, 0, 55, 150))
+    pygame.draw.circle(sheet, (230, 190, 150, 255), (37, 20), 15)
+    path = str(tmp_path / "sheet.png")
+    pygame.image.save(sheet, path)
+
+    registry = AssetRegistry.get()
+    real_path = registry.path
+    monkeypatch.setattr(registry, 'path', lambda kind, key: path if key == 'sheet' else real_path(kind, key))
+    yield 'sheet'
+    SpriteManager.frame_sets.pop('sheet', None)
+
+def test_fighters_share_one_frame_set():
+    first, second = SpriteManager('player'), SpriteManager('player')
+    assert second.sprites is first.sprites
+    assert (second.WIDTH, second.HEIGHT) == (first.WIDTH, first.HEIGHT)
+
+def test_identical_frames_are_one_surface(sheet_character):
+    sprites = SpriteManager(sheet_character).sprites
+    idle = sprites['idle'][0]
+    for state in ('punch', 'kick', 'throw', 'win'):
+        assert all(frame is idle for frame in sprites[state])
+    assert sprites['walk'][0] is sprites['walk'][2]
+    assert sprites['jump'][0] is sprites['loss'][0]  # Both the same squash of the idle pose
+
+@pytest.mark.parametrize('flip_x', [False, True])
+def test_overlays_draw_like_the_baked_frames_did(sheet_character, flip_x):
+    manager = SpriteManager(sheet_character)
+    idle = manager.sprites['idle'][0]
+    baked = idle.copy()
+    pygame.draw.line(baked, (255, 255, 0), (manager.WIDTH - 20, manager.HEIGHT // 2),
+                     (manager.WIDTH + 10, manager.HEIGHT // 2), 8)
+    if flip_x:
+        baked = pygame.transform.flip(baked, True, False)
+    expected = pygame.Surface((300, 300))
+    expected.blit(baked, (50, 20))
+
+    drawn = pygame.Surface((300, 300))
+    punch_out = 1 / manager.animation_speed  # Frame counter showing the middle punch frame
+    manager.render(SoftwareRenderer(drawn), 'punch', punch_out, (50, 20), flip_x=flip_x)
+    assert pygame.image.tobytes(drawn, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+def test_overlays_are_effects(sheet_character):
+    manager = SpriteManager(sheet_character)
+    punch_out = 1 / manager.animation_speed
+    plain, drawn = pygame.Surface((300, 300)), pygame.Surface((300, 300))
+    renderer = SoftwareRenderer(drawn)
+    renderer.effects = False
+    manager.render(renderer, 'punch', punch_out, (50, 20))
+    SoftwareRenderer(plain).blit(manager.sprites['idle'][0], (50, 20))
+    assert pygame.image.tobytes(drawn, 'RGB') == pygame.image.tobytes(plain, 'RGB')
+
+def test_memory_usage_counts_shared_surfaces_once(sheet_character):
+    usage = SpriteManager(sheet_character).memory_usage()
+    assert usage['surfaces'] < usage['frames']
+    assert usage['bytes'] < usage['unshared_bytes'] / 2
+
+def test_showcase_picture_replaces_its_placeholder(monkeypatch):
+    monkeypatch.setattr(ShowcaseLoader, '_instance', ShowcaseLoader())
+    SpriteManager.frame_sets.pop('player', None)
+    manager = SpriteManager('player')
+    placeholder = manager.sprites['loss'][0]
+    ShowcaseLoader.get().wait()
+    loss = manager.sprites['loss'][0]
+    assert loss is not placeholder
+    assert loss.get_size() == (manager.WIDTH, manager.HEIGHT)
+
+    SpriteManager.frame_sets.pop('player')
+    assert SpriteManager('player').sprites['loss'][0] is loss  # Rebuilds reuse the decoded picture
+
+def test_bren_is_drawn_at_his_width():
+    SpriteManager.frame_sets.pop('bren', None)
+    manager = SpriteManager('bren')
+    assert manager.WIDTH == SpriteManager.BREN_WIDTH
+    assert manager.get_frame('idle', 0).get_width() == SpriteManager.BREN_WIDTH
+
+def test_sheet_is_decoded_once(sheet_character, monkeypatch):
+    loads = []
+    real_load = pygame.image.load
+    monkeypatch.setattr(pygame.image, 'load', lambda path: loads.append(path) or real_load(path))
+    SpriteManager.frame_sets.pop(sheet_character, None)
+    SpriteManager(sheet_character)
+    assert len(loads) == 1
@@ -0,0 +1,57 @@
+import json
+import time
+from debug.frame_profiler import FrameProfiler
+
+def test_sections_add_up_per_frame():
+    profiler = FrameProfiler()
+    profiler.set_enabled(True)
+    try:
+        profiler.begin_frame()
+        for _ in range(2):
+            with profiler.section('ai'):
+                time.sleep(0.002)
+        profiler.begin_frame()
+    finally:
+        profiler.set_enabled(False)
+    assert profiler.timings['ai'][-1] >= 4.0
+    assert profiler.timings['flip'][-1] == 0.0
+    assert profiler.frame_times[-1] >= profiler.timings['ai'][-1]
+
+def test_disabled_sections_record_nothing():
+    profiler = FrameProfiler()
+    with profiler.section('ai'):
+        pass
+    assert not profiler.trace
+
+def test_percentiles():
+    values = list(range(1, 101))
+    assert FrameProfiler.percentiles(values) == {50: 51, 95: 95, 99: 99}
+    assert FrameProfiler.percentiles([]) == {50: 0.0, 95: 0.0, 99: 0.0}
+
+def test_trace_keeps_only_the_last_seconds():
+    profiler = FrameProfiler(trace_seconds=1)
+    profiler.set_enabled(True)
+    try:
+        now = time.perf_counter()
+        profiler.record('ai', now - 5, now - 4.9)  # Older than the window
+        profiler.record('hud', now, now)
+        profiler.begin_frame()
+        profiler.begin_frame()
+    finally:
+        profiler.set_enabled(False)
+    names = [name for name, _, _ in profiler.trace]
+    assert 'ai' not in names
+    assert 'hud' in names and 'frame' in names
+
+def test_dump_chrome_trace(tmp_path):
+    profiler = FrameProfiler()
+    profiler.record('stage_draw', 1.0, 1.002)
+    profiler.record('gc gen0', 1.0, 1.001)
+    path = profiler.dump_chrome_trace(str(tmp_path / "trace.json"))
+    with open(path) as trace_file:
+        events = json.load(trace_file)['traceEvents']
+    draw, gc = events
+    assert draw['name'] == 'stage_draw' and draw['ph'] == 'X'
+    assert draw['ts'] == 1e6 and abs(draw['dur'] - 2000) < 1e-6
+    assert (draw['cat'], draw['tid']) == ('frame', 0)
+    assert (gc['cat'], gc['tid']) == ('gc', 1)
@@ -0,0 +1,89 @@
+from characters.player_controller import PlayerController
+from input.actions import Action
+from input.input_buffer import InputBuffer
+from states.fight_state import FightState
+
+def test_press_stays_buffered_for_its_window():
+    buffer = InputBuffer(size=8, windows={Action.PUNCH: 3})
+    slot = buffer.record(Action.NONE, Action.PUNCH)
+    for _ in range(3):
+        buffer.record(Action.NONE, Action.NONE)
+        assert buffer.find(Action.PUNCH) == slot
+    buffer.record(Action.NONE, Action.NONE)
+    assert buffer.find(Action.PUNCH) == -1
+
+def test_buffer_is_idle_only_after_its_longest_window():
+    buffer = InputBuffer(size=16, windows={Action.THROW: 12})
+    buffer.record(Action.NONE, Action.JUMP)
+    for _ in range(12):
+        buffer.record(Action.NONE, Action.NONE)
+        assert not buffer.idle()
+    buffer.record(Action.NONE, Action.NONE)
+    assert buffer.idle()
+
+class Busy:
+    """Character stand-in whose punch only comes out once it is ready"""
+
+    def __init__(self):
+        self.ready = False
+        self.punches = 0
+
+    def move(self, dx):
+        pass
+
+    def jump(self):
+        return False
+
+    def throw_item(self):
+        return False
+
+    def attack(self, kind):
+        if self.ready:
+            self.punches += 1
+        return self.ready
+
+def punch_after(ticks):
+    """Punches thrown when a press waits `ticks` idle ticks for the character"""
+    character = Busy()
+    controller = PlayerController(character, {Action.PUNCH: 8})
+    controller.handle_input(Action.NONE, Action.PUNCH)
+    controller.apply()
+    for tick in range(1, 12):
+        character.ready = tick >= ticks
+        controller.handle_input(Action.NONE, Action.NONE)
+        controller.apply()
+    return character.punches
+
+def test_buffered_press_fires_at_the_window_edges():
+    assert punch_after(1) == 1
+    assert punch_after(8) == 1  # Last tick of the window
+    assert punch_after(9) == 0  # One tick too late
+
+def test_consumed_press_fires_once_and_oldest_first():
+    buffer = InputBuffer(size=8)
+    first = buffer.record(Action.PUNCH, Action.PUNCH)
+    second = buffer.record(Action.PUNCH, Action.PUNCH | Action.KICK)
+    assert buffer.find(Action.PUNCH) == first
+    buffer.consume(first, Action.PUNCH)
+    assert buffer.find(Action.PUNCH) == second
+    assert buffer.find(Action.KICK) == second
+    assert buffer.age(first) == 1
+
+def test_ring_wraps_without_stale_presses():
+    buffer = InputBuffer(size=4, windows={Action.JUMP: 10})
+    buffer.record(Action.NONE, Action.JUMP)
+    for _ in range(4):
+        buffer.record(Action.NONE, Action.NONE)
+    assert buffer.find(Action.JUMP) == -1
+
+def test_punch_pressed_during_cooldown_comes_out_when_allowed():
+    fight = FightState('player', 'bren', ai_opponent=True, ai_difficulty='easy')
+    fight.p1.attack_cooldown = 5
+    fight.handle_input(Action.PUNCH, Action.PUNCH, Action.NONE)
+    fight.update()
+    assert not fight.p1.is_attacking
+
+    for _ in range(5):
+        fight.handle_input(Action.NONE, Action.NONE, Action.NONE)
+        fight.update()
+    assert fight.p1.is_attacking
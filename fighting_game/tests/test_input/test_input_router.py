@@ -0,0 +1,90 @@
+import pygame
+from input.actions import Action
+from input.input_router import InputRouter
+from ui.touch_controls import TouchControls
+
+WIDTH, HEIGHT = 1600, 1200
+
+def finger(event_type, rect, finger_id=1):
+    return pygame.event.Event(event_type, x=rect.centerx / WIDTH, y=rect.centery / HEIGHT,
+                              finger_id=finger_id, touch_id=0, dx=0, dy=0, pressure=1)
+
+def test_grid_matches_button_rects():
+    touch = TouchControls(WIDTH, HEIGHT)
+    for rect, bit in touch.buttons:
+        assert touch.hit_test(*rect.center) == bit
+    assert touch.hit_test(WIDTH // 2, HEIGHT // 2) == Action.NONE
+    assert touch.hit_test(-5, HEIGHT * 2) == Action.NONE
+
+def test_multi_finger_touch_mask():
+    touch = TouchControls(WIDTH, HEIGHT)
+    router = InputRouter(touch)
+    router.handle_event(finger(pygame.FINGERDOWN, touch.dpad_left, 1))
+    router.handle_event(finger(pygame.FINGERDOWN, touch.punch_rect, 2))
+    held, pressed, virtual_pressed = router.poll()[0]
+    assert held == Action.LEFT | Action.PUNCH
+    assert virtual_pressed == Action.LEFT | Action.PUNCH
+
+    # Sliding the thumb across the d-pad switches direction without a new press
+    router.handle_event(finger(pygame.FINGERMOTION, touch.dpad_right, 1))
+    router.handle_event(finger(pygame.FINGERUP, touch.punch_rect, 2))
+    held, pressed, _ = router.poll()[0]
+    assert held == Action.RIGHT
+    assert pressed == Action.RIGHT
+
+def test_tap_shorter_than_a_tick_is_latched():
+    router = InputRouter()
+    router.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_z))
+    router.handle_event(pygame.event.Event(pygame.KEYUP, key=pygame.K_z))
+    held, pressed, virtual_pressed = router.poll()[0]
+    assert held == Action.NONE
+    assert pressed == Action.PUNCH
+    assert virtual_pressed == Action.NONE  # Keyboard presses already reach handle_event
+    assert router.poll()[0][1] == Action.NONE
+
+def test_tap_outside_buttons_confirms():
+    touch = TouchControls(WIDTH, HEIGHT)
+    router = InputRouter(touch)
+    router.handle_event(finger(pygame.FINGERDOWN, pygame.Rect(WIDTH // 2, HEIGHT // 2, 0, 0)))
+    _, _, virtual_pressed = router.poll()[0]
+    assert virtual_pressed == Action.CONFIRM
+
+def key(event_type, key_code):
+    return pygame.event.Event(event_type, key=key_code)
+
+def test_keyboard_splits_between_two_players():
+    router = InputRouter()
+    router.handle_event(key(pygame.KEYDOWN, pygame.K_d))
+    router.handle_event(key(pygame.KEYDOWN, pygame.K_LEFT))
+    assert router.poll()[0][0] == Action.RIGHT | Action.LEFT  # Alone, player 1 owns every key
+
+    router.set_player_count(2)
+    router.handle_event(key(pygame.KEYDOWN, pygame.K_KP1))
+    p1, p2 = router.poll()
+    assert p1[0] == Action.RIGHT
+    assert p2[0] == Action.LEFT | Action.PUNCH
+    assert p2[1] == Action.PUNCH
+
+def test_gamepad_hot_plug_assigns_free_slots():
+    router = InputRouter()
+    assert router.add_gamepad(10) == 0
+    assert router.add_gamepad(11) == 1
+    router.handle_event(pygame.event.Event(pygame.JOYBUTTONDOWN, instance_id=11, button=2))
+    router.handle_event(pygame.event.Event(pygame.JOYHATMOTION, instance_id=10, hat=0, value=(-1, 0)))
+    p1, p2 = router.poll()
+    assert p1[0] == Action.LEFT and p1[2] == Action.LEFT
+    assert p2[0] == Action.PUNCH and p2[2] == Action.PUNCH
+
+    # Unplugging player 1's pad frees the slot for the next one
+    router.handle_event(pygame.event.Event(pygame.JOYDEVICEREMOVED, instance_id=10))
+    assert router.poll()[0][0] == Action.NONE
+    assert router.add_gamepad(12) == 0
+
+def test_vs_player_mode_drives_player_two():
+    from states.fight_state import FightState
+    fight = FightState(0, 1)
+    assert fight.player_count == 2
+    assert fight.opponents[0]['ai'] is None
+    fight.handle_input(Action.LEFT, Action.LEFT, Action.LEFT, player=1)
+    fight.update()
+    assert fight.p2.vel_x < 0
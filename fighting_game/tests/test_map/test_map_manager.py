@@ -0,0 +1,7 @@
+from map.map_manager import MapManager
+
+def test_default_sky_is_the_row_gradient():
+    stage = MapManager(1600, 1200, 0)
+    # Right of the clouds and mountains every row is plain sky
+    for y in range(stage.height):
+        assert stage.background.get_at((1500, y))[:3] == MapManager.sky_gradient(y)
@@ -0,0 +1,69 @@
+import pygame
+from render.particles import ParticleSystem
+from render.renderer import SoftwareRenderer
+from states.fight_state import FightState
+
+def test_expired_particles_are_culled_in_place():
+    particles = ParticleSystem(capacity=64, seed=1)
+    buffers = {id(particles.particles), id(particles.spare)}
+    particles.emit('trail', 100, 100, count=4)  # Lives 12 ticks
+    particles.emit('ko', 100, 100, count=10)  # Lives 40 ticks
+    for _ in range(12):
+        particles.update()
+    assert particles.count == 10
+    assert (particles.particles[:10, ParticleSystem.KIND] == ParticleSystem.KIND_INDEX['ko']).all()
+    assert {id(particles.particles), id(particles.spare)} == buffers  # Packed into the spare array
+
+    for _ in range(28):
+        particles.update()
+    assert particles.count == 0
+
+def test_sparks_fly_the_way_they_were_sent_and_fall():
+    particles = ParticleSystem(seed=2)
+    particles.emit('spark', 500, 500, direction=-1)
+    coasting_vy = particles.particles[:particles.count, ParticleSystem.VY] * 0.9  # Drag alone
+    particles.update()
+    live = particles.particles[:particles.count]
+    assert (live[:, ParticleSystem.X] < 500).all()
+    assert (live[:, ParticleSystem.VY] > coasting_vy).all()  # Gravity pulls them down
+
+def test_emissions_past_capacity_are_dropped():
+    particles = ParticleSystem(capacity=100, seed=3)
+    for _ in range(5):
+        particles.emit('ko', 0, 0)  # 48 each
+    assert particles.count == 100
+    assert particles.dropped == 140
+    assert particles.emit('spark', 0, 0) == 0
+
+def test_particles_draw_from_stamps():
+    surface = pygame.Surface((200, 200))
+    particles = ParticleSystem(seed=4)
+    particles.emit('trail', 100, 100, count=1)
+    particles.render(SoftwareRenderer(surface))
+    assert surface.get_at((100, 100))[:3] != (0, 0, 0)
+
+def test_low_quality_draws_half_the_particles():
+    particles = ParticleSystem(seed=5)
+    particles.emit('ko', 100, 100)
+    renderer = SoftwareRenderer(pygame.Surface((200, 200)))
+    drawn = []
+    renderer.blits = drawn.extend
+    particles.render(renderer)
+    renderer.effects = False
+    particles.render(renderer)
+    assert len(drawn) == particles.count + particles.count // 2
+
+def test_hits_and_kos_emit_particles():
+    fight = FightState('player', 'billy', is_campaign=True)
+    fighters = [fight.p1, fight.p2]
+    before = [(c.health, c.blockstun, len(c.thrown_items)) for c in fighters]
+    fight.p2.receive_hit(10, 12, 8, fight.p1)
+    fight.emit_particles(fighters, before)
+    assert fight.particles.count == ParticleSystem.KINDS[ParticleSystem.KIND_INDEX['spark']]['count']
+
+    fight.p2.health = 0
+    fight.emit_particles(fighters, before)
+    assert fight.particles.count > 2 * 12  # A second spark burst plus the KO burst
+    fight.reset_round()
+    assert fight.particles.count == 0
+    fight.exit()
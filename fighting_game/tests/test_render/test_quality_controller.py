@@ -0,0 +1,46 @@
+import pygame
+from render.quality_controller import QualityController
+from render.renderer import SoftwareRenderer
+from map.map_manager import MapManager
+
+def feed(controller, frame_ms, frames):
+    """Frames of a fixed cost; returns the level changes seen"""
+    changes = []
+    for _ in range(frames):
+        level = controller.record(frame_ms)
+        if level is not None:
+            changes.append(level)
+    return changes
+
+def test_steps_down_while_over_budget_then_holds():
+    controller = QualityController(window=30, cooldown=10, raise_after=100)
+    assert feed(controller, 12.0, 200) == []  # Between the thresholds: leave it alone
+    assert feed(controller, 20.0, 200) == [1, 2]
+    assert feed(controller, 20.0, 100) == []  # Nothing lower to go to
+
+def test_steps_up_only_after_a_long_fast_stretch():
+    controller = QualityController(window=30, cooldown=10, raise_after=100)
+    assert feed(controller, 20.0, 30) == [1]
+    assert feed(controller, 5.0, 99) == []
+    assert feed(controller, 5.0, 1) == [0]
+
+def test_failed_step_up_backs_off():
+    controller = QualityController(window=30, cooldown=10, raise_after=100)
+    feed(controller, 20.0, 30)
+    assert feed(controller, 5.0, 100) == [0]
+    assert feed(controller, 20.0, 40) == [1]  # The higher level could not hold
+    assert controller.raise_after == 200
+
+def test_a_single_hitch_does_not_change_quality():
+    controller = QualityController(window=30, cooldown=10)
+    assert feed(controller, 8.0, 100) == []
+    feed(controller, 200.0, 1)
+    assert feed(controller, 8.0, 30) == []
+
+def test_low_detail_stage_draws_a_flat_sky():
+    renderer = SoftwareRenderer(pygame.Surface((1600, 1200)))
+    stage = MapManager(1600, 1200, 0)
+    renderer.background = False
+    stage.render(renderer)
+    assert renderer.surface.get_at((5, 5))[:3] == stage.sky_color
+    assert renderer.surface.get_at((800, 5)) == renderer.surface.get_at((5, 500))
@@ -0,0 +1,63 @@
+import pygame
+import pytest
+from render.renderer import SoftwareRenderer
+from states.fight_state import FightState
+
+SIZE = (1600, 1200)
+
+@pytest.fixture
+def texture_renderer():
+    from pygame._sdl2.video import Window
+    from render.texture_renderer import TextureRenderer
+    window = Window("test", size=SIZE, hidden=True)
+    try:
+        renderer = TextureRenderer(window, accelerated=False)
+    except pygame.error:
+        pytest.skip("No SDL software renderer")
+    yield renderer
+    window.destroy()
+
+def draw_fight(renderer):
+    fight = FightState('player', 'billy', is_campaign=True)
+    fight.p2.facing_right = False
+    fight.round_state = 'round_over'  # Include the centred HUD message
+    fight.winner = 'P1'
+    renderer.clear((0, 0, 0))
+    fight.render(renderer)
+    fight.exit()
+
+def test_flipped_sprites_are_mirrored_once():
+    renderer = SoftwareRenderer(pygame.Surface((64, 64)))
+    image = pygame.Surface((4, 1))
+    image.fill((255, 0, 0))
+    image.set_at((0, 0), (0, 255, 0))
+    renderer.blit(image, (0, 0), flip_x=True)
+    renderer.blit(image, (0, 10), flip_x=True)
+    assert len(renderer.flipped) == 1
+    assert renderer.surface.get_at((3, 0)) == (0, 255, 0, 255)
+
+def test_texture_backend_matches_software(texture_renderer):
+    software = SoftwareRenderer(pygame.Surface(SIZE))
+    draw_fight(software)
+    draw_fight(texture_renderer)
+    composed = texture_renderer.sdl.to_surface()
+
+    # Sample a grid; text antialiasing and line ends may differ slightly
+    mismatches = 0
+    samples = 0
+    for x in range(0, SIZE[0], 37):
+        for y in range(0, SIZE[1], 29):
+            samples += 1
+            a = software.surface.get_at((x, y))
+            b = composed.get_at((x, y))
+            if max(abs(a[i] - b[i]) for i in range(3)) > 8:
+                mismatches += 1
+    assert mismatches / samples < 0.01
+
+def test_canvas_is_composed_in_draw_order(texture_renderer):
+    texture_renderer.clear((0, 0, 0))
+    texture_renderer.canvas().fill((255, 0, 0), (0, 0, 20, 20))
+    texture_renderer.fill_rect((0, 0, 255), (10, 10, 20, 20))  # Drawn after, so on top
+    composed = texture_renderer.sdl.to_surface()
+    assert composed.get_at((5, 5))[:3] == (255, 0, 0)
+    assert composed.get_at((15, 15))[:3] == (0, 0, 255)
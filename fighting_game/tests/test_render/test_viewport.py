@@ -0,0 +1,45 @@
+import pygame
+from render.renderer import SoftwareRenderer
+from render.viewport import Viewport
+from characters.character import Character
+
+def test_letterbox_and_integer_scaling():
+    viewport = Viewport((1920, 1080))
+    assert viewport.rect == pygame.Rect(240, 0, 1440, 1080)
+
+    viewport = Viewport((1920, 1080), internal_size=(800, 600), integer_scaling=True)
+    assert viewport.rect == pygame.Rect(560, 240, 800, 600)  # 1.8x rounds down to 1x
+    viewport.set_display_size((2560, 1440))
+    assert viewport.rect == pygame.Rect(480, 120, 1600, 1200)
+
+def test_touches_map_through_the_letterbox():
+    viewport = Viewport((1920, 1080))
+    assert viewport.to_logical(0.5, 0.5) == (800, 600)
+    x, y = viewport.to_logical(240 / 1920, 1.0)
+    assert (round(x), round(y)) == (0, 1200)
+
+def test_parse_size_keeps_the_logical_aspect():
+    assert Viewport.parse_size('800') == (800, 600)
+    assert Viewport.parse_size('960x540') == (960, 540)
+
+def test_reduced_internal_resolution_draws_in_logical_coordinates():
+    renderer = SoftwareRenderer(pygame.Surface((800, 600)), Viewport.LOGICAL_SIZE)
+    renderer.clear((0, 0, 0))
+    renderer.fill_rect((255, 0, 0), (800, 600, 100, 100))
+    sprite = pygame.Surface((40, 40))
+    sprite.fill((0, 255, 0))
+    renderer.blit(sprite, (0, 0))
+    renderer.canvas().fill((0, 0, 255), (1500, 1100, 100, 100))
+    renderer.flush_canvas()
+    assert renderer.surface.get_at((425, 325))[:3] == (255, 0, 0)
+    assert renderer.surface.get_at((19, 19))[:3] == (0, 255, 0)
+    assert renderer.surface.get_at((20, 20))[:3] == (0, 0, 0)
+    assert renderer.surface.get_at((790, 590))[:3] == (0, 0, 255)
+
+def test_arena_bounds_do_not_depend_on_the_display():
+    pygame.display.set_mode((640, 480))
+    try:
+        fighter = Character(400, 1000)
+        assert (fighter.SCREEN_WIDTH, fighter.GROUND_Y) == (1600, 1050)
+    finally:
+        pygame.display.set_mode(Viewport.LOGICAL_SIZE)
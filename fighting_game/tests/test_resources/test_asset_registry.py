@@ -0,0 +1,31 @@
+import json
+import os
+from resources.asset_registry import AssetRegistry
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'assets')
+
+def test_manifest_matches_assets_tree():
+    with open(os.path.join(ASSETS_DIR, AssetRegistry.MANIFEST)) as manifest_file:
+        manifest = json.load(manifest_file)['files']
+    scanned = AssetRegistry.scan(ASSETS_DIR)
+    assert sorted(manifest) == sorted(scanned), "Run tools/build_asset_manifest.py"
+    for relative, entry in scanned.items():
+        assert manifest[relative]['size'] == entry['size']
+
+def test_every_logical_asset_resolves():
+    registry = AssetRegistry(ASSETS_DIR)
+    assert registry.source == 'manifest'
+    assert registry.missing() == []
+    assert registry.path('character', 'ciaran').endswith('final_boss.png')
+    assert registry.path('character', 'nobody') is None
+    assert registry.find('images/win/fight_0.png') is None
+
+def test_scan_without_manifest(tmp_path):
+    (tmp_path / 'sounds').mkdir()
+    (tmp_path / 'sounds' / 'stage_1.mid').write_bytes(b'MThd')
+    registry = AssetRegistry(str(tmp_path))
+    assert registry.source == 'scan'
+    assert registry.path('music', 'default') == os.path.join(str(tmp_path), 'sounds/stage_1.mid')
+    info = registry.info('music', 'bren')
+    assert info['size'] == 4 and len(info['sha1']) == 40
+    assert ('character', 'bren', 'images/faces/bren_char.png') in registry.missing()
@@ -0,0 +1,60 @@
+import os
+import pygame
+from resources.asset_registry import AssetRegistry
+from resources.showcase_loader import ShowcaseLoader
+
+def make_registry(tmp_path, preview=True):
+    """A registry holding one large win picture, with or without its manifest preview"""
+    (tmp_path / 'images' / 'win').mkdir(parents=True)
+    picture = pygame.Surface((400, 800))
+    picture.fill((200, 40, 40))
+    path = str(tmp_path / 'images' / 'win' / 'mc_win.png')
+    pygame.image.save(picture, path)
+    registry = AssetRegistry(str(tmp_path))
+    if preview:
+        registry.files['images/win/mc_win.png']['preview'] = ShowcaseLoader.make_preview(path)
+    return registry
+
+def test_placeholder_now_full_picture_after_decode(tmp_path):
+    loader = ShowcaseLoader(make_registry(tmp_path))
+    delivered = []
+    placeholder = loader.request('win', 'player', (112, 225), delivered.append)
+    assert placeholder.get_size() == (112, 225)
+    red, green, blue = placeholder.get_at((56, 112))[:3]
+    assert abs(red - 200) <= 4 and abs(green - 40) <= 4 and abs(blue - 40) <= 4  # Filtering rounds a little
+
+    assert loader.wait() == 1
+    assert delivered[0].get_size() == (112, 225)  # Only the displayed size is kept
+    assert delivered[0] is not placeholder
+
+def test_each_picture_is_decoded_once(tmp_path):
+    loads = []
+    loader = ShowcaseLoader(make_registry(tmp_path), loader=lambda path: loads.append(path) or pygame.image.load(path))
+    first, second = [], []
+    loader.request('win', 0, (112, 225), first.append)
+    loader.request('win', 'player', (112, 225), second.append)  # Same file, same size
+    assert loader.wait() == 2
+    assert len(loads) == 1 and first[0] is second[0]
+    assert loader.request('win', 'player', (112, 225), second.append) is first[0]
+    assert loader.wait() == 0 and len(loads) == 1
+
+def test_fallback_without_preview(tmp_path):
+    loader = ShowcaseLoader(make_registry(tmp_path, preview=False))
+    fallback = pygame.Surface((112, 225))
+    delivered = []
+    assert loader.request('win', 'player', (112, 225), delivered.append, fallback) is fallback
+    loader.wait()
+    assert len(delivered) == 1
+
+def test_missing_picture_is_never_queued(tmp_path):
+    loader = ShowcaseLoader(AssetRegistry(str(tmp_path)))
+    fallback = pygame.Surface((112, 225))
+    assert loader.request('win', 'player', (112, 225), print, fallback) is fallback
+    assert loader.thread is None
+    assert loader.wait() == 0
+
+def test_manifest_has_previews_for_showcase_pictures():
+    registry = AssetRegistry.get()
+    for relative in ('images/win/mc_win.png', 'images/lose/mc_lose.png'):
+        assert os.path.exists(os.path.join(registry.root, relative))
+        assert registry.files[relative]['preview']['size'][0] == ShowcaseLoader.PREVIEW_WIDTH
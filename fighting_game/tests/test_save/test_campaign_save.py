@@ -0,0 +1,75 @@
+import os
+import json
+from save.campaign_save import CampaignSave
+
+def test_progress_survives_a_restart(tmp_path):
+    path = str(tmp_path / "campaign.jsonl")
+    save = CampaignSave(path)
+    save.defeat('bren')
+    save.defeat('billy')
+    save.shutdown()
+
+    with open(path) as save_file:
+        lines = save_file.read().splitlines()
+    assert json.loads(lines[0])['version'] == CampaignSave.VERSION
+    assert len(lines) == 3  # Header, snapshot of the first write, then one appended record
+
+    assert CampaignSave(path).completed_bosses == ['bren', 'billy']
+
+def test_torn_last_line_is_ignored_and_compacted_away(tmp_path):
+    path = str(tmp_path / "campaign.jsonl")
+    save = CampaignSave(path)
+    save.defeat('bren')
+    save.shutdown()
+    with open(path, 'a') as save_file:
+        save_file.write('{"op":"defeat","bo')  # Power cut mid-write
+
+    save = CampaignSave(path)
+    assert save.completed_bosses == ['bren']
+    save.defeat('billy')
+    save.shutdown()
+    assert CampaignSave(path).completed_bosses == ['bren', 'billy']
+
+def test_journal_is_compacted(tmp_path):
+    path = str(tmp_path / "campaign.jsonl")
+    save = CampaignSave(path)
+    for _ in range(CampaignSave.COMPACT_AFTER + 1):
+        save.reset()
+    save.defeat('niall')
+    save.flush()
+    with open(path) as save_file:
+        assert len(save_file.read().splitlines()) < CampaignSave.COMPACT_AFTER
+    save.complete()
+    save.shutdown()
+
+    loaded = CampaignSave(path)
+    assert (loaded.completed_bosses, loaded.campaigns_won) == ([], 1)
+
+def test_unknown_version_starts_fresh(tmp_path):
+    path = tmp_path / "campaign.jsonl"
+    path.write_text('{"version": 99}\n{"op":"defeat","boss":"bren"}\n')
+    assert CampaignSave(str(path)).completed_bosses == []
+
+def test_failed_rewrite_is_retried_instead_of_appending(tmp_path, monkeypatch):
+    path = str(tmp_path / "campaign.jsonl")
+    replace = os.replace
+    failures = []
+
+    def full_card(source, target):
+        if len(failures) < 2:
+            failures.append(target)
+            raise OSError("No space left on device")
+        replace(source, target)
+
+    monkeypatch.setattr(os, 'replace', full_card)
+    save = CampaignSave(path)
+    save.defeat('bren')
+    save.defeat('billy')
+    save.flush()
+    assert not save.journal_ok
+    assert not os.path.exists(path)  # No journal without a header
+
+    save.defeat('niall')
+    save.shutdown()
+    assert save.journal_ok
+    assert CampaignSave(path).completed_bosses == ['bren', 'billy', 'niall']
@@ -0,0 +1,67 @@
+import threading
+import time
+import pytest
+from sound.audio_engine import AudioEngine
+
+@pytest.fixture
+def engine():
+    engine = AudioEngine.get()
+    if not engine.available:
+        pytest.skip("No audio device")
+    yield engine
+    engine.stop_music()
+    for channel in engine.channels:
+        channel.stop()
+
+def test_final_battle_music(engine):
+    assert engine.assets.path('music', 99).endswith('stage_5.mid')
+
+def test_same_track_is_a_no_op(engine):
+    path = engine.assets.path('music', 'billy')
+    engine.current_music = path
+    generation = engine.worker.generation
+    engine.play_music(path)
+    assert engine.worker.generation == generation  # Nothing queued
+    assert engine.current_music == path
+
+def test_full_pool_steals_lowest_priority_oldest_voice(engine):
+    for _ in range(engine.SFX_CHANNELS):
+        engine.play_effect('block')
+    if not all(channel.get_busy() for channel in engine.channels):
+        pytest.skip("Audio driver does not keep channels busy")
+    engine.channel_started[3] = -1  # Make voice 3 the oldest
+    assert engine.play_effect('hit') == 3
+    assert engine.channel_priority[3] == AudioEngine.EFFECTS['hit']
+
+    # A low priority effect never cuts off a more important one
+    for i in range(engine.SFX_CHANNELS):
+        engine.channel_priority[i] = AudioEngine.EFFECTS['ko']
+    assert engine.play_effect('throw') is None
+
+def test_slow_music_load_does_not_stall_frames():
+    engine = AudioEngine(music_loader=lambda path: time.sleep(0.25))
+    if not engine.available:
+        pytest.skip("No audio device")
+    loaded = []
+    main_thread = threading.get_ident()
+
+    frame_times = []
+    for frame in range(30):
+        start = time.perf_counter()
+        if frame == 0:
+            engine.play_music(engine.assets.path('music', 'niall'),
+                              on_loaded=lambda ok: loaded.append(threading.get_ident()))
+        if frame == 5:
+            engine.play_music(engine.assets.path('music', 'niall'))  # Already on its way
+        engine.update()
+        frame_times.append(time.perf_counter() - start)
+        time.sleep(1 / 60)
+
+    # Every frame stays far under its budget while the loader takes 250ms
+    assert max(frame_times) < 0.005
+    deadline = time.perf_counter() + 2
+    while not loaded and time.perf_counter() < deadline:
+        engine.update()
+        time.sleep(0.01)
+    assert loaded == [main_thread]  # Callbacks come back on the game loop's thread
+    engine.shutdown()
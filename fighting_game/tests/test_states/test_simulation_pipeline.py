@@ -0,0 +1,69 @@
+import threading
+import pygame
+import pytest
+from render.renderer import SoftwareRenderer
+from states.game_state import GameState, Transition
+from states.fight_state import FightState
+from states.simulation_pipeline import SimulationPipeline
+
+class Counter(GameState):
+    """Counts ticks and remembers which thread ran them"""
+    pipelined = True
+
+    def __init__(self, fail_at=None):
+        self.ticks = 0
+        self.threads = set()
+        self.fail_at = fail_at
+
+    def update(self):
+        self.ticks += 1
+        self.threads.add(threading.current_thread().name)
+        if self.ticks == self.fail_at:
+            raise RuntimeError("tick failed")
+        return Transition.pop() if self.ticks == 3 else None
+
+    def snapshot(self):
+        return self.ticks
+
+@pytest.fixture
+def pipeline():
+    pipeline = SimulationPipeline()
+    yield pipeline
+    pipeline.shutdown()
+
+def test_draws_the_previous_tick_while_the_next_runs(pipeline):
+    state = Counter()
+    drawn, transitions = [], []
+    for _ in range(3):
+        drawn.append(pipeline.front(state))
+        pipeline.start(state)
+        transitions.append(pipeline.finish())
+    assert drawn == [0, 1, 2]
+    assert transitions[:2] == [None, None] and transitions[2].op == Transition.POP
+    assert state.threads == {'simulation'}
+
+def test_update_errors_reach_the_main_thread(pipeline):
+    state = Counter(fail_at=2)
+    pipeline.start(state)
+    pipeline.finish()
+    pipeline.start(state)
+    with pytest.raises(RuntimeError):
+        pipeline.finish()
+    assert pipeline.front(state) == 1
+
+def test_fight_snapshot_is_unchanged_by_later_ticks():
+    fight = FightState(0, 'bren', ai_opponent=True)
+    fight.particles.emit('ko', 800, 800)
+    snapshot = fight.snapshot()
+
+    def draw():
+        canvas = pygame.Surface((1600, 1200))
+        fight.render_snapshot(SoftwareRenderer(canvas), snapshot)
+        return pygame.image.tobytes(canvas, 'RGB')
+
+    before = draw()
+    fight.p1.x += 200
+    fight.p2.health -= 50
+    for _ in range(10):
+        fight.update()
+    assert draw() == before
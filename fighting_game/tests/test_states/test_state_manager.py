@@ -0,0 +1,112 @@
+import pygame
+from states.game_state import GameState, Transition
+from states.state_manager import StateManager
+from states.campaign_state import CampaignState
+from states.fight_state import FightState
+from states.prize_state import PrizeState
+from states.menu_state import MenuState
+
+class Recorder(GameState):
+    def __init__(self, log):
+        self.log = log
+
+    def enter(self, **kwargs):
+        self.log.append(('enter', type(self).__name__, kwargs))
+
+    def exit(self):
+        self.log.append(('exit', type(self).__name__))
+
+    def suspend(self):
+        self.log.append(('suspend', type(self).__name__))
+
+    def resume(self, result=None):
+        self.log.append(('resume', type(self).__name__, result))
+
+class Root(Recorder):
+    pass
+
+class Child(Recorder):
+    pass
+
+def press(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0)
+
+def test_lifecycle_order():
+    log = []
+    states = StateManager()
+    states.push(Root(log))
+    states.apply(Transition.push(Child(log), level=2))
+    states.apply(Transition.pop('win'))
+    assert log == [
+        ('enter', 'Root', {}),
+        ('suspend', 'Root'),
+        ('enter', 'Child', {'level': 2}),
+        ('exit', 'Child'),
+        ('resume', 'Root', 'win'),
+    ]
+
+    states.shutdown()
+    assert log[-1] == ('exit', 'Root')
+    assert states.current is None
+
+def test_state_classes_resolve_to_pooled_instances(campaign_save):
+    states = StateManager()
+    first = states.push(CampaignState)
+    first.current_boss = 'niall'
+    states.pop()
+    campaign_save.defeat('bren')
+    second = states.push(CampaignState)
+    assert second is first
+    assert second.current_boss == 'billy'  # enter() picks up the saved progress
+
+def test_campaign_fight_win_leads_to_prize_then_next_boss():
+    states = StateManager()
+    campaign = states.push(CampaignState)
+    states.apply(campaign.handle_event(press(pygame.K_RETURN)))
+    fight = states.current
+    assert isinstance(fight, FightState)
+
+    # Win the match and let the round end pause run out
+    fight.p1_rounds_won = 2
+    fight.winner = 'P1'
+    fight.round_end_timer = 0
+    states.apply(fight.advance_round())
+    assert states.current is campaign
+    assert campaign.state == 'win'
+    assert campaign.save.completed_bosses == ['bren']  # Saved before the prize screen
+
+    states.apply(campaign.handle_event(press(pygame.K_RETURN)))
+    prize = states.current
+    assert isinstance(prize, PrizeState)
+    prize.state = 'complete'
+    states.apply(prize.handle_event(press(pygame.K_RETURN)))
+    assert states.current is campaign
+    assert (campaign.state, campaign.current_boss) == ('select', 'billy')
+    assert campaign.completed_bosses == ['bren']
+
+def test_next_round_resets_fighters():
+    fight = FightState('player', 'billy', is_campaign=True)
+    fight.p1.health = 10
+    fight.p1.x = 900
+    fight.p2.health = 0
+    fight.check_round_end()
+    fight.round_end_timer = 0
+    assert fight.advance_round() is None
+    assert fight.round_number == 2
+    assert fight.round_state == 'fighting'
+    assert (fight.p1.health, fight.p1.x) == (200, 400)
+    assert fight.p2.health == fight.p2.max_health > 200
+    fight.exit()
+
+def test_static_screens_let_the_loop_sleep():
+    states = StateManager()
+    menu = states.push(MenuState)
+    assert not menu.is_animating()
+    assert not states.push(CampaignState).is_animating()
+
+    prize = PrizeState(1)
+    assert prize.is_animating()
+    prize.player.skip()
+    prize.update()
+    assert prize.state == 'complete'
+    assert not prize.is_animating()  # Waiting on ENTER only
@@ -0,0 +1,46 @@
+import pygame
+import pytest
+from resources.asset_registry import AssetRegistry
+from states.prize_state import PrizeState
+from ui.clips import Clip, ClipLibrary, ClipPlayer, TICK_MS
+
+def frames(count):
+    return [pygame.Surface((1, 1)) for _ in range(count)]
+
+def test_frames_are_picked_by_elapsed_time():
+    a, b, c = frames(3)
+    player = ClipPlayer(Clip('test', [a, b, c], frame_ms=100, duration_ms=500))
+    assert player.frame is a
+    player.update(150)
+    assert player.frame is b
+    player.update(200)
+    assert player.frame is c and not player.finished  # The last frame holds
+    player.update(150)
+    assert player.finished
+
+    looping = ClipPlayer(Clip('loop', [a, b], frame_ms=100, loop=True))
+    looping.update(250)
+    assert looping.frame is a
+
+def test_clips_are_built_once_and_shared():
+    library = ClipLibrary()
+    assert library.clip('whiskey_pour') is library.clip('whiskey_pour')
+    assert PrizeState(4).player.clip is PrizeState(4).player.clip
+
+def test_missing_prize_image_falls_back_to_the_chest(monkeypatch):
+    monkeypatch.setattr(ClipLibrary, '_instance', ClipLibrary())
+    monkeypatch.setattr(AssetRegistry.get(), 'path', lambda kind, key: None)
+    prize = PrizeState(2)
+    assert prize.player.clip.name == 'prize_chest'
+    assert prize.animation_text == "You found a treasure chest!"
+
+def test_whiskey_prize_keeps_its_timing():
+    prize = PrizeState(4)
+    ticks = 0
+    while prize.state == 'running':
+        prize.update()
+        ticks += 1
+    # Five frame steps of 10 ticks, then 3 seconds on the full glass
+    assert ticks == 50 + 180
+    assert prize.player.elapsed_ms == pytest.approx(ticks * TICK_MS)  # One simulation tick per update
+    assert prize.player.frame is prize.player.clip.frames[-1]
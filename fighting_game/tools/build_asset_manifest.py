@@ -0,0 +1,43 @@
+"""Index the assets tree into assets/manifest.json and check every logical asset ID resolves.
+
+Usage (from the fighting_game directory):
+    python tools/build_asset_manifest.py           # write the manifest, exit non-zero on missing assets
+    python tools/build_asset_manifest.py --check   # only report missing assets
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from resources.asset_registry import AssetRegistry
+from resources.showcase_loader import ShowcaseLoader
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--root', default=ASSETS_DIR, help='Assets directory to index')
+    parser.add_argument('--check', action='store_true', help='Do not write the manifest')
+    args = parser.parse_args()
+
+    files = AssetRegistry.scan(args.root, with_hashes=True)
+    if not args.check:
+        # Tiny previews let the win/lose pictures show something while they decode
+        for relative, entry in files.items():
+            if relative.startswith(ShowcaseLoader.SHOWCASE_DIRS) and relative.endswith('.png'):
+                entry['preview'] = ShowcaseLoader.make_preview(os.path.join(args.root, relative))
+        manifest_path = os.path.join(args.root, AssetRegistry.MANIFEST)
+        with open(manifest_path, 'w') as manifest_file:
+            json.dump({'files': files}, manifest_file, indent=2, sort_keys=True)
+        print(f"Indexed {len(files)} assets into: {manifest_path}")
+
+    registry = AssetRegistry(args.root)
+    missing = registry.missing()
+    for kind, key, relative in missing:
+        print(f"MISSING {kind}/{key}: {relative}")
+    return 1 if missing else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
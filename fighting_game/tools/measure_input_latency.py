@@ -0,0 +1,106 @@
+"""Measure input-to-photon latency of player 1 attacks in a headless fight.
+
+Each trial posts a punch key press at a random point inside a frame, then
+counts frames until the first display flip that shows the attack.
+
+Usage (from the fighting_game directory):
+    python tools/measure_input_latency.py --trials 30
+    python tools/measure_input_latency.py --during-cooldown   # press before the previous attack has recovered
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import pygame
+from debug.frame_profiler import FrameProfiler
+
+FRAME_MS = 1000 / 60
+MENU_KEYS = (pygame.K_DOWN, pygame.K_RETURN, pygame.K_RETURN)  # Main menu -> first campaign fight
+MAX_FRAMES = 30  # Give up on a trial after half a second
+
+def post_key(key, event_type=pygame.KEYDOWN):
+    pygame.event.post(pygame.event.Event(event_type, key=key, mod=0, unicode='', scancode=0))
+
+def frame(game):
+    """One iteration of Game.run; returns the time of the flip"""
+    game.clock.tick(60)
+    game.profiler.begin_frame()
+    game.handle_events()
+    game.update()
+    game.draw()
+    return time.perf_counter()
+
+def start_fight(game):
+    for key in MENU_KEYS:
+        post_key(key)
+        for _ in range(3):
+            frame(game)
+    return game.current_state.p1
+
+def run_trial(game, p1, during_cooldown):
+    """Press punch once and return (frames, ms) until the attack is on screen, or None"""
+    # Wait until the previous attack is over, or only partly over when testing the buffer
+    while p1.is_attacking or p1.attack_cooldown > (12 if during_cooldown else 0) or p1.is_stunned:
+        frame(game)
+
+    # Land the press somewhere inside the next frame, like a real button would
+    time.sleep(random.uniform(0, FRAME_MS) / 1000)
+    pressed_at = time.perf_counter()
+    post_key(pygame.K_z)
+    post_key(pygame.K_z, pygame.KEYUP)
+
+    for frames in range(1, MAX_FRAMES + 1):
+        flipped_at = frame(game)
+        if p1.is_attacking and p1.move_executor.frame == 0:
+            return frames, (flipped_at - pressed_at) * 1000
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--trials', type=int, default=20)
+    parser.add_argument('--during-cooldown', action='store_true',
+                        help='Press while the previous attack is still recovering')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from main import Game
+        game = Game()
+        FrameProfiler.get().set_enabled(False)
+        p1 = start_fight(game)
+
+    samples = []
+    missed = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(args.trials):
+            if type(game.current_state).__name__ != 'FightState' or game.current_state.round_state != 'fighting':
+                break
+            result = run_trial(game, p1, args.during_cooldown)
+            if result is None:
+                missed += 1
+            else:
+                samples.append(result)
+
+    if not samples:
+        print("No attacks registered")
+        return 1
+    frames = sorted(sample[0] for sample in samples)
+    millis = sorted(sample[1] for sample in samples)
+    p95 = lambda values: values[min(len(values) - 1, int(round(0.95 * (len(values) - 1))))]
+    print(f"trials {len(samples)}  missed {missed}")
+    print(f"frames  median {statistics.median(frames):.1f}  p95 {p95(frames)}  max {frames[-1]}")
+    print(f"ms      median {statistics.median(millis):.1f}  p95 {p95(millis):.1f}  max {millis[-1]:.1f}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
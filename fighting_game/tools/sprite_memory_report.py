@@ -0,0 +1,45 @@
+"""Report the pixel memory held by each character's animation frames.
+
+"Before" counts every frame as its own surface with its effects baked in,
+held once per fighter; "after" counts each shared surface and overlay
+stamp once per character, however many fighters use it.
+
+Usage (from the fighting_game directory):
+    python tools/sprite_memory_report.py
+"""
+import contextlib
+import io
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import pygame
+from characters.sprite_manager import SpriteManager
+
+CHARACTER_IDS = (0, 'player', 'bren', 'billy', 'niall', 'ciaran', 'lee')
+FINAL_BATTLE = ('player', 'niall', 'billy', 'ciaran')
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    usage = {}
+    for char_id in CHARACTER_IDS:
+        with contextlib.redirect_stdout(io.StringIO()):  # Silence the loaders' debug prints
+            usage[char_id] = SpriteManager(char_id).memory_usage()
+
+    print(f"{'character':<10}{'frames':>8}{'surfaces':>10}{'before KB':>12}{'after KB':>11}")
+    for char_id, entry in usage.items():
+        print(f"{str(char_id):<10}{entry['frames']:>8}{entry['surfaces']:>10}"
+              f"{entry['unshared_bytes'] / 1024:>12.1f}{entry['bytes'] / 1024:>11.1f}")
+
+    before = sum(usage[char_id]['unshared_bytes'] for char_id in FINAL_BATTLE)
+    after = sum(usage[char_id]['bytes'] for char_id in FINAL_BATTLE)
+    print(f"\nFinal battle ({', '.join(FINAL_BATTLE)}): {before / 1024:.1f} KB before, {after / 1024:.1f} KB after")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Report cold-start time to the first menu frame and the slowest imports on the way.
+
+Runs the game headless under `python -X importtime` and quits once the menu is up.
+
+Usage (from the fighting_game directory):
+    python tools/startup_report.py --top 15
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def parse_importtime(stderr):
+    """(cumulative_us, self_us, module) for each -X importtime line"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        imports.append((int(cumulative_us), int(self_us), module.rstrip()))
+    return imports
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--top', type=int, default=15, help='Number of slowest imports to list')
+    args = parser.parse_args()
+
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', os.path.join('src', 'main.py'), '--startup-report', '--quit-after-startup'],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        return result.returncode
+
+    report = result.stdout.splitlines()
+    start = next((i for i, line in enumerate(report) if line.startswith('Startup timing')), len(report))
+    print("\n".join(report[start:]))
+
+    imports = parse_importtime(result.stderr)
+    print(f"\nSlowest imports (cumulative, {len(imports)} modules):")
+    for cumulative_us, self_us, module in sorted(imports, reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  self {self_us / 1000:6.1f} ms  {module}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Train the boss AI policy from headless AI-vs-AI matches.
+
+Usage (from the fighting_game directory):
+    python tools/train_policy.py --matches 60 --output assets/policies/boss_policy.npz
+"""
+import argparse
+import os
+import random
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import numpy as np
+import pygame
+from characters.ai_controller import AIController
+from characters.character import Character
+from characters.fight_simulator import FightSimulator
+from characters.policy_ai import Policy
+
+ROUND_FRAMES = 99 * 60
+DECISION_FRAMES = 6     # Frames each exploratory action is held for
+RETURN_FRAMES = 60      # Frames of reward credited to each decision
+OPPONENTS = ('easy', 'medium', 'hard', 'extreme')
+
+def to_macro(actions, ai_char, target_char):
+    """Map an AIController action dict onto a macro action name"""
+    if actions['attack']:
+        return actions['attack']
+    if actions['jump']:
+        return 'jump'
+    if actions['move']:
+        toward = -1 if ai_char.x > target_char.x else 1
+        return 'advance' if actions['move'] == toward else 'retreat'
+    return 'hold'
+
+def play_match(teacher, opponent, epsilon):
+    """Play one headless round and return (features, action index, return) samples"""
+    player = Character(400, 1000, char_id=0, facing_right=True)
+    learner = Character(1200, 1000, char_id=1, facing_right=False)
+    sim = FightSimulator(player, [learner])
+    actions_list = AIController.MACRO_ACTIONS
+
+    decisions = []   # (frame, features, action index)
+    rewards = np.zeros(ROUND_FRAMES, dtype=np.float32)
+    macro = 'hold'
+    for frame in range(ROUND_FRAMES):
+        if frame % DECISION_FRAMES == 0:
+            # Explore around the teacher's behaviour
+            if random.random() < epsilon:
+                macro = random.choice(actions_list)
+            else:
+                macro = to_macro(teacher.decide_action(learner, player), learner, player)
+            decisions.append((frame, Policy.features(learner, player), actions_list.index(macro)))
+
+        learner_actions = AIController.macro_action(macro, learner, player)
+        player_actions = opponent.decide_action(player, learner)
+        learner_health = learner.health
+        player_health = player.health
+        sim.step(player_actions, [learner_actions])
+        rewards[frame] = (player_health - player.health) - (learner_health - learner.health)
+
+        if player.health <= 0 or learner.health <= 0:
+            break
+
+    cumulative = np.concatenate(([0.0], np.cumsum(rewards)))
+    samples = []
+    for frame, features, action in decisions:
+        end = min(frame + RETURN_FRAMES, ROUND_FRAMES)
+        samples.append((features, action, cumulative[end] - cumulative[frame]))
+    return samples
+
+def fit(features, actions, returns, hidden=24, epochs=2000, learning_rate=0.5, seed=0):
+    """Fit Q(features, action) with a one-hidden-layer MLP using plain NumPy"""
+    rng = np.random.default_rng(seed)
+    n_features = features.shape[1]
+    n_actions = len(AIController.MACRO_ACTIONS)
+    w1 = rng.normal(0, 0.5, (n_features, hidden)).astype(np.float32)
+    b1 = np.zeros(hidden, dtype=np.float32)
+    w2 = rng.normal(0, 0.1, (hidden, n_actions)).astype(np.float32)
+    b2 = np.zeros(n_actions, dtype=np.float32)
+
+    scale = max(float(np.abs(returns).max()), 1.0)
+    targets = returns / scale
+    rows = np.arange(len(actions))
+    for epoch in range(epochs):
+        hidden_pre = features @ w1 + b1
+        hidden_out = np.maximum(hidden_pre, 0.0)
+        predicted = hidden_out @ w2 + b2
+
+        # Only the action that was actually taken has a target
+        error = np.zeros_like(predicted)
+        error[rows, actions] = predicted[rows, actions] - targets
+        error /= len(actions)
+
+        grad_w2 = hidden_out.T @ error
+        grad_b2 = error.sum(axis=0)
+        grad_hidden = (error @ w2.T) * (hidden_pre > 0)
+        grad_w1 = features.T @ grad_hidden
+        grad_b1 = grad_hidden.sum(axis=0)
+
+        w1 -= learning_rate * grad_w1
+        b1 -= learning_rate * grad_b1
+        w2 -= learning_rate * grad_w2
+        b2 -= learning_rate * grad_b2
+
+        if epoch % 250 == 0:
+            loss = float(((predicted[rows, actions] - targets) ** 2).mean())
+            print(f"epoch {epoch}: loss {loss:.4f}")
+
+    return Policy(w1, b1, w2 * scale, b2 * scale)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--matches', type=int, default=60, help='Matches per opponent difficulty')
+    parser.add_argument('--epsilon', type=float, default=0.3, help='Exploration rate')
+    parser.add_argument('--teacher', default='extreme', help='AIController difficulty to explore around')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=os.path.join('assets', 'policies', 'boss_policy.npz'))
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    pygame.display.init()
+    pygame.display.set_mode((1600, 1200))
+
+    samples = []
+    for difficulty in OPPONENTS:
+        for match in range(args.matches):
+            samples += play_match(AIController(args.teacher), AIController(difficulty), args.epsilon)
+        print(f"Collected {len(samples)} samples after {difficulty} matches")
+
+    features = np.array([s[0] for s in samples], dtype=np.float32)
+    actions = np.array([s[1] for s in samples], dtype=np.int64)
+    returns = np.array([s[2] for s in samples], dtype=np.float32)
+    policy = fit(features, actions, returns, seed=args.seed)
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    policy.save(args.output)
+    print(f"Saved policy to {args.output}")
+
+if __name__ == '__main__':
+    main()